@@ -0,0 +1,33 @@
+# Generated by Django 6.0 on 2026-10-18 04:58
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('about', '0003_add_initial_about_data'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='ourstory',
+            name='rendered_content',
+            field=models.TextField(blank=True, editable=False, help_text='Content with absolute image URLs, rendered on save'),
+        ),
+        migrations.AddField(
+            model_name='ourstory',
+            name='rendered_media_base',
+            field=models.CharField(blank=True, editable=False, max_length=255),
+        ),
+        migrations.AddField(
+            model_name='whoweare',
+            name='rendered_content',
+            field=models.TextField(blank=True, editable=False, help_text='Content with absolute image URLs, rendered on save'),
+        ),
+        migrations.AddField(
+            model_name='whoweare',
+            name='rendered_media_base',
+            field=models.CharField(blank=True, editable=False, max_length=255),
+        ),
+    ]
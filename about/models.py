@@ -1,5 +1,6 @@
 from django.db import models
 from ckeditor.fields import RichTextField
+from main.rendering import RenderedHTMLMixin
 
 
 class Objective(models.Model):
@@ -54,12 +55,14 @@ class TeamMember(models.Model):
         return f"{self.name} - {self.title}"
 
 
-class WhoWeAre(models.Model):
+class WhoWeAre(RenderedHTMLMixin, models.Model):
     """
     Model for "Who We Are" section content
     """
     title = models.CharField(max_length=200, default="Who We Are")
     content = RichTextField(help_text="Content for the Who We Are section")
+    rendered_content = models.TextField(blank=True, editable=False, help_text="Content with absolute image URLs, rendered on save")
+    rendered_media_base = models.CharField(max_length=255, blank=True, editable=False)
     image = models.ImageField(upload_to='about/', blank=True, null=True, help_text="Optional image for the section")
     is_active = models.BooleanField(default=True, help_text="Whether this section is active")
     created_at = models.DateTimeField(auto_now_add=True)
@@ -80,12 +83,14 @@ class WhoWeAre(models.Model):
         super().save(*args, **kwargs)
 
 
-class OurStory(models.Model):
+class OurStory(RenderedHTMLMixin, models.Model):
     """
     Model for "Our Story" section content
     """
     title = models.CharField(max_length=200, default="Our Story")
     content = RichTextField(help_text="Content for the Our Story section")
+    rendered_content = models.TextField(blank=True, editable=False, help_text="Content with absolute image URLs, rendered on save")
+    rendered_media_base = models.CharField(max_length=255, blank=True, editable=False)
     image = models.ImageField(upload_to='about/', blank=True, null=True, help_text="Optional image for the section")
     is_active = models.BooleanField(default=True, help_text="Whether this section is active")
     created_at = models.DateTimeField(auto_now_add=True)
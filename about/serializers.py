@@ -1,5 +1,6 @@
 from rest_framework import serializers
-from main.utils import get_full_media_url, process_content_images
+from main.utils import MediaURLField
+from main.rendering import RenderedHTMLField
 from .models import Objective, TeamMember, WhoWeAre, OurStory, WhatSetsUsApart, Partner
 
 
@@ -20,7 +21,7 @@ class ObjectiveSerializer(serializers.ModelSerializer):
 
 
 class TeamMemberSerializer(serializers.ModelSerializer):
-    photo = serializers.SerializerMethodField()
+    photo = MediaURLField()
 
     class Meta:
         model = TeamMember
@@ -42,15 +43,10 @@ class TeamMemberSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ['created_at', 'updated_at']
 
-    def get_photo(self, obj):
-        if obj.photo:
-            return get_full_media_url(obj.photo.url)
-        return None
-
 
 class WhoWeAreSerializer(serializers.ModelSerializer):
-    image = serializers.SerializerMethodField()
-    content = serializers.SerializerMethodField()
+    image = MediaURLField()
+    content = RenderedHTMLField('content')
 
     class Meta:
         model = WhoWeAre
@@ -65,21 +61,10 @@ class WhoWeAreSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ['created_at', 'updated_at']
 
-    def get_image(self, obj):
-        if obj.image:
-            return get_full_media_url(obj.image.url)
-        return None
-    
-    def get_content(self, obj):
-        """Process content HTML to convert relative image URLs to absolute URLs"""
-        if obj.content:
-            return process_content_images(obj.content)
-        return obj.content
-
 
 class OurStorySerializer(serializers.ModelSerializer):
-    image = serializers.SerializerMethodField()
-    content = serializers.SerializerMethodField()
+    image = MediaURLField()
+    content = RenderedHTMLField('content')
 
     class Meta:
         model = OurStory
@@ -94,17 +79,6 @@ class OurStorySerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ['created_at', 'updated_at']
 
-    def get_image(self, obj):
-        if obj.image:
-            return get_full_media_url(obj.image.url)
-        return None
-    
-    def get_content(self, obj):
-        """Process content HTML to convert relative image URLs to absolute URLs"""
-        if obj.content:
-            return process_content_images(obj.content)
-        return obj.content
-
 
 class WhatSetsUsApartSerializer(serializers.ModelSerializer):
     class Meta:
@@ -123,7 +97,7 @@ class WhatSetsUsApartSerializer(serializers.ModelSerializer):
 
 
 class PartnerSerializer(serializers.ModelSerializer):
-    logo = serializers.SerializerMethodField()
+    logo = MediaURLField()
 
     class Meta:
         model = Partner
@@ -139,8 +113,3 @@ class PartnerSerializer(serializers.ModelSerializer):
             'updated_at',
         ]
         read_only_fields = ['created_at', 'updated_at']
-
-    def get_logo(self, obj):
-        if obj.logo:
-            return get_full_media_url(obj.logo.url)
-        return None
@@ -0,0 +1,23 @@
+# Generated by Django 6.0 on 2026-10-18 04:58
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0005_blog_search_vector_blog_blog_blog_search__af343e_gin'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='blog',
+            name='rendered_content',
+            field=models.TextField(blank=True, editable=False, help_text='Content with absolute image URLs, rendered on save'),
+        ),
+        migrations.AddField(
+            model_name='blog',
+            name='rendered_media_base',
+            field=models.CharField(blank=True, editable=False, max_length=255),
+        ),
+    ]
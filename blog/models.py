@@ -1,15 +1,19 @@
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVector, SearchVectorField
 from django.db import models
 from django.contrib.auth.models import User
 from django.utils import timezone
 from django.utils.text import slugify
 from ckeditor.fields import RichTextField
+from main.managers import SearchableManager
+from main.rendering import RenderedHTMLMixin
 
 
 def default_published_date():
     return timezone.now().date()
 
 
-class Blog(models.Model):
+class Blog(RenderedHTMLMixin, models.Model):
     STATUS_CHOICES = [
         ('draft', 'Draft'),
         ('published', 'Published'),
@@ -27,16 +31,29 @@ class Blog(models.Model):
     author = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, blank=True, related_name='blog_posts', db_index=True)
     category = models.CharField(max_length=50, choices=CATEGORY_CHOICES, default='governance')
     content = RichTextField()
+    rendered_content = models.TextField(blank=True, editable=False, help_text="Content with absolute image URLs, rendered on save")
+    rendered_media_base = models.CharField(max_length=255, blank=True, editable=False)
     image = models.ImageField(upload_to='blogs/', blank=True, null=True)
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='draft')
     published_date = models.DateField(default=default_published_date)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+    search_vector = models.GeneratedField(
+        expression=(
+            SearchVector('title', weight='A', config='english')
+            + SearchVector('content', weight='C', config='english')
+        ),
+        output_field=SearchVectorField(),
+        db_persist=True,
+    )
+
+    objects = SearchableManager()
 
     class Meta:
         ordering = ['-published_date', '-created_at']
         verbose_name = 'Blog'
         verbose_name_plural = 'Blogs'
+        indexes = [GinIndex(fields=['search_vector'])]
 
     def save(self, *args, **kwargs):
         if not self.slug:
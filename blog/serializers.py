@@ -1,13 +1,15 @@
 from rest_framework import serializers
-from main.utils import get_full_media_url, process_content_images
+from main.utils import MediaURLField
+from main.rendering import RenderedHTMLField
+from main.sparse import SparseFieldsMixin
 from .models import Blog
 
 
-class BlogListSerializer(serializers.ModelSerializer):
+class BlogListSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     """Simplified serializer for blog list view"""
     category_display = serializers.CharField(read_only=True)
     author = serializers.SerializerMethodField()
-    image = serializers.SerializerMethodField()
+    image = MediaURLField()
 
     class Meta:
         model = Blog
@@ -27,18 +29,13 @@ class BlogListSerializer(serializers.ModelSerializer):
             return obj.author.get_full_name() or obj.author.username
         return 'Unknown'
 
-    def get_image(self, obj):
-        if obj.image:
-            return get_full_media_url(obj.image.url)
-        return None
 
-
-class BlogDetailSerializer(serializers.ModelSerializer):
+class BlogDetailSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     """Full serializer for blog detail view"""
     category_display = serializers.CharField(read_only=True)
     author = serializers.SerializerMethodField()
-    image = serializers.SerializerMethodField()
-    content = serializers.SerializerMethodField()
+    image = MediaURLField()
+    content = RenderedHTMLField('content')
 
     class Meta:
         model = Blog
@@ -63,23 +60,12 @@ class BlogDetailSerializer(serializers.ModelSerializer):
             return obj.author.get_full_name() or obj.author.username
         return 'Unknown'
 
-    def get_image(self, obj):
-        if obj.image:
-            return get_full_media_url(obj.image.url)
-        return None
-    
-    def get_content(self, obj):
-        """Process content HTML to convert relative image URLs to absolute URLs"""
-        if obj.content:
-            return process_content_images(obj.content)
-        return obj.content
-
 
-class HomeBlogSummarySerializer(serializers.ModelSerializer):
+class HomeBlogSummarySerializer(SparseFieldsMixin, serializers.ModelSerializer):
     """Minimal serializer for home page blog summary"""
     category_display = serializers.CharField(read_only=True)
     author = serializers.SerializerMethodField()
-    image = serializers.SerializerMethodField()
+    image = MediaURLField()
     
     class Meta:
         model = Blog
@@ -89,9 +75,3 @@ class HomeBlogSummarySerializer(serializers.ModelSerializer):
         if obj.author:
             return obj.author.get_full_name() or obj.author.username
         return 'Unknown'
-
-    def get_image(self, obj):
-        if obj.image:
-            return get_full_media_url(obj.image.url)
-        return None
-
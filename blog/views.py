@@ -2,11 +2,10 @@ from rest_framework import viewsets, filters
 from rest_framework.pagination import PageNumberPagination
 from rest_framework.views import APIView
 from rest_framework.permissions import AllowAny
-from rest_framework.response import Response
 from django_filters.rest_framework import DjangoFilterBackend
-from django.views.decorators.cache import cache_page
-from django.utils.decorators import method_decorator
-from django.core.cache import cache
+from django.contrib.auth.models import User
+from main.mixins import ConditionalGetMixin, SparseQuerysetMixin
+from home.cache import get_summary, summary_response
 from .models import Blog
 from .serializers import BlogListSerializer, BlogDetailSerializer, HomeBlogSummarySerializer
 
@@ -17,7 +16,7 @@ class BlogPagination(PageNumberPagination):
     max_page_size = 100
 
 
-class BlogViewSet(viewsets.ModelViewSet):
+class BlogViewSet(ConditionalGetMixin, SparseQuerysetMixin, viewsets.ModelViewSet):
     """
     ViewSet for Blog model
 
@@ -26,6 +25,7 @@ class BlogViewSet(viewsets.ModelViewSet):
     Search by title, author, and content
     """
     queryset = Blog.objects.all().order_by('-published_date')
+    conditional_dependencies = [User]  # Author names
     pagination_class = BlogPagination
     filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
     filterset_fields = ['category', 'status', 'author']
@@ -61,18 +61,14 @@ class HomeBlogSummaryView(APIView):
     """
     Optimized endpoint for home page blog summary.
     Returns latest 3 published blog posts in a single response.
-    Cached for 10 minutes to improve performance.
+    Cached until the data it shows changes (see home.cache).
     """
     permission_classes = [AllowAny]
 
-    @method_decorator(cache_page(600))  # Cache for 10 minutes
     def get(self, request):
-        cache_key = 'home_blog_summary'
-        cached_data = cache.get(cache_key)
-        
-        if cached_data is not None:
-            return Response(cached_data)
-        
+        return summary_response(request, get_summary('home_blog_summary', self.build_summary))
+
+    def build_summary(self):
         # Fetch latest 3 published blog posts with optimized query
         # Using only() to fetch only needed fields
         blog_posts = Blog.objects.filter(
@@ -81,12 +77,6 @@ class HomeBlogSummaryView(APIView):
             'id', 'title', 'slug', 'author', 'category', 'image', 'published_date'
         ).order_by('-published_date', '-created_at')[:3]
         
-        # Serialize data
-        data = {
+        return {
             'results': HomeBlogSummarySerializer(blog_posts, many=True).data
         }
-        
-        # Cache the response
-        cache.set(cache_key, data, 600)  # Cache for 10 minutes
-        
-        return Response(data)
@@ -1,5 +1,6 @@
 from django.contrib import admin
-from .models import Document, ChatConversation, ChatMessage
+from .models import Document, ChatConversation, ChatMessage, DocumentText
+from .ingestion import enqueue_document
 
 
 @admin.register(Document)
@@ -73,3 +74,29 @@ class ChatMessageAdmin(admin.ModelAdmin):
         """Show a preview of the message content"""
         return obj.content[:100] + '...' if len(obj.content) > 100 else obj.content
     content_preview.short_description = 'Content Preview'
+
+
+@admin.register(DocumentText)
+class DocumentTextAdmin(admin.ModelAdmin):
+    list_display = ['relative_path', 'status', 'page_count', 'text_length', 'attempts', 'updated_at']
+    list_filter = ['status']
+    search_fields = ['relative_path']
+    readonly_fields = [
+        'relative_path', 'status', 'attempts', 'last_error', 'file_size', 'file_mtime',
+        'content_hash', 'page_count', 'text', 'created_at', 'updated_at'
+    ]
+    actions = ['retry_ingestion']
+
+    def text_length(self, obj):
+        """Number of characters extracted"""
+        return len(obj.text)
+    text_length.short_description = 'Text Length'
+
+    def retry_ingestion(self, request, queryset):
+        """Queue failed or pending documents for another ingestion attempt"""
+        queued = sum(
+            enqueue_document(relative_path)
+            for relative_path in queryset.exclude(status=DocumentText.STATUS_DONE).values_list('relative_path', flat=True)
+        )
+        self.message_user(request, f"Queued {queued} documents for ingestion.")
+    retry_ingestion.short_description = 'Retry ingestion of selected documents'
@@ -0,0 +1,55 @@
+"""
+Cache of chatbot answers for repeated questions.
+
+Answers are keyed on the normalized question and the version of the document corpus,
+so any change to the stored documents makes earlier answers unreachable and they
+simply expire.
+"""
+import hashlib
+import re
+from django.conf import settings
+from django.core.cache import caches
+from django.db.models import Count, Max
+
+# Response fields stored with a cached answer
+CACHED_FIELDS = ('document_name', 'document_url', 'sources', 'confidence')
+
+
+def normalize_query(query):
+    """Lowercase a question and strip punctuation and extra whitespace"""
+    return ' '.join(re.sub(r'[^\w\s]', ' ', query.lower()).split())
+
+
+def get_corpus_version():
+    """
+    Version of the document text store, derived from its row count and latest update.
+
+    Reading it from the database (rather than a counter in the cache) keeps every
+    worker process in agreement as soon as a document is added, re-ingested or removed.
+    """
+    from .models import DocumentText
+
+    stats = DocumentText.objects.aggregate(count=Count('id'), updated=Max('updated_at'))
+    updated = stats['updated'].timestamp() if stats['updated'] else 0
+    return f"{stats['count']}-{updated}"
+
+
+def answer_cache_key(query):
+    """Cache key for a question against the current corpus"""
+    digest = hashlib.sha256(normalize_query(query).encode('utf-8')).hexdigest()
+    return f'chatbot_answer:{get_corpus_version()}:{digest}'
+
+
+def get_cached_answer(cache_key):
+    """
+    Returns:
+        Dict with 'answer' and the response fields, or None on a miss
+    """
+    return caches['chatbot'].get(cache_key)
+
+
+def cache_answer(cache_key, answer, plan):
+    """Store an answer with its response fields for CHATBOT_ANSWER_CACHE_TIMEOUT seconds"""
+    cached = {field: plan[field] for field in CACHED_FIELDS}
+    cached['answer'] = answer
+    caches['chatbot'].set(cache_key, cached, getattr(settings, 'CHATBOT_ANSWER_CACHE_TIMEOUT', 60 * 60 * 24))
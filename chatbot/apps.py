@@ -3,3 +3,7 @@ from django.apps import AppConfig
 
 class ChatbotConfig(AppConfig):
     name = 'chatbot'
+
+    def ready(self):
+        from .ingestion import connect_signals
+        connect_signals()
@@ -0,0 +1,47 @@
+"""
+Process-wide Anthropic clients.
+
+Creating a client per request opens new HTTP connections (and TLS handshakes) for
+every chat. These helpers return one shared client per API key instead, so the
+underlying connection pool is reused across requests.
+"""
+import asyncio
+import threading
+import weakref
+
+try:
+    import anthropic
+except ImportError:
+    anthropic = None
+
+HAS_ANTHROPIC = anthropic is not None
+
+_lock = threading.Lock()
+_clients = {}
+# Async clients are bound to the event loop they were created in, so keep one per loop
+_async_clients = weakref.WeakKeyDictionary()
+
+
+def get_client(api_key):
+    """Return the shared synchronous Anthropic client for an API key"""
+    with _lock:
+        client = _clients.get(api_key)
+        if client is None:
+            client = _clients[api_key] = anthropic.Anthropic(api_key=api_key)
+        return client
+
+
+def get_async_client(api_key):
+    """
+    Return the shared AsyncAnthropic client for an API key on the running event loop.
+
+    Under an ASGI server there is a single loop per process, so every request shares
+    one client and its connection pool.
+    """
+    loop = asyncio.get_running_loop()
+    with _lock:
+        loop_clients = _async_clients.setdefault(loop, {})
+        client = loop_clients.get(api_key)
+        if client is None:
+            client = loop_clients[api_key] = anthropic.AsyncAnthropic(api_key=api_key)
+        return client
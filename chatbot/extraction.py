@@ -0,0 +1,139 @@
+"""
+Parallel PDF text extraction for bulk (re-)indexing.
+
+PyPDF2 is pure Python, so threads cannot extract more than one document at a time.
+extract_pdfs() fans files out over a pool of worker processes sized to the CPU count.
+Each worker has a per-file timeout for pathological PDFs and a cap on its address
+space, and is replaced after a number of files so leaked memory is returned.
+
+A worker that dies (e.g. killed by the memory cap) breaks the whole pool and fails
+every file still queued on it. Those files are retried, each in a process of its own,
+so only a file that crashes its worker again is reported as failed.
+"""
+import logging
+import os
+import signal
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from django.conf import settings
+from .utils import read_pdf
+
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None
+
+logger = logging.getLogger(__name__)
+
+
+class ExtractionError(Exception):
+    """A PDF could not be read by an extraction worker"""
+
+
+class ExtractionTimeout(ExtractionError):
+    """Raised in a worker when a PDF takes longer than the per-file timeout"""
+
+
+def _raise_timeout(signum, frame):
+    raise ExtractionTimeout()
+
+
+def _init_worker(memory_limit_mb):
+    """Process pool initializer: cap the worker's memory and leave Ctrl+C to the parent"""
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    if resource is not None and memory_limit_mb:
+        limit = memory_limit_mb * 1024 * 1024
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+
+
+def _extract(file_path, timeout):
+    """
+    Worker task: read one PDF.
+
+    Returns:
+        Tuple of (text, page_count, error), where error is a message or None
+    """
+    use_alarm = timeout and hasattr(signal, 'SIGALRM')
+    if use_alarm:
+        signal.signal(signal.SIGALRM, _raise_timeout)
+        signal.alarm(timeout)
+    try:
+        text, page_count = read_pdf(file_path)
+        return text, page_count, None
+    except ExtractionTimeout:
+        return '', None, f'Extraction timed out after {timeout}s'
+    except MemoryError:
+        return '', None, 'Extraction ran out of memory'
+    except Exception as e:
+        return '', None, str(e) or e.__class__.__name__
+    finally:
+        if use_alarm:
+            signal.alarm(0)
+
+
+def _extract_isolated(file_path, timeout, memory_limit_mb):
+    """Read one PDF in a worker process of its own, raising BrokenProcessPool if it crashes"""
+    with ProcessPoolExecutor(max_workers=1, initializer=_init_worker, initargs=(memory_limit_mb,)) as executor:
+        return executor.submit(_extract, file_path, timeout).result()
+
+
+def extract_pdfs(file_paths, workers=None, timeout=None, memory_limit_mb=None, tasks_per_child=None):
+    """
+    Extract text from many PDFs in parallel, yielding results as files finish.
+
+    Options default to the DOCUMENT_EXTRACTION_* settings. Files caught in a crashed
+    pool are retried in isolation; one that crashes its own worker too is reported as
+    failed rather than stopping the batch.
+
+    Args:
+        file_paths: Absolute paths of the PDFs to read
+        workers: Number of worker processes (defaults to the number of CPUs)
+        timeout: Seconds allowed per file
+        memory_limit_mb: Address space cap per worker, in megabytes
+        tasks_per_child: Files a worker handles before it is replaced
+
+    Yields:
+        Tuples of (file_path, text, page_count, error)
+    """
+    file_paths = list(file_paths)
+    if not file_paths:
+        return
+
+    workers = workers or getattr(settings, 'DOCUMENT_EXTRACTION_WORKERS', None) or os.cpu_count() or 1
+    timeout = timeout or getattr(settings, 'DOCUMENT_EXTRACTION_TIMEOUT', 120)
+    memory_limit_mb = memory_limit_mb or getattr(settings, 'DOCUMENT_EXTRACTION_MEMORY_LIMIT_MB', 1024)
+    tasks_per_child = tasks_per_child or getattr(settings, 'DOCUMENT_EXTRACTION_TASKS_PER_CHILD', 50)
+
+    with ProcessPoolExecutor(
+        max_workers=min(workers, len(file_paths)),
+        initializer=_init_worker,
+        initargs=(memory_limit_mb,),
+        max_tasks_per_child=tasks_per_child,
+    ) as executor:
+        futures = {executor.submit(_extract, path, timeout): path for path in file_paths}
+        crashed = []
+        for future in as_completed(futures):
+            path = futures[future]
+            try:
+                text, page_count, error = future.result()
+            except BrokenProcessPool:
+                crashed.append(path)
+                continue
+            yield path, text, page_count, error
+
+    if not crashed:
+        return
+
+    logger.warning(f"Extraction worker crashed; retrying {len(crashed)} files one per process")
+    with ThreadPoolExecutor(max_workers=min(workers, len(crashed))) as retries:
+        futures = {
+            retries.submit(_extract_isolated, path, timeout, memory_limit_mb): path for path in crashed
+        }
+        for future in as_completed(futures):
+            path = futures[future]
+            try:
+                text, page_count, error = future.result()
+            except BrokenProcessPool:
+                logger.warning(f"Extraction worker crashed while reading {path}")
+                text, page_count, error = '', None, 'Extraction worker crashed'
+            yield path, text, page_count, error
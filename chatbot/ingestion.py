@@ -0,0 +1,341 @@
+"""
+Background ingestion pipeline for uploaded PDF documents.
+
+When a model with a document FileField is saved, the PDF is queued and processed on
+a process-wide worker pool after the transaction commits: its text is extracted,
+page count and hash recorded, and the text chunked and indexed for retrieval.
+Progress is tracked on DocumentText (status, attempts, last_error) and failed files
+are retried with exponential backoff.
+"""
+import itertools
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from django.apps import apps
+from django.conf import settings
+from django.db import close_old_connections, transaction
+from django.db.models.signals import post_save
+from .extraction import ExtractionError, extract_pdfs
+from .retrieval import index_document_text
+from .utils import get_documents_from_media, get_file_signature, hash_file, read_pdf
+
+logger = logging.getLogger(__name__)
+
+# File fields whose uploads feed the document store, by model
+INGESTED_FILE_FIELDS = {
+    'trackers.Hansard': ['file'],
+    'trackers.Budget': ['file'],
+    'trackers.OrderPaper': ['file'],
+    'trackers.BillReading': ['document', 'committee_report', 'analysis'],
+    'trackers.CommitteeDocument': ['file'],
+    'resources.Explainers': ['file'],
+    'resources.Report': ['file'],
+    'resources.PartnerPublication': ['file'],
+    'resources.Statement': ['file'],
+    'chatbot.Document': ['file'],
+}
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_executor():
+    """Return the process-wide ingestion worker pool, creating it on first use"""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=getattr(settings, 'DOCUMENT_INGESTION_WORKERS', 2),
+                thread_name_prefix='document-ingestion',
+            )
+        return _executor
+
+
+def store_document_text(file_path, force=False, reader=read_pdf):
+    """
+    Extract, hash and index a PDF in the media folder and mark it done in the text store.
+
+    Extraction is skipped when the stored entry is done and still matches the file's
+    size and mtime, or when another stored file has identical contents (same hash).
+    Read errors are raised so the caller can record them.
+
+    Args:
+        file_path: Absolute path to a PDF inside MEDIA_ROOT
+        force: Re-extract even if the stored entry is up to date
+        reader: Callable returning (text, page_count) for a path, e.g. to use text
+            already extracted by a worker process
+
+    Returns:
+        Tuple of (DocumentText instance, whether text was (re)extracted)
+    """
+    from .models import DocumentText
+
+    relative_path = os.path.relpath(file_path, settings.MEDIA_ROOT)
+    file_size, file_mtime = get_file_signature(file_path)
+
+    stored = DocumentText.objects.filter(relative_path=relative_path).first()
+    if (stored and not force and stored.status == DocumentText.STATUS_DONE and stored.page_count is not None
+            and stored.file_size == file_size and stored.file_mtime == file_mtime):
+        return stored, False
+
+    content_hash = hash_file(file_path)
+    duplicate = None
+    if not force:
+        duplicate = DocumentText.objects.filter(
+            content_hash=content_hash,
+            status=DocumentText.STATUS_DONE,
+            page_count__isnull=False
+        ).exclude(relative_path=relative_path).only('text', 'page_count').first()
+
+    if duplicate:
+        text, page_count = duplicate.text, duplicate.page_count
+    else:
+        text, page_count = reader(file_path)
+
+    stored, _ = DocumentText.objects.update_or_create(
+        relative_path=relative_path,
+        defaults={
+            'file_size': file_size,
+            'file_mtime': file_mtime,
+            'content_hash': content_hash,
+            'page_count': page_count,
+            'text': text,
+            'status': DocumentText.STATUS_DONE,
+            'last_error': '',
+        }
+    )
+    index_document_text(stored)
+
+    return stored, duplicate is None
+
+
+def ingest_document(relative_path, force=False, reader=read_pdf):
+    """
+    Run one ingestion attempt for a file, recording its status and any error.
+
+    Returns:
+        Tuple of (DocumentText instance, whether text was (re)extracted)
+    """
+    from .models import DocumentText
+
+    file_path = os.path.join(settings.MEDIA_ROOT, relative_path)
+    file_size, file_mtime = get_file_signature(file_path)
+
+    stored, _ = DocumentText.objects.get_or_create(
+        relative_path=relative_path,
+        defaults={'file_size': file_size, 'file_mtime': file_mtime}
+    )
+    if stored.status != DocumentText.STATUS_DONE:
+        stored.status = DocumentText.STATUS_PROCESSING
+        stored.attempts += 1
+        stored.save(update_fields=['status', 'attempts', 'updated_at'])
+
+    try:
+        return store_document_text(file_path, force=force, reader=reader)
+    except Exception as e:
+        DocumentText.objects.filter(pk=stored.pk).update(
+            status=DocumentText.STATUS_FAILED,
+            last_error=str(e),
+        )
+        raise
+
+
+def _run_ingestion(relative_path, attempt=1):
+    """Worker-pool task: ingest a file and schedule a retry if it fails"""
+    close_old_connections()
+    try:
+        ingest_document(relative_path)
+    except FileNotFoundError:
+        logger.warning(f"Skipping ingestion of {relative_path}: file no longer exists")
+    except Exception as e:
+        max_attempts = getattr(settings, 'DOCUMENT_INGESTION_MAX_ATTEMPTS', 3)
+        if attempt >= max_attempts:
+            logger.error(f"Ingestion of {relative_path} failed after {attempt} attempts: {e}")
+        else:
+            delay = getattr(settings, 'DOCUMENT_INGESTION_RETRY_DELAY', 30) * 2 ** (attempt - 1)
+            logger.warning(f"Ingestion of {relative_path} failed ({e}), retrying in {delay}s")
+            timer = threading.Timer(delay, lambda: get_executor().submit(_run_ingestion, relative_path, attempt + 1))
+            timer.daemon = True
+            timer.start()
+    finally:
+        close_old_connections()
+
+
+def enqueue_document(relative_path):
+    """
+    Queue a media file for ingestion once the current transaction commits.
+
+    The file is marked pending straight away so its status is visible; files that are
+    already ingested and unchanged are not queued again.
+
+    Returns:
+        True if the file was queued
+    """
+    from .models import DocumentText
+
+    if not relative_path.lower().endswith('.pdf'):
+        return False
+
+    try:
+        file_size, file_mtime = get_file_signature(os.path.join(settings.MEDIA_ROOT, relative_path))
+    except OSError:
+        return False
+
+    stored = DocumentText.objects.filter(relative_path=relative_path).first()
+    if stored and stored.status == DocumentText.STATUS_DONE and (
+            stored.file_size, stored.file_mtime) == (file_size, file_mtime):
+        return False
+
+    DocumentText.objects.update_or_create(
+        relative_path=relative_path,
+        defaults={
+            'file_size': file_size,
+            'file_mtime': file_mtime,
+            'status': DocumentText.STATUS_PENDING,
+            'attempts': 0,
+            'last_error': '',
+        }
+    )
+    transaction.on_commit(lambda: get_executor().submit(_run_ingestion, relative_path))
+    return True
+
+
+def queue_saved_files(sender, instance, **kwargs):
+    """post_save receiver: queue the instance's document files for ingestion"""
+    for field_name in INGESTED_FILE_FIELDS.get(sender._meta.label, []):
+        field_file = getattr(instance, field_name)
+        if field_file:
+            enqueue_document(field_file.name)
+
+
+def connect_signals():
+    """Connect the ingestion receiver to every model in INGESTED_FILE_FIELDS"""
+    for label in INGESTED_FILE_FIELDS:
+        post_save.connect(
+            queue_saved_files,
+            sender=apps.get_model(label),
+            dispatch_uid=f'chatbot_ingestion_{label}',
+        )
+
+
+def _extracted_reader(text, page_count, error):
+    """Reader for store_document_text() that returns a worker's result, or raises its error"""
+    def reader(file_path):
+        if error:
+            raise ExtractionError(error)
+        return text, page_count
+    return reader
+
+
+def _split_copies(documents):
+    """
+    Separate documents whose contents are already stored, or are a copy of another
+    document in the list, from those that need extracting.
+
+    Returns:
+        Tuple of (documents to extract, copies)
+    """
+    from .models import DocumentText
+
+    hashes = {}
+    for doc in documents:
+        try:
+            hashes[doc['path']] = hash_file(doc['path'])
+        except OSError:
+            pass  # Left to the extraction, which records the error
+
+    seen = set(DocumentText.objects.filter(
+        content_hash__in=set(hashes.values()), status=DocumentText.STATUS_DONE, page_count__isnull=False
+    ).values_list('content_hash', flat=True))
+    to_extract, copies = [], []
+    for doc in documents:
+        content_hash = hashes.get(doc['path'])
+        if content_hash in seen:
+            copies.append(doc)
+        else:
+            to_extract.append(doc)
+            if content_hash:
+                seen.add(content_hash)
+    return to_extract, copies
+
+
+def sync_document_texts(force=False, prune=True, workers=None):
+    """
+    Bring the text store in line with the PDFs currently in the media folder.
+
+    Runs synchronously; files that are pending or failed are retried. Uploads are
+    ingested by the post_save signals, so run this periodically to pick up files
+    copied into the media folder directly. Unchanged files cost one stat call each.
+
+    Files that need extracting are read in parallel by a process pool (see
+    chatbot.extraction) and stored as each one finishes. Files whose contents are
+    already stored, or that copy another file in the batch, are not extracted again.
+
+    Args:
+        force: Re-extract every file
+        prune: Remove stored text for files that no longer exist
+        workers: Extraction processes (defaults to the CPU count); 1 reads files in-process
+
+    Returns:
+        Dict with counts of 'extracted', 'unchanged', 'failed' and 'removed' documents
+    """
+    from .models import DocumentText
+
+    counts = {'extracted': 0, 'unchanged': 0, 'failed': 0, 'removed': 0}
+    documents = get_documents_from_media()
+
+    # Signatures of the files already ingested, to diff the folder against in one query
+    ingested = {
+        relative_path: (file_size, file_mtime)
+        for relative_path, file_size, file_mtime in DocumentText.objects.filter(
+            status=DocumentText.STATUS_DONE, page_count__isnull=False
+        ).values_list('relative_path', 'file_size', 'file_mtime')
+    }
+
+    changed = []
+    for doc in documents:
+        if not force and doc['relative_path'] in ingested:
+            try:
+                if get_file_signature(doc['path']) == ingested[doc['relative_path']]:
+                    counts['unchanged'] += 1
+                    continue
+            except OSError:
+                continue
+        changed.append(doc)
+
+    if workers == 1 or len(changed) < 2:
+        readers = ((doc, read_pdf) for doc in changed)
+    else:
+        to_extract, copies = _split_copies(changed) if not force else (changed, [])
+        documents_by_path = {doc['path']: doc for doc in to_extract}
+        readers = itertools.chain(
+            (
+                (documents_by_path[path], _extracted_reader(text, page_count, error))
+                for path, text, page_count, error in extract_pdfs(documents_by_path, workers=workers)
+            ),
+            # Stored after the files they copy, so store_document_text() reuses their text
+            ((doc, read_pdf) for doc in copies),
+        )
+
+    for doc, reader in readers:
+        try:
+            _, extracted = ingest_document(doc['relative_path'], force=force, reader=reader)
+        except Exception as e:
+            logger.warning(f"Could not store text for {doc['relative_path']}: {e}")
+            counts['failed'] += 1
+            continue
+        counts['extracted' if extracted else 'unchanged'] += 1
+
+    if prune:
+        present = {doc['relative_path'] for doc in documents}
+        stale = DocumentText.objects.exclude(relative_path__in=present)
+        counts['removed'] = stale.count()
+        stale.delete()
+
+    # Index text stored before the retrieval index existed
+    for stored in DocumentText.objects.filter(
+            status=DocumentText.STATUS_DONE, chunks__isnull=True).exclude(text=''):
+        index_document_text(stored)
+
+    return counts
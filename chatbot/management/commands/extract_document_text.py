@@ -0,0 +1,43 @@
+from django.core.management.base import BaseCommand
+from chatbot.ingestion import sync_document_texts
+
+
+class Command(BaseCommand):
+    help = 'Extract text from all PDFs in the media folder into the chatbot text store'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--force',
+            action='store_true',
+            help='Re-extract every PDF even if its stored text is up to date'
+        )
+        parser.add_argument(
+            '--keep-missing',
+            action='store_true',
+            help='Keep stored text for files that no longer exist in the media folder'
+        )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=None,
+            help='Number of extraction processes (defaults to one per CPU; 1 extracts in-process)'
+        )
+
+    def handle(self, *args, **options):
+        counts = sync_document_texts(
+            force=options['force'],
+            prune=not options['keep_missing'],
+            workers=options['workers']
+        )
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Extracted {counts['extracted']} documents, "
+                f"{counts['unchanged']} unchanged, "
+                f"{counts['removed']} removed."
+            )
+        )
+        if counts['failed']:
+            self.stdout.write(
+                self.style.WARNING(f"{counts['failed']} documents could not be read.")
+            )
@@ -0,0 +1,31 @@
+# Generated by Django 6.0 on 2026-10-18 04:28
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('chatbot', '0002_chatconversation_chatmessage'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DocumentText',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('relative_path', models.CharField(help_text='Path of the file relative to MEDIA_ROOT', max_length=500, unique=True)),
+                ('file_size', models.BigIntegerField(help_text='File size in bytes when the text was extracted')),
+                ('file_mtime', models.FloatField(help_text='File modification time when the text was extracted')),
+                ('content_hash', models.CharField(db_index=True, help_text='SHA-256 of the file contents', max_length=64)),
+                ('text', models.TextField(blank=True, help_text='Extracted text')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Document Text',
+                'verbose_name_plural': 'Document Texts',
+                'ordering': ['relative_path'],
+            },
+        ),
+    ]
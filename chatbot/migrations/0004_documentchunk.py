@@ -0,0 +1,33 @@
+# Generated by Django 6.0 on 2026-10-18 04:29
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('chatbot', '0003_documenttext'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DocumentChunk',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('position', models.PositiveIntegerField(help_text='Order of the passage within the document')),
+                ('text', models.TextField(help_text='Passage text')),
+                ('search_vector', models.GeneratedField(db_persist=True, expression=django.contrib.postgres.search.SearchVector('text', config='english'), output_field=django.contrib.postgres.search.SearchVectorField())),
+                ('document', models.ForeignKey(help_text='The extracted document this passage belongs to', on_delete=django.db.models.deletion.CASCADE, related_name='chunks', to='chatbot.documenttext')),
+            ],
+            options={
+                'verbose_name': 'Document Chunk',
+                'verbose_name_plural': 'Document Chunks',
+                'ordering': ['document', 'position'],
+                'indexes': [django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='chatbot_doc_search__d03645_gin')],
+                'unique_together': {('document', 'position')},
+            },
+        ),
+    ]
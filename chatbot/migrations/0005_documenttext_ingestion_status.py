@@ -0,0 +1,45 @@
+# Generated by Django 6.0 on 2026-10-18 04:31
+
+from django.db import migrations, models
+
+
+def mark_existing_texts_done(apps, schema_editor):
+    """Text stored before status tracking was extracted synchronously, so it is complete"""
+    DocumentText = apps.get_model('chatbot', 'DocumentText')
+    DocumentText.objects.update(status='done')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('chatbot', '0004_documentchunk'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='documenttext',
+            name='attempts',
+            field=models.PositiveIntegerField(default=0, help_text='Number of ingestion attempts for the current file version'),
+        ),
+        migrations.AddField(
+            model_name='documenttext',
+            name='last_error',
+            field=models.TextField(blank=True, help_text='Error from the last failed ingestion attempt'),
+        ),
+        migrations.AddField(
+            model_name='documenttext',
+            name='page_count',
+            field=models.PositiveIntegerField(blank=True, help_text='Number of pages in the PDF', null=True),
+        ),
+        migrations.AddField(
+            model_name='documenttext',
+            name='status',
+            field=models.CharField(choices=[('pending', 'Pending'), ('processing', 'Processing'), ('done', 'Done'), ('failed', 'Failed')], db_index=True, default='pending', help_text='Ingestion status', max_length=20),
+        ),
+        migrations.AlterField(
+            model_name='documenttext',
+            name='content_hash',
+            field=models.CharField(blank=True, db_index=True, help_text='SHA-256 of the file contents', max_length=64),
+        ),
+        migrations.RunPython(mark_existing_texts_done, migrations.RunPython.noop),
+    ]
@@ -1,3 +1,5 @@
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVector, SearchVectorField
 from django.db import models
 from django.conf import settings
 import os
@@ -82,8 +84,8 @@ class Document(models.Model):
     def file_url(self):
         """Get the URL to access the file"""
         if self.file:
-            from main.utils import get_full_media_url
-            return get_full_media_url(self.file.url)
+            from main.utils import media_url
+            return media_url(self.file.name)
         return None
 
     @property
@@ -92,3 +94,65 @@ class Document(models.Model):
         if self.file:
             return os.path.splitext(self.file.name)[1].lower().replace('.', '')
         return 'pdf'
+
+
+class DocumentText(models.Model):
+    """Pre-extracted text of a PDF in the media folder, so chat requests never parse PDFs"""
+    STATUS_PENDING = 'pending'
+    STATUS_PROCESSING = 'processing'
+    STATUS_DONE = 'done'
+    STATUS_FAILED = 'failed'
+
+    STATUS_CHOICES = [
+        (STATUS_PENDING, 'Pending'),
+        (STATUS_PROCESSING, 'Processing'),
+        (STATUS_DONE, 'Done'),
+        (STATUS_FAILED, 'Failed'),
+    ]
+
+    relative_path = models.CharField(max_length=500, unique=True, help_text="Path of the file relative to MEDIA_ROOT")
+    file_size = models.BigIntegerField(help_text="File size in bytes when the text was extracted")
+    file_mtime = models.FloatField(help_text="File modification time when the text was extracted")
+    content_hash = models.CharField(max_length=64, blank=True, db_index=True, help_text="SHA-256 of the file contents")
+    page_count = models.PositiveIntegerField(null=True, blank=True, help_text="Number of pages in the PDF")
+    text = models.TextField(blank=True, help_text="Extracted text")
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default=STATUS_PENDING, db_index=True, help_text="Ingestion status")
+    attempts = models.PositiveIntegerField(default=0, help_text="Number of ingestion attempts for the current file version")
+    last_error = models.TextField(blank=True, help_text="Error from the last failed ingestion attempt")
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ['relative_path']
+        verbose_name = 'Document Text'
+        verbose_name_plural = 'Document Texts'
+
+    def __str__(self):
+        return self.relative_path
+
+
+class DocumentChunk(models.Model):
+    """Passage of a document's extracted text, indexed for full-text retrieval"""
+    document = models.ForeignKey(
+        DocumentText,
+        on_delete=models.CASCADE,
+        related_name='chunks',
+        help_text="The extracted document this passage belongs to"
+    )
+    position = models.PositiveIntegerField(help_text="Order of the passage within the document")
+    text = models.TextField(help_text="Passage text")
+    search_vector = models.GeneratedField(
+        expression=SearchVector('text', config='english'),
+        output_field=SearchVectorField(),
+        db_persist=True,
+    )
+
+    class Meta:
+        ordering = ['document', 'position']
+        verbose_name = 'Document Chunk'
+        verbose_name_plural = 'Document Chunks'
+        unique_together = ['document', 'position']
+        indexes = [GinIndex(fields=['search_vector'])]
+
+    def __str__(self):
+        return f"{self.document.relative_path} #{self.position}"
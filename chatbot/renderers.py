@@ -0,0 +1,20 @@
+import json
+from rest_framework.renderers import BaseRenderer
+
+
+class EventStreamRenderer(BaseRenderer):
+    """
+    Renderer for clients that send `Accept: text/event-stream`.
+
+    Streamed answers bypass rendering entirely; this only formats the regular
+    responses of a streaming request (validation and configuration errors)
+    as a single server-sent event.
+    """
+    media_type = 'text/event-stream'
+    format = 'event-stream'
+    charset = 'utf-8'
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        response = renderer_context.get('response') if renderer_context else None
+        event = 'error' if response is not None and response.status_code >= 400 else 'done'
+        return f"event: {event}\ndata: {json.dumps(data)}\n\n".encode(self.charset)
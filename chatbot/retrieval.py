@@ -0,0 +1,110 @@
+"""
+Full-text retrieval over chunked document text for the chatbot
+"""
+import re
+from django.conf import settings
+from django.contrib.postgres.search import SearchQuery, SearchRank
+from django.db import transaction
+from django.db.models import F
+from .utils import chunk_text
+
+
+def index_document_text(document_text):
+    """
+    Split a document's stored text into passages and (re)build its chunk index.
+
+    Args:
+        document_text: DocumentText instance
+
+    Returns:
+        Number of passages indexed
+    """
+    from .models import DocumentChunk
+
+    chunk_size = getattr(settings, 'CHATBOT_CHUNK_SIZE', 1500)
+    overlap = getattr(settings, 'CHATBOT_CHUNK_OVERLAP', 200)
+    text = document_text.text.strip()
+    passages = chunk_text(text, chunk_size=chunk_size, overlap=overlap) if text else []
+
+    with transaction.atomic():
+        DocumentChunk.objects.filter(document=document_text).delete()
+        DocumentChunk.objects.bulk_create([
+            DocumentChunk(document=document_text, position=position, text=passage)
+            for position, passage in enumerate(passages)
+        ])
+
+    return len(passages)
+
+
+def build_search_query(query):
+    """
+    Build an OR-ed full-text query from the words of a question.
+
+    Questions are phrased naturally ("what is the budget for health?"), so requiring
+    every word would miss most passages; ranking sorts out the best matches instead.
+    Stop words are dropped by PostgreSQL's english configuration.
+
+    Returns:
+        SearchQuery, or None if the question contains no searchable words
+    """
+    terms = re.findall(r'\w+', query.lower())
+    if not terms:
+        return None
+    return SearchQuery(' | '.join(terms), search_type='raw', config='english')
+
+
+def search_passages(query, top_k=None, relative_paths=None):
+    """
+    Find the passages most relevant to a question, possibly from several documents.
+
+    Args:
+        query: The user's question
+        top_k: Maximum number of passages to return (defaults to CHATBOT_TOP_K)
+        relative_paths: Optional iterable restricting results to these documents
+
+    Only documents whose stored text is done are searched, so a file that is being
+    re-ingested after a change is left out until its new text is indexed.
+
+    Returns:
+        List of dicts with 'relative_path', 'position', 'text' and 'rank', best first
+    """
+    from .models import DocumentChunk, DocumentText
+
+    search_query = build_search_query(query)
+    if search_query is None:
+        return []
+
+    if top_k is None:
+        top_k = getattr(settings, 'CHATBOT_TOP_K', 6)
+
+    queryset = DocumentChunk.objects.filter(search_vector=search_query, document__status=DocumentText.STATUS_DONE)
+    if relative_paths is not None:
+        queryset = queryset.filter(document__relative_path__in=list(relative_paths))
+
+    return list(
+        queryset.annotate(
+            rank=SearchRank(F('search_vector'), search_query),
+            relative_path=F('document__relative_path'),
+        ).order_by('-rank', 'document_id', 'position').values(
+            'relative_path', 'position', 'text', 'rank'
+        )[:top_k]
+    )
+
+
+def matching_document_paths(query, limit=500):
+    """
+    Relative paths of documents whose indexed text contains every word of a search
+    query, for filtering FileField models by the contents of their files.
+
+    Only documents whose text extraction is done are matched. The paths are returned
+    as a list (at most limit of them) rather than a subquery, so callers can filter on
+    them with an index on the path column.
+    """
+    from .models import DocumentText
+
+    search_query = SearchQuery(query, search_type='websearch', config='english')
+    return list(
+        DocumentText.objects.filter(
+            status=DocumentText.STATUS_DONE, chunks__search_vector=search_query
+        ).order_by().values_list('relative_path', flat=True).distinct()[:limit]
+    )
@@ -14,12 +14,18 @@ class DocumentSerializer(serializers.ModelSerializer):
 class ChatbotQuerySerializer(serializers.Serializer):
     query = serializers.CharField(required=True, help_text="User's question")
     session_id = serializers.CharField(required=False, allow_blank=True, help_text="Session ID for conversation continuity")
+    stream = serializers.BooleanField(required=False, default=False, help_text="Stream the answer as server-sent events")
 
 
 class ChatbotResponseSerializer(serializers.Serializer):
     answer = serializers.CharField(help_text="AI-generated answer")
     document_name = serializers.CharField(help_text="Name of the relevant document")
     document_url = serializers.CharField(help_text="URL to access the document")
+    sources = serializers.ListField(
+        child=serializers.DictField(child=serializers.CharField()),
+        help_text="Documents the answer's passages were taken from, best match first",
+        required=False
+    )
     confidence = serializers.FloatField(help_text="Confidence score (0-1)", required=False)
     session_id = serializers.CharField(help_text="Session ID for conversation continuity", required=False)
 
@@ -0,0 +1,168 @@
+"""
+Local replies for small talk (greetings, thanks, farewells and questions about the bot).
+
+These turns make up a large share of chat traffic and need no documents, so they are
+answered from templates without calling Claude. A message only counts as small talk
+when nothing is left once its small-talk phrases are removed; "Hello, who is the
+speaker?" still goes to the model.
+"""
+import re
+
+# Intent phrases, checked in order; longer phrases are matched before shorter ones
+INTENT_PHRASES = [
+    ('farewell', [
+        'goodbye', 'good bye', 'bye', 'bye bye', 'see you', 'see you later', 'see ya',
+        'talk later', 'talk to you later', 'good night', 'take care', 'later',
+    ]),
+    ('appreciation', [
+        'thank you', 'thanks', 'thank', 'thx', 'appreciate it', 'appreciate', 'appreciated',
+        'much appreciated', 'thanks a lot', 'thank you very much', 'thanks so much',
+        'thanks a bunch', 'i appreciate', "i'm grateful", 'im grateful', 'grateful',
+        'that was helpful', 'that helps', 'very helpful', 'helpful',
+    ]),
+    ('wellbeing', [
+        'how are you', 'how are you doing', 'how is it going', "how's it going",
+        'hows it going', 'how do you do', "what's up", 'whats up',
+    ]),
+    ('identity', [
+        'who are you', 'what are you', 'what is your name', "what's your name",
+        'whats your name', 'are you a bot', 'are you human', 'are you a robot',
+        'introduce yourself',
+    ]),
+    ('capabilities', [
+        'what can you do', 'what do you do', 'how can you help', 'how can you help me',
+        'what can you help with', 'what can you help me with', 'what can i ask',
+        'what can i ask you', 'help', 'help me',
+    ]),
+    ('greeting', [
+        'hello', 'hi', 'hey', 'hey there', 'hi there', 'hello there', 'greetings',
+        'good morning', 'good afternoon', 'good evening', 'good day', 'howdy',
+        'nice to meet you', 'pleased to meet you',
+    ]),
+    ('acknowledgement', [
+        'ok', 'okay', 'k', 'alright', 'all right', 'cool', 'great', 'nice', 'awesome',
+        'got it', 'i see', 'understood', 'noted', 'sure', 'perfect', 'fine', 'good',
+    ]),
+]
+
+# Words that may accompany small talk without turning it into a question
+FILLER_WORDS = {
+    'so', 'very', 'much', 'a', 'lot', 'again', 'too', 'then', 'and', 'for', 'the',
+    'it', 'that', 'this', 'you', 'your', 'chatbot', 'bot', 'assistant', 'friend',
+    'sir', 'madam', 'please', 'oh', 'ah', 'wow', 'yes', 'yeah', 'well', 'all',
+}
+
+RESPONSES = {
+    'greeting': [
+        "Hello! I'm the Parliament Watch Uganda chatbot. I can help you find information about the Ugandan Parliament, bills, parliamentary proceedings and related documents. What would you like to know?",
+        "Hi there! Ask me anything about Uganda's Parliament: bills, Hansards, budgets, order papers or committee reports.",
+        "Hello and welcome to Parliament Watch Uganda. What would you like to find out about Parliament today?",
+    ],
+    'greeting_returning': [
+        "Welcome back! What else would you like to know about the Ugandan Parliament?",
+        "Hello again! Ask me another question about bills, proceedings or parliamentary documents.",
+    ],
+    'appreciation': [
+        "You're welcome! Let me know if you have any other questions about the Ugandan Parliament.",
+        "Glad I could help. Feel free to ask anything else about bills, proceedings or parliamentary documents.",
+        "My pleasure! I'm here if you need anything else about Parliament.",
+    ],
+    'appreciation_topic': [
+        "You're welcome! If you'd like to know more about {topic}, or anything else about Parliament, just ask.",
+        "Glad that helped. Ask me a follow-up on {topic} or any other parliamentary question.",
+    ],
+    'farewell': [
+        "Goodbye! Come back any time you have questions about the Ugandan Parliament.",
+        "Take care! Parliament Watch Uganda is here whenever you need parliamentary information.",
+    ],
+    'wellbeing': [
+        "I'm doing well, thank you for asking! How can I help you with information about the Ugandan Parliament?",
+        "All good here and ready to help. What would you like to know about Parliament?",
+    ],
+    'identity': [
+        "I'm the Parliament Watch Uganda chatbot. I answer questions about the Ugandan Parliament using parliamentary documents such as Hansards, bills, budgets and reports.",
+        "I'm an assistant for Parliament Watch Uganda. I search parliamentary documents to answer your questions about Parliament, MPs, bills and proceedings.",
+    ],
+    'capabilities': [
+        "I can answer questions about the Ugandan Parliament using its documents: bills and their stages, Hansards, budgets, order papers and committee reports. For example, ask \"What was discussed about the budget?\" or \"What does the anti-corruption bill say?\"",
+        "Ask me about bills, parliamentary debates, budgets, order papers or committee reports, and I'll find the answer in the available documents and point you to the source.",
+    ],
+    'acknowledgement': [
+        "Great! Is there anything else you'd like to know?",
+        "Sure. Let me know if you have another question about Parliament.",
+        "Alright! I'm here if you need anything else.",
+    ],
+}
+
+_INTENT_PATTERNS = [
+    (intent, re.compile(r'\b(' + '|'.join(
+        re.escape(phrase) for phrase in sorted(phrases, key=len, reverse=True)
+    ) + r')\b'))
+    for intent, phrases in INTENT_PHRASES
+]
+
+
+def normalize_message(message):
+    """Lowercase a message and strip punctuation other than apostrophes"""
+    return ' '.join(re.sub(r"[^\w\s']", ' ', message.lower()).split())
+
+
+def detect_intent(message):
+    """
+    Work out whether a message is pure small talk.
+
+    Returns:
+        The intent name of the first small-talk phrase found, or None if the message
+        contains anything else
+    """
+    text = normalize_message(message)
+    if not text:
+        return None
+
+    intent = None
+    for name, pattern in _INTENT_PATTERNS:
+        if pattern.search(text):
+            intent = intent or name
+            text = pattern.sub(' ', text)
+
+    if intent is None:
+        return None
+    if any(word not in FILLER_WORDS for word in text.split()):
+        return None
+    return intent
+
+
+def get_reply(intent, history):
+    """
+    Pick a reply for a small-talk intent.
+
+    Replies rotate with the length of the conversation so repeated greetings or thanks
+    don't get the same answer, and use the conversation to welcome returning users or
+    mention the topic they just asked about.
+
+    Args:
+        intent: Intent name from detect_intent
+        history: Conversation history as returned by ChatbotView.get_conversation_history
+    """
+    context = {}
+    if intent == 'greeting' and history:
+        intent = 'greeting_returning'
+    elif intent == 'appreciation' and history:
+        topic = history[-1]['user'].strip().rstrip('?.!')
+        if topic and len(topic) <= 80:
+            intent = 'appreciation_topic'
+            context['topic'] = f'"{topic}"'
+
+    templates = RESPONSES[intent]
+    return templates[len(history) % len(templates)].format(**context)
+
+
+def smalltalk_reply(message, history):
+    """
+    Returns:
+        Tuple of (intent, reply) for a small-talk message, or None if it needs an answer
+    """
+    intent = detect_intent(message)
+    if intent is None:
+        return None
+    return intent, get_reply(intent, history)
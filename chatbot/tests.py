@@ -1,3 +1,504 @@
-from django.test import TestCase
+import json
+import multiprocessing
+import os
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from types import SimpleNamespace
+from unittest import mock
+from django.core.cache import caches
+from django.test import TestCase, override_settings
 
-# Create your tests here.
+from .answer_cache import answer_cache_key, get_corpus_version
+from .extraction import extract_pdfs
+from .ingestion import enqueue_document, ingest_document, sync_document_texts
+from .models import ChatMessage, DocumentChunk, DocumentText
+from .retrieval import index_document_text, matching_document_paths, search_passages
+from .smalltalk import RESPONSES, detect_intent, smalltalk_reply
+from .utils import chunk_text, extract_text_from_pdf, read_pdf
+
+
+def make_pdf(*pages):
+    """Bytes of a PDF with one line of text per page"""
+    page_count = len(pages)
+    objects = [
+        b'<< /Type /Catalog /Pages 2 0 R >>',
+        b'<< /Type /Pages /Kids [' + b' '.join(b'%d 0 R' % (4 + 2 * i) for i in range(page_count))
+        + b'] /Count %d >>' % page_count,
+        b'<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>',
+    ]
+    for i, text in enumerate(pages):
+        stream = b'BT /F1 12 Tf 72 720 Td (%s) Tj ET' % text.encode('latin-1')
+        objects.append(
+            b'<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] '
+            b'/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>' % (5 + 2 * i)
+        )
+        objects.append(b'<< /Length %d >>\nstream\n%s\nendstream' % (len(stream), stream))
+
+    pdf = b'%PDF-1.4\n'
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(pdf))
+        pdf += b'%d 0 obj\n%s\nendobj\n' % (number, body)
+    xref = len(pdf)
+    pdf += b'xref\n0 %d\n0000000000 65535 f \n' % (len(objects) + 1)
+    pdf += b''.join(b'%010d 00000 n \n' % offset for offset in offsets)
+    pdf += b'trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n' % (len(objects) + 1, xref)
+    return pdf
+
+
+def crashing_reader(file_path):
+    """read_pdf() that kills its worker process on files named crash.pdf"""
+    if file_path.endswith('crash.pdf'):
+        os._exit(1)
+    return read_pdf(file_path)
+
+
+class ForkedPool(ProcessPoolExecutor):
+    """Process pool whose workers are forked, so they see the test's patches"""
+
+    def __init__(self, *args, **kwargs):
+        # Worker replacement needs spawned processes
+        kwargs.pop('max_tasks_per_child', None)
+        super().__init__(*args, mp_context=multiprocessing.get_context('fork'), **kwargs)
+
+
+class MediaRootMixin:
+    """Run each test against an empty, temporary MEDIA_ROOT"""
+
+    def setUp(self):
+        super().setUp()
+        self.media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.media_root)
+        override = override_settings(MEDIA_ROOT=self.media_root)
+        override.enable()
+        self.addCleanup(override.disable)
+
+    def write_file(self, relative_path, content):
+        path = os.path.join(self.media_root, relative_path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'wb') as f:
+            f.write(content)
+        return path
+
+
+class ExtractionTests(MediaRootMixin, TestCase):
+
+    def test_read_pdf(self):
+        path = self.write_file('hansards/sitting.pdf', make_pdf('Budget speech', 'Health vote'))
+        text, page_count = read_pdf(path)
+        self.assertEqual(page_count, 2)
+        self.assertIn('Budget speech', text)
+        self.assertIn('Health vote', text)
+
+    def test_unreadable_pdf(self):
+        path = self.write_file('hansards/broken.pdf', b'not a pdf')
+        with self.assertRaises(Exception):
+            read_pdf(path)
+        with self.assertLogs('chatbot.utils', 'WARNING'):
+            self.assertEqual(extract_text_from_pdf(path), '')
+
+    def test_extract_pdfs_in_worker_processes(self):
+        good = self.write_file('a.pdf', make_pdf('Loan agreement'))
+        broken = self.write_file('b.pdf', b'not a pdf')
+
+        results = {path: (text, page_count, error) for path, text, page_count, error in extract_pdfs([good, broken], workers=2)}
+
+        self.assertEqual(results[good][1:], (1, None))
+        self.assertIn('Loan agreement', results[good][0])
+        self.assertEqual(results[broken][:2], ('', None))
+        self.assertTrue(results[broken][2])
+
+    def test_files_caught_in_a_crashed_pool_are_retried(self):
+        good = [self.write_file(f'{name}.pdf', make_pdf(f'Report {name}')) for name in 'abcd']
+        crash = self.write_file('crash.pdf', make_pdf('Crash'))
+
+        with mock.patch('chatbot.extraction.read_pdf', crashing_reader), \
+                mock.patch('chatbot.extraction.ProcessPoolExecutor', ForkedPool), \
+                self.assertLogs('chatbot.extraction', 'WARNING'):
+            results = {path: error for path, text, page_count, error in extract_pdfs([crash, *good], workers=2)}
+
+        self.assertEqual(set(results), {crash, *good})
+        self.assertEqual(results[crash], 'Extraction worker crashed')
+        self.assertEqual([results[path] for path in good], [None] * 4)
+
+    def test_chunk_text(self):
+        self.assertEqual(chunk_text('short', chunk_size=10), ['short'])
+        chunks = chunk_text('abcdefghijklmnopqrstuvwxyz', chunk_size=10, overlap=3)
+        self.assertEqual(chunks[:3], ['abcdefghij', 'hijklmnopq', 'opqrstuvwx'])
+        self.assertTrue(chunks[-1].endswith('z'))
+
+
+class IngestionTests(MediaRootMixin, TestCase):
+
+    def test_ingest_document(self):
+        self.write_file('budgets/2024.pdf', make_pdf('Health allocation', 'Education allocation'))
+
+        stored, extracted = ingest_document('budgets/2024.pdf')
+
+        self.assertTrue(extracted)
+        self.assertEqual(stored.status, DocumentText.STATUS_DONE)
+        self.assertEqual(stored.page_count, 2)
+        self.assertEqual(stored.attempts, 1)
+        self.assertTrue(DocumentChunk.objects.filter(document=stored).exists())
+        self.assertEqual(search_passages('education')[0]['relative_path'], 'budgets/2024.pdf')
+        self.assertEqual(matching_document_paths('health allocation'), ['budgets/2024.pdf'])
+
+    def test_unchanged_and_duplicate_files_are_not_read_again(self):
+        content = make_pdf('Order paper')
+        self.write_file('order_papers/a.pdf', content)
+        self.write_file('order_papers/copy.pdf', content)
+        ingest_document('order_papers/a.pdf')
+
+        def reader(file_path):
+            raise AssertionError(f'{file_path} was read')
+
+        self.assertFalse(ingest_document('order_papers/a.pdf', reader=reader)[1])
+        stored, extracted = ingest_document('order_papers/copy.pdf', reader=reader)
+        self.assertFalse(extracted)
+        self.assertIn('Order paper', stored.text)
+
+    def test_failure_is_recorded(self):
+        self.write_file('reports/broken.pdf', b'not a pdf')
+
+        with self.assertRaises(Exception):
+            ingest_document('reports/broken.pdf')
+
+        stored = DocumentText.objects.get(relative_path='reports/broken.pdf')
+        self.assertEqual(stored.status, DocumentText.STATUS_FAILED)
+        self.assertEqual(stored.attempts, 1)
+        self.assertTrue(stored.last_error)
+        self.assertEqual(search_passages('broken'), [])
+
+    def test_enqueue_document(self):
+        self.write_file('hansards/sitting.pdf', make_pdf('Sitting'))
+
+        with self.captureOnCommitCallbacks() as callbacks:
+            self.assertTrue(enqueue_document('hansards/sitting.pdf'))
+            self.assertFalse(enqueue_document('hansards/notes.txt'))
+            self.assertFalse(enqueue_document('hansards/missing.pdf'))
+
+        self.assertEqual(len(callbacks), 1)
+        self.assertEqual(DocumentText.objects.get().status, DocumentText.STATUS_PENDING)
+
+        ingest_document('hansards/sitting.pdf')
+        with self.captureOnCommitCallbacks() as callbacks:
+            self.assertFalse(enqueue_document('hansards/sitting.pdf'))
+        self.assertEqual(callbacks, [])
+
+    def test_sync_document_texts(self):
+        self.write_file('a.pdf', make_pdf('First'))
+        self.write_file('b.pdf', make_pdf('Second'))
+        self.write_file('c.pdf', b'not a pdf')
+        DocumentText.objects.create(relative_path='deleted.pdf', file_size=1, file_mtime=0)
+
+        with self.assertLogs('chatbot.ingestion', 'WARNING'):
+            counts = sync_document_texts(workers=1)
+        self.assertEqual(counts, {'extracted': 2, 'unchanged': 0, 'failed': 1, 'removed': 1})
+
+        with self.assertLogs('chatbot.ingestion', 'WARNING'):
+            counts = sync_document_texts(workers=1)
+        self.assertEqual(counts, {'extracted': 0, 'unchanged': 2, 'failed': 1, 'removed': 0})
+
+    def test_stored_and_repeated_contents_are_not_extracted_again(self):
+        self.write_file('old.pdf', make_pdf('Old report'))
+        ingest_document('old.pdf')
+        self.write_file('old_copy.pdf', make_pdf('Old report'))
+        self.write_file('new.pdf', make_pdf('New report'))
+        self.write_file('new_copy.pdf', make_pdf('New report'))
+
+        with mock.patch('chatbot.ingestion.extract_pdfs', wraps=extract_pdfs) as extract:
+            counts = sync_document_texts(workers=2)
+
+        [extracted_paths] = [list(call.args[0]) for call in extract.call_args_list]
+        self.assertEqual([os.path.basename(path) for path in extracted_paths], ['new.pdf'])
+        self.assertEqual(counts, {'extracted': 1, 'unchanged': 3, 'failed': 0, 'removed': 0})
+        self.assertIn('New report', DocumentText.objects.get(relative_path='new_copy.pdf').text)
+
+
+class StubStream:
+    """What client.messages.stream() returns: a context manager with a text_stream"""
+
+    def __init__(self, chunks, error):
+        self.chunks = chunks
+        self.error = error
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    @property
+    def text_stream(self):
+        yield from self.chunks
+        if self.error:
+            raise self.error
+
+
+class StubMessages:
+
+    def __init__(self, chunks, error):
+        self.chunks = chunks
+        self.error = error
+        self.calls = []
+
+    def create(self, **kwargs):
+        self.calls.append(kwargs)
+        if self.error:
+            raise self.error
+        return SimpleNamespace(content=[SimpleNamespace(text=''.join(self.chunks))])
+
+    def stream(self, **kwargs):
+        self.calls.append(kwargs)
+        return StubStream(self.chunks, self.error)
+
+
+class AsyncStubStream(StubStream):
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    @property
+    async def text_stream(self):
+        for chunk in self.chunks:
+            yield chunk
+        if self.error:
+            raise self.error
+
+
+class AsyncStubMessages(StubMessages):
+
+    async def create(self, **kwargs):
+        return super().create(**kwargs)
+
+    def stream(self, **kwargs):
+        self.calls.append(kwargs)
+        return AsyncStubStream(self.chunks, self.error)
+
+
+class StubClient:
+    """Stands in for anthropic.Anthropic, answering with the given text chunks"""
+
+    def __init__(self, chunks=('The budget ', 'was passed.'), error=None):
+        self.messages = StubMessages(list(chunks), error)
+
+
+class AsyncStubClient:
+    """Stands in for anthropic.AsyncAnthropic"""
+
+    def __init__(self, chunks=('The budget ', 'was passed.'), error=None):
+        self.messages = AsyncStubMessages(list(chunks), error)
+
+
+def parse_events(content):
+    """(event, data) pairs of a server-sent event stream"""
+    events = []
+    for block in content.decode().split('\n\n'):
+        if block:
+            event, data = block.split('\n')
+            events.append((event.removeprefix('event: '), json.loads(data.removeprefix('data: '))))
+    return events
+
+
+class ChatbotTestMixin:
+    """A readable document to answer from and a stubbed Anthropic client"""
+
+    def setUp(self):
+        super().setUp()
+        caches['chatbot'].clear()
+        document = DocumentText.objects.create(
+            relative_path='budgets/budget_speech.pdf', file_size=1, file_mtime=0,
+            text='The national budget was passed by Parliament.', status=DocumentText.STATUS_DONE
+        )
+        index_document_text(document)
+        self.stub = StubClient()
+        self.async_stub = AsyncStubClient()
+        for patcher in [
+            mock.patch.dict(os.environ, {'CLAUDE_API_KEY': 'test-key'}),
+            mock.patch('chatbot.views.HAS_ANTHROPIC', True),
+            mock.patch('chatbot.views.get_client', lambda api_key: self.stub),
+            mock.patch('chatbot.views.get_async_client', lambda api_key: self.async_stub),
+        ]:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def chat(self, url='/api/chatbot/chat/', **data):
+        return self.client.post(url, data, content_type='application/json', HTTP_ACCEPT='text/event-stream')
+
+
+class EventStreamTests(ChatbotTestMixin, TestCase):
+
+    def test_event_stream_is_negotiated(self):
+        response = self.chat(query='Was the budget passed?')
+
+        self.assertEqual(response['Content-Type'], 'text/event-stream')
+        self.assertEqual(response['Cache-Control'], 'no-cache')
+        events = parse_events(b''.join(response.streaming_content))
+
+        self.assertEqual([event for event, data in events], ['meta', 'token', 'token', 'done'])
+        # A passage was found, so the model is asked for a full answer
+        self.assertEqual(self.stub.messages.calls[0]['max_tokens'], 500)
+        meta, done = events[0][1], events[-1][1]
+        self.assertEqual(meta['document_name'], 'Budget Speech')
+        self.assertEqual(meta['session_id'], done['session_id'])
+        self.assertEqual([data['text'] for event, data in events[1:3]], ['The budget ', 'was passed.'])
+        self.assertEqual(done['answer'], 'The budget was passed.')
+        self.assertEqual(ChatMessage.objects.get(role='assistant').content, 'The budget was passed.')
+
+    def test_stream_flag_without_accept_header(self):
+        response = self.client.post(
+            '/api/chatbot/chat/', {'query': 'Was the budget passed?', 'stream': True}, content_type='application/json'
+        )
+        self.assertEqual(response['Content-Type'], 'text/event-stream')
+        self.assertEqual(parse_events(b''.join(response.streaming_content))[-1][0], 'done')
+
+    def test_json_without_streaming(self):
+        response = self.client.post('/api/chatbot/chat/', {'query': 'Was the budget passed?'}, content_type='application/json')
+        self.assertEqual(response['Content-Type'], 'application/json')
+        self.assertEqual(response.json()['answer'], 'The budget was passed.')
+
+    def test_error_event(self):
+        self.stub = StubClient(chunks=['The budget '], error=RuntimeError('overloaded'))
+
+        events = parse_events(b''.join(self.chat(query='Was the budget passed?').streaming_content))
+
+        self.assertEqual([event for event, data in events], ['meta', 'token', 'error'])
+        self.assertIn('overloaded', events[-1][1]['error'])
+        self.assertFalse(ChatMessage.objects.filter(role='assistant').exists())
+
+    def test_invalid_request_is_rendered_as_an_event(self):
+        response = self.chat(query='')
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response['Content-Type'], 'text/event-stream; charset=utf-8')
+        [(event, data)] = parse_events(response.content)
+        self.assertEqual(event, 'error')
+        self.assertIn('query', data)
+
+
+class AsyncChatbotTests(ChatbotTestMixin, TestCase):
+    url = '/api/chatbot/chat/async/'
+
+    async def test_answer(self):
+        response = await self.async_client.post(self.url, {'query': 'Was the budget passed?'}, content_type='application/json')
+
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(data['answer'], 'The budget was passed.')
+        self.assertEqual(data['document_name'], 'Budget Speech')
+        self.assertEqual(await ChatMessage.objects.filter(role='assistant').acount(), 1)
+
+    async def test_event_stream(self):
+        response = await self.async_client.post(
+            self.url, {'query': 'Was the budget passed?'}, content_type='application/json', headers={'Accept': 'text/event-stream'}
+        )
+
+        self.assertEqual(response['Content-Type'], 'text/event-stream')
+        events = parse_events(b''.join([chunk async for chunk in response.streaming_content]))
+        self.assertEqual([event for event, data in events], ['meta', 'token', 'token', 'done'])
+        self.assertEqual(events[-1][1]['answer'], 'The budget was passed.')
+
+    async def test_error_event(self):
+        self.async_stub = AsyncStubClient(error=RuntimeError('overloaded'))
+
+        response = await self.async_client.post(
+            self.url, {'query': 'Was the budget passed?', 'stream': True}, content_type='application/json'
+        )
+
+        events = parse_events(b''.join([chunk async for chunk in response.streaming_content]))
+        self.assertEqual([event for event, data in events][-1], 'error')
+        self.assertFalse(await ChatMessage.objects.filter(role='assistant').aexists())
+
+    async def test_invalid_body(self):
+        response = await self.async_client.post(self.url, b'[1, 2]', content_type='application/json')
+        self.assertEqual(response.status_code, 400)
+
+
+class AnswerCacheTests(ChatbotTestMixin, TestCase):
+
+    def ask(self, query, **data):
+        response = self.client.post('/api/chatbot/chat/', {'query': query, **data}, content_type='application/json')
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def test_repeated_question_is_answered_from_the_cache(self):
+        first = self.ask('Was the budget passed?')
+        again = self.ask('  was the BUDGET passed ')
+
+        self.assertEqual(len(self.stub.messages.calls), 1)
+        self.assertEqual(again['answer'], first['answer'])
+        self.assertEqual(again['sources'], first['sources'])
+        self.assertNotEqual(again['session_id'], first['session_id'])
+
+    def test_follow_up_is_not_answered_from_the_cache(self):
+        session_id = self.ask('Was the budget passed?')['session_id']
+        self.ask('Was the budget passed?', session_id=session_id)
+        self.assertEqual(len(self.stub.messages.calls), 2)
+
+    def test_corpus_change_invalidates_answers(self):
+        key = answer_cache_key('Was the budget passed?')
+        self.ask('Was the budget passed?')
+
+        document = DocumentText.objects.get()
+        document.text = 'The national budget was rejected.'
+        document.save()
+        self.assertNotEqual(answer_cache_key('Was the budget passed?'), key)
+        self.ask('Was the budget passed?')
+        self.assertEqual(len(self.stub.messages.calls), 2)
+
+        version = get_corpus_version()
+        DocumentText.objects.create(relative_path='hansards/sitting.pdf', file_size=1, file_mtime=0)
+        self.assertNotEqual(get_corpus_version(), version)
+        self.ask('Was the budget passed?')
+        self.assertEqual(len(self.stub.messages.calls), 3)
+
+
+class SmallTalkTests(ChatbotTestMixin, TestCase):
+
+    def test_detect_intent(self):
+        self.assertEqual(detect_intent('Hello!'), 'greeting')
+        self.assertEqual(detect_intent('Hi there, chatbot'), 'greeting')
+        self.assertEqual(detect_intent('Thank you so much!'), 'appreciation')
+        self.assertEqual(detect_intent('ok thanks, bye'), 'farewell')
+        self.assertEqual(detect_intent('Who are you?'), 'identity')
+        self.assertIsNone(detect_intent(''))
+        self.assertIsNone(detect_intent('?!'))
+
+    def test_questions_with_filler_words_are_not_small_talk(self):
+        for message in [
+            'Hello, who is the speaker?',
+            'Thanks, and what about the budget for this year?',
+            'Please help me find the loan agreement',
+            'What is the bill for that?',
+        ]:
+            self.assertIsNone(detect_intent(message), message)
+
+    def test_reply_uses_the_conversation(self):
+        history = [{'user': 'Was the budget passed?', 'assistant': 'Yes.'}]
+        self.assertIn('"Was the budget passed"', smalltalk_reply('thanks!', history)[1])
+        self.assertIn(smalltalk_reply('hello', history)[1], RESPONSES['greeting_returning'])
+
+    def test_small_talk_does_not_reach_the_model(self):
+        with mock.patch('chatbot.views.search_passages') as search:
+            for message in ['Hello!', 'thank you very much', 'bye']:
+                response = self.client.post('/api/chatbot/chat/', {'query': message}, content_type='application/json')
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual(response.json()['confidence'], 1.0)
+
+        search.assert_not_called()
+        self.assertEqual(self.stub.messages.calls, [])
+        self.assertEqual(ChatMessage.objects.filter(role='assistant').count(), 3)
+
+    def test_question_with_filler_words_reaches_retrieval(self):
+        with mock.patch('chatbot.views.search_passages', wraps=search_passages) as search:
+            response = self.client.post(
+                '/api/chatbot/chat/', {'query': 'Hello, was the budget passed please?'}, content_type='application/json'
+            )
+
+        search.assert_called_once_with('Hello, was the budget passed please?')
+        self.assertEqual(response.json()['answer'], 'The budget was passed.')
+        self.assertEqual(len(self.stub.messages.calls), 1)
@@ -1,9 +1,10 @@
 from django.urls import path
-from .views import ChatbotView
+from .views import AsyncChatbotView, ChatbotView
 
 app_name = 'chatbot'
 
 urlpatterns = [
     path('chat/', ChatbotView.as_view(), name='chat'),
+    path('chat/async/', AsyncChatbotView.as_view(), name='chat-async'),
 ]
 
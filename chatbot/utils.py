@@ -0,0 +1,103 @@
+"""
+Utility functions for the chatbot app
+"""
+import hashlib
+import logging
+import os
+from pathlib import Path
+from django.conf import settings
+from main.utils import get_media_base_url
+
+try:
+    from PyPDF2 import PdfReader
+except ImportError:
+    PdfReader = None
+
+logger = logging.getLogger(__name__)
+
+
+def read_pdf(file_path):
+    """
+    Extract text and page count from a PDF file.
+
+    Unlike extract_text_from_pdf(), errors are raised so callers can record and retry them.
+
+    Returns:
+        Tuple of (text, page_count)
+    """
+    reader = PdfReader(file_path)
+    text = "\n".join(page.extract_text() or "" for page in reader.pages)
+    return text.strip(), len(reader.pages)
+
+
+def extract_text_from_pdf(file_path):
+    """Extract text from a PDF file"""
+    try:
+        text, _ = read_pdf(file_path)
+        return text
+    except Exception as e:
+        logger.warning(f"Error reading PDF {file_path}: {e}")
+        return ""
+
+
+def build_document(relative_path):
+    """Build the document dict (name, path, relative_path, url) for a PDF in the media folder"""
+    file_name = os.path.basename(relative_path)
+
+    return {
+        # Create a readable name from filename
+        'name': file_name.replace('.pdf', '').replace('_', ' ').replace('-', ' ').title(),
+        'path': os.path.join(settings.MEDIA_ROOT, relative_path),
+        'relative_path': relative_path,
+        'url': f"{get_media_base_url()}/{relative_path}",
+    }
+
+
+def get_documents_from_media():
+    """
+    Scan entire media folder and return list of PDF documents.
+
+    This walks every file under MEDIA_ROOT, so it is only used to diff the folder
+    against the document text store; questions are answered from the store itself.
+    """
+    documents = []
+    media_path = Path(settings.MEDIA_ROOT)
+
+    # Walk through entire media folder (not just chatbot/documents)
+    for root, dirs, files in os.walk(media_path):
+        for file in files:
+            if file.lower().endswith('.pdf'):
+                documents.append(build_document(os.path.relpath(Path(root) / file, media_path)))
+
+    return documents
+
+
+def chunk_text(text, chunk_size=8000, overlap=200):
+    """Split text into chunks for processing"""
+    if len(text) <= chunk_size:
+        return [text]
+
+    chunks = []
+    start = 0
+    while start < len(text):
+        end = start + chunk_size
+        chunk = text[start:end]
+        chunks.append(chunk)
+        start = end - overlap
+
+    return chunks
+
+
+def get_file_signature(file_path):
+    """Return (size, mtime) for a file, used to detect changes without reading it"""
+    stat = os.stat(file_path)
+    return stat.st_size, stat.st_mtime
+
+
+def hash_file(file_path, block_size=1024 * 1024):
+    """Return the SHA-256 hex digest of a file's contents"""
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for block in iter(lambda: f.read(block_size), b''):
+            digest.update(block)
+    return digest.hexdigest()
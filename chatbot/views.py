@@ -1,96 +1,29 @@
-import os
-import re
-from pathlib import Path
-from django.conf import settings
-from django.http import JsonResponse
+import json
+from asgiref.sync import sync_to_async
+from django.http import JsonResponse, StreamingHttpResponse
+from django.utils.decorators import method_decorator
+from django.views import View
+from django.views.decorators.csrf import csrf_exempt
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
+from rest_framework.settings import api_settings
 from decouple import config
+from .renderers import EventStreamRenderer
 from .serializers import ChatbotQuerySerializer, ChatbotResponseSerializer
-from .models import Document, ChatConversation, ChatMessage
+from .models import ChatConversation, ChatMessage, DocumentText
+from .utils import build_document
+from .retrieval import search_passages
+from .clients import HAS_ANTHROPIC, get_async_client, get_client
+from .answer_cache import answer_cache_key, cache_answer, get_cached_answer
+from .smalltalk import smalltalk_reply
 
-try:
-    import anthropic
-    from PyPDF2 import PdfReader
-    HAS_DEPENDENCIES = True
-except ImportError:
-    HAS_DEPENDENCIES = False
+CLAUDE_MODEL = "claude-3-haiku-20240307"  # Cheapest Claude model
 
 
-def extract_text_from_pdf(file_path):
-    """Extract text from a PDF file"""
-    try:
-        reader = PdfReader(file_path)
-        text = ""
-        for page in reader.pages:
-            text += page.extract_text() + "\n"
-        return text.strip()
-    except Exception as e:
-        print(f"Error reading PDF {file_path}: {str(e)}")
-        return ""
-
-
-def get_documents_from_media():
-    """Scan entire media folder and return list of PDF documents"""
-    documents = []
-    media_path = Path(settings.MEDIA_ROOT)
-    
-    # Walk through entire media folder (not just chatbot/documents)
-    for root, dirs, files in os.walk(media_path):
-        for file in files:
-            if file.lower().endswith('.pdf'):
-                file_path = Path(root) / file
-                relative_path = os.path.relpath(file_path, media_path)
-                
-                # Create a readable name from filename
-                name = file.replace('.pdf', '').replace('_', ' ').replace('-', ' ').title()
-                
-                # Build URL - use full backend URL from settings
-                full_media_url = getattr(settings, 'FULL_MEDIA_URL', None)
-                if full_media_url:
-                    # Remove trailing slash if present, then add relative path
-                    full_media_url = full_media_url.rstrip('/')
-                    url = f"{full_media_url}/{relative_path}"
-                else:
-                    # Fallback: construct from MEDIA_URL
-                    if settings.DEBUG:
-                        url = f"http://localhost:8000{settings.MEDIA_URL}{relative_path}"
-                    else:
-                        # In production, try to get from environment or use default
-                        backend_domain = config('BACKEND_DOMAIN', default='https://pwatch-backend-production.up.railway.app')
-                        url = f"{backend_domain}{settings.MEDIA_URL}{relative_path}"
-                
-                documents.append({
-                    'name': name,
-                    'path': str(file_path),
-                    'relative_path': relative_path,
-                    'url': url,
-                })
-    
-    return documents
-
-
-def chunk_text(text, chunk_size=8000, overlap=200):
-    """Split text into chunks for processing"""
-    if len(text) <= chunk_size:
-        return [text]
-    
-    chunks = []
-    start = 0
-    while start < len(text):
-        end = start + chunk_size
-        chunk = text[start:end]
-        chunks.append(chunk)
-        start = end - overlap
-    
-    return chunks
-
-
-class ChatbotView(APIView):
+class ChatbotMixin:
     """
-    Chatbot endpoint that answers questions based on documents in the media folder.
-    Uses Claude API for intelligent responses.
+    Conversation, retrieval and response helpers shared by the sync and async chatbot views
     """
     
     def get_client_ip(self, request):
@@ -102,10 +35,10 @@ class ChatbotView(APIView):
             ip = request.META.get('REMOTE_ADDR')
         return ip
     
-    def get_or_create_conversation(self, request):
+    def get_or_create_conversation(self, request, data):
         """Get or create a conversation for the current session"""
         # Get session ID from request data or generate one
-        session_id = request.data.get('session_id') or request.session.session_key
+        session_id = data.get('session_id') or request.session.session_key
         if not session_id:
             # Generate a session ID if none exists
             import uuid
@@ -165,239 +98,57 @@ class ChatbotView(APIView):
         
         return history
     
-    def is_greeting(self, query):
-        """Check if the query is a greeting"""
-        query_lower = query.lower().strip()
-        greetings = [
-            'hello', 'hi', 'hey', 'greetings', 'good morning', 'good afternoon',
-            'good evening', 'good day', 'howdy', 'what\'s up', 'whats up',
-            'how are you', 'how do you do', 'nice to meet you', 'pleased to meet you'
-        ]
-        
-        # Check if query is just a greeting (with optional punctuation)
-        query_clean = re.sub(r'[^\w\s]', '', query_lower)
-        words = query_clean.split()
-        
-        # If query is very short (1-3 words) and contains a greeting word
-        if len(words) <= 3:
-            for greeting in greetings:
-                if greeting in query_lower:
-                    return True
-        
-        return False
+    def build_history_context(self, history):
+        """Build the prompt section describing previous exchanges"""
+        history_context = ""
+        if history:
+            history_context = "\n\nPrevious conversation context:\n"
+            for i, pair in enumerate(history, 1):
+                history_context += f"\nPrevious exchange {i}:\n"
+                history_context += f"User: {pair['user']}\n"
+                history_context += f"Assistant: {pair['assistant']}\n"
+            history_context += "\nUse this context to provide more relevant and coherent responses.\n"
+        return history_context
     
-    def is_appreciation(self, query):
-        """Check if the query is an appreciation/thanks"""
-        query_lower = query.lower().strip()
-        appreciations = [
-            'thank you', 'thanks', 'thank', 'appreciate', 'appreciated', 'grateful',
-            'much appreciated', 'thanks a lot', 'thank you very much', 'thanks so much',
-            'thanks a bunch', 'i appreciate', 'i\'m grateful', 'im grateful'
-        ]
-        
-        # Check if query is just an appreciation (with optional punctuation)
-        query_clean = re.sub(r'[^\w\s]', '', query_lower)
-        words = query_clean.split()
-        
-        # If query is very short (1-4 words) and contains an appreciation word
-        if len(words) <= 4:
-            for appreciation in appreciations:
-                if appreciation in query_lower:
-                    return True
-        
-        return False
+    def build_messages(self, history, prompt):
+        """Build the Claude messages array: conversation history followed by the prompt"""
+        messages = []
+        for pair in history:
+            messages.append({"role": "user", "content": pair['user']})
+            messages.append({"role": "assistant", "content": pair['assistant']})
+        messages.append({"role": "user", "content": prompt})
+        return messages
     
-    def post(self, request):
-        if not HAS_DEPENDENCIES:
-            return Response(
-                {'error': 'Required dependencies not installed. Please install: anthropic, PyPDF2'},
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR
-            )
+    def plan_answer(self, query, history):
+        """
+        Work out how to answer a query, without calling the model yet.
         
-        serializer = ChatbotQuerySerializer(data=request.data)
-        if not serializer.is_valid():
-            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
-        
-        query = serializer.validated_data['query']
-        
-        # Get or create conversation
-        conversation, session_id = self.get_or_create_conversation(request)
-        
-        # Save user message
-        user_message = ChatMessage.objects.create(
-            conversation=conversation,
-            role='user',
-            content=query
-        )
-        
-        # Get conversation history (last 5 message pairs)
-        history = self.get_conversation_history(conversation, limit=5)
-        
-        # Get Claude API key from environment
-        claude_api_key = config('CLAUDE_API_KEY', default=None)
-        if not claude_api_key:
-            return Response(
-                {'error': 'Claude API key not configured. Please set CLAUDE_API_KEY in your environment variables.'},
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR
-            )
+        Returns:
+            Dict with the Claude 'messages' and 'max_tokens' plus the response metadata
+            ('document_name', 'document_url', 'sources', 'confidence'), or a Response
+            if the query cannot be answered
+        """
+        history_context = self.build_history_context(history)
         
-        try:
-            # Initialize Claude client
-            client = anthropic.Anthropic(api_key=claude_api_key)
-            
-            # Build conversation history context
-            history_context = ""
-            if history:
-                history_context = "\n\nPrevious conversation context:\n"
-                for i, pair in enumerate(history, 1):
-                    history_context += f"\nPrevious exchange {i}:\n"
-                    history_context += f"User: {pair['user']}\n"
-                    history_context += f"Assistant: {pair['assistant']}\n"
-                history_context += "\nUse this context to provide more relevant and coherent responses.\n"
-            
-            # Check if query is a pure greeting or appreciation (no question)
-            is_pure_greeting = self.is_greeting(query) and not any(word in query.lower() for word in ['what', 'when', 'where', 'who', 'why', 'how', 'which', 'tell', 'explain', 'show', 'find', 'search'])
-            is_pure_appreciation = self.is_appreciation(query) and not any(word in query.lower() for word in ['what', 'when', 'where', 'who', 'why', 'how', 'which', 'tell', 'explain', 'show', 'find', 'search'])
-            
-            # Handle pure greetings/appreciations without document search
-            if is_pure_greeting or is_pure_appreciation:
-                # Build prompt for pure greetings/appreciations
-                if is_pure_greeting:
-                    prompt = f"""You are a helpful and friendly assistant for Parliament Watch Uganda. You help users find information about parliamentary proceedings, bills, and documents.
-{history_context}
-The user has sent a greeting: {query}
-
-Respond warmly and naturally to the greeting. Introduce yourself as the Parliament Watch Uganda chatbot and offer to help with questions about the Ugandan Parliament, bills, parliamentary proceedings, or related documents. Be friendly, professional, and welcoming. Keep your response concise (under 100 words)."""
-                else:  # is_pure_appreciation
-                    prompt = f"""You are a helpful and friendly assistant for Parliament Watch Uganda.
-{history_context}
-The user has expressed appreciation: {query}
-
-Respond warmly and naturally to the appreciation. Acknowledge their thanks and offer further assistance if they have more questions about the Ugandan Parliament. Be friendly and professional. Keep your response concise (under 100 words)."""
-                
-                # Build messages array with conversation history
-                messages = []
-                for pair in history:
-                    messages.append({"role": "user", "content": pair['user']})
-                    messages.append({"role": "assistant", "content": pair['assistant']})
-                
-                messages.append({"role": "user", "content": prompt})
-                
-                answer_response = client.messages.create(
-                    model="claude-3-haiku-20240307",
-                    max_tokens=200,
-                    messages=messages
-                )
-                
-                answer = answer_response.content[0].text.strip()
-                
-                # Save assistant message
-                assistant_message = ChatMessage.objects.create(
-                    conversation=conversation,
-                    role='assistant',
-                    content=answer
-                )
-                
-                response_data = {
-                    'answer': answer,
-                    'document_name': '',
-                    'document_url': '',
-                    'confidence': 1.0,
-                    'session_id': session_id
-                }
-                
-                response_serializer = ChatbotResponseSerializer(data=response_data)
-                if response_serializer.is_valid():
-                    return Response(response_serializer.validated_data, status=status.HTTP_200_OK)
-                else:
-                    return Response(response_data, status=status.HTTP_200_OK)
-            
-            # For questions (with or without greetings/appreciations), proceed with document search
-            # Get all PDF documents from entire media folder
-            documents = get_documents_from_media()
-            
-            if not documents:
+        # The document text store is the manifest of PDFs in the media folder, kept up to
+        # date by the ingestion pipeline, so no filesystem scan is needed per question
+        if not DocumentText.objects.filter(status=DocumentText.STATUS_DONE).exists():
+            if not DocumentText.objects.exists():
                 return Response(
                     {'error': 'No PDF documents found in media folder'},
                     status=status.HTTP_404_NOT_FOUND
                 )
-            
-            # Extract text from all documents and find the most relevant one
-            document_contents = []
-            for doc in documents:
-                text = extract_text_from_pdf(doc['path'])
-                if text:
-                    # Take first 10000 characters for relevance check
-                    preview = text[:10000]
-                    document_contents.append({
-                        'name': doc['name'],
-                        'path': doc['path'],
-                        'relative_path': doc['relative_path'],
-                        'url': doc.get('url', ''),  # Include URL for later use
-                        'preview': preview,
-                        'full_text': text
-                    })
-            
-            if not document_contents:
-                return Response(
-                    {'error': 'No readable text found in documents'},
-                    status=status.HTTP_404_NOT_FOUND
-                )
-            
-            # Use Claude to find the most relevant document
-            doc_summaries = "\n\n".join([
-                f"Document {i+1}: {doc['name']}\nPreview: {doc['preview'][:500]}..."
-                for i, doc in enumerate(document_contents)
-            ])
-            
-            relevance_prompt = f"""You are a document search assistant for Parliament Watch Uganda. You need to find documents related to the Ugandan Parliament, political parties, MPs, bills, or parliamentary proceedings.
-
-User Question: {query}
-
-Available Documents:
-{doc_summaries}
-
-IMPORTANT: 
-- Only select documents that are clearly related to parliamentary matters, Ugandan politics, MPs, bills, or political parties.
-- If a document is clearly about unrelated topics (programming, general topics, etc.) and the question is about parliamentary matters, respond with "0".
-- If no document is relevant to the parliamentary question, respond with "0".
-- Otherwise, respond with ONLY the document number (1, 2, 3, etc.) that is most relevant."""
-                        
-            relevance_response = client.messages.create(
-                model="claude-3-haiku-20240307",  # Cheapest Claude model
-                max_tokens=10,
-                messages=[{"role": "user", "content": relevance_prompt}]
+            return Response(
+                {'error': 'No readable text found in documents'},
+                status=status.HTTP_404_NOT_FOUND
             )
-            
-            selected_doc_num = relevance_response.content[0].text.strip()
-            
-            # Parse document number
-            doc_index = -1
-            try:
-                doc_num = int(re.search(r'\d+', selected_doc_num).group())
-                if doc_num == 0:
-                    # No relevant document found
-                    doc_index = -1
-                else:
-                    doc_index = doc_num - 1
-                    if doc_index < 0 or doc_index >= len(document_contents):
-                        doc_index = -1
-            except:
-                doc_index = -1
-            
-            # If no relevant document found, respond directly without document
-            if doc_index == -1:
-                # Build conversation history context
-                history_context = ""
-                if history:
-                    history_context = "\n\nPrevious conversation context:\n"
-                    for i, pair in enumerate(history, 1):
-                        history_context += f"\nPrevious exchange {i}:\n"
-                        history_context += f"User: {pair['user']}\n"
-                        history_context += f"Assistant: {pair['assistant']}\n"
-                    history_context += "\nUse this context to provide more relevant and coherent responses.\n"
-                
-                no_doc_prompt = f"""You are a helpful assistant for Parliament Watch Uganda. You answer questions about the Ugandan Parliament, political parties, MPs, bills, and parliamentary proceedings.
+        
+        # Pull the top-k most relevant passages from the retrieval index
+        passages = search_passages(query)
+        
+        # If no relevant passage found, respond directly without document
+        if not passages:
+            no_doc_prompt = f"""You are a helpful assistant for Parliament Watch Uganda. You answer questions about the Ugandan Parliament, political parties, MPs, bills, and parliamentary proceedings.
 {history_context}
 User question: {query}
 
@@ -412,64 +163,43 @@ Do NOT:
 - Be verbose
 
 Just state simply that the information wasn't found."""
-                
-                # Build messages array with conversation history
-                messages = []
-                for pair in history:
-                    messages.append({"role": "user", "content": pair['user']})
-                    messages.append({"role": "assistant", "content": pair['assistant']})
-                
-                messages.append({"role": "user", "content": no_doc_prompt})
-                
-                answer_response = client.messages.create(
-                    model="claude-3-haiku-20240307",
-                    max_tokens=100,
-                    messages=messages
-                )
-                
-                answer = answer_response.content[0].text.strip()
-                
-                # Save assistant message
-                assistant_message = ChatMessage.objects.create(
-                    conversation=conversation,
-                    role='assistant',
-                    content=answer
-                )
-                
-                response_data = {
-                    'answer': answer,
-                    'document_name': '',
-                    'document_url': '',
-                    'confidence': 0.3,
-                    'session_id': session_id
-                }
-                
-                response_serializer = ChatbotResponseSerializer(data=response_data)
-                if response_serializer.is_valid():
-                    return Response(response_serializer.validated_data, status=status.HTTP_200_OK)
-                else:
-                    return Response(response_data, status=status.HTTP_200_OK)
             
-            selected_doc = document_contents[doc_index]
-            
-            # Generate answer using the selected document with enhanced prompt
-            answer_prompt = f"""You are a helpful assistant for Parliament Watch Uganda. You answer questions about the Ugandan Parliament, political parties, MPs, bills, and parliamentary proceedings.
+            return {
+                'messages': self.build_messages(history, no_doc_prompt),
+                'max_tokens': 100,
+                'document_name': '',
+                'document_url': '',
+                'sources': [],
+                'confidence': 0.3,
+            }
+        
+        # Collect the source documents in order of their best passage
+        documents_by_path = {}
+        for passage in passages:
+            if passage['relative_path'] not in documents_by_path:
+                documents_by_path[passage['relative_path']] = build_document(passage['relative_path'])
+        sources = list(documents_by_path.values())
+        
+        passages_context = "\n\n".join([
+            f"Passage {i}: (from {documents_by_path[passage['relative_path']]['name']})\n{passage['text']}"
+            for i, passage in enumerate(passages, 1)
+        ])
+        
+        # Generate answer using the retrieved passages with enhanced prompt
+        answer_prompt = f"""You are a helpful assistant for Parliament Watch Uganda. You answer questions about the Ugandan Parliament, political parties, MPs, bills, and parliamentary proceedings.
 {history_context}
 User question: {query}
 
-I have searched through parliamentary documents and found this document:
-
-Document: {selected_doc['name']}
+I have searched through parliamentary documents and found these passages:
 
-Document Content:
-{selected_doc['full_text'][:100000]}
+{passages_context}
 
 CRITICAL INSTRUCTIONS:
 1. **Answer the question directly** - Do NOT start with greetings, introductions, or pleasantries. The user has already asked a question, so answer it immediately.
 
-2. **Check document relevance** - If the document content is clearly not related to the question (e.g., programming, unrelated topics), state simply: "I couldn't find information about [topic] in the available parliamentary documents."
+2. **Check passage relevance** - If the passages are clearly not related to the question (e.g., programming, unrelated topics), state simply: "I couldn't find information about [topic] in the available parliamentary documents."
 
-3. **If information is found** - Provide a clear, direct answer based on the document. Do not mention the document name or that you searched documents. Answer as if you know this information.
+3. **If information is found** - Provide a clear, direct answer based on the passages. Do not mention the document names or that you searched documents. Answer as if you know this information.
 
 4. **If information is NOT found** - Simply state: "I couldn't find information about [specific topic] in the available parliamentary documents." Keep it brief (1-2 sentences). Do not apologize excessively.
 
@@ -481,61 +211,328 @@ CRITICAL INSTRUCTIONS:
 
 Now answer the user's question directly:"""
 
-            # Build messages array with conversation history for Claude
-            messages = []
+        # The document with the best-ranked passage is the primary source
+        selected_doc = sources[0]
+        
+        return {
+            'messages': self.build_messages(history, answer_prompt),
+            'max_tokens': 500,
+            'document_name': selected_doc['name'],
+            'document_url': selected_doc['url'],
+            'sources': [{'name': doc['name'], 'url': doc['url']} for doc in sources],
+            'confidence': 0.8,  # Simple confidence score
+        }
+    
+    def prepare_answer(self, request, data, query):
+        """
+        Record the user's message and plan the answer.
+        
+        Returns:
+            Tuple of (conversation, session_id, plan) where plan is the result of plan_answer,
+            or the response fields including 'answer' for small talk and repeated questions
+        """
+        # Get or create conversation
+        conversation, session_id = self.get_or_create_conversation(request, data)
+        
+        # Save user message
+        ChatMessage.objects.create(
+            conversation=conversation,
+            role='user',
+            content=query
+        )
+        
+        # Get conversation history (last 5 message pairs)
+        history = self.get_conversation_history(conversation, limit=5)
+        
+        # Greetings, thanks and other small talk are answered locally
+        smalltalk = smalltalk_reply(query, history)
+        if smalltalk:
+            return conversation, session_id, {
+                'answer': smalltalk[1],
+                'document_name': '',
+                'document_url': '',
+                'sources': [],
+                'confidence': 1.0,
+            }
+        
+        # Questions that open a conversation are answered from the cache when repeated;
+        # follow-ups depend on the earlier exchanges so they always go to the model
+        cache_key = None if history else answer_cache_key(query)
+        if cache_key:
+            cached = get_cached_answer(cache_key)
+            if cached:
+                return conversation, session_id, cached
+        
+        plan = self.plan_answer(query, history)
+        if cache_key and not isinstance(plan, Response):
+            plan['cache_key'] = cache_key
+        return conversation, session_id, plan
+    
+    def save_answer(self, conversation, answer, plan):
+        """Save the assistant message for an answer, caching it if the plan allows"""
+        if plan.get('cache_key'):
+            cache_answer(plan['cache_key'], answer, plan)
+        
+        return ChatMessage.objects.create(
+            conversation=conversation,
+            role='assistant',
+            content=answer,
+            document_name=plan['document_name'] or None,
+            document_url=plan['document_url'] or None
+        )
+    
+    def build_response_data(self, answer, plan, session_id):
+        """Build the response payload for an answer"""
+        response_data = {
+            'answer': answer,
+            'document_name': plan['document_name'],
+            'document_url': plan['document_url'],
+            'confidence': plan['confidence'],
+            'session_id': session_id  # Return session_id for frontend to use
+        }
+        if plan['sources']:
+            response_data['sources'] = plan['sources']
+        
+        response_serializer = ChatbotResponseSerializer(data=response_data)
+        if response_serializer.is_valid():
+            return response_serializer.validated_data
+        return response_data
+    
+    def wants_stream(self, request, validated_data):
+        """Stream when asked for in the body or when the client accepts server-sent events"""
+        return validated_data.get('stream') or 'text/event-stream' in request.META.get('HTTP_ACCEPT', '')
+    
+    def format_event(self, event, data):
+        """Format a server-sent event with a JSON payload"""
+        return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+    
+    def meta_event(self, plan, session_id):
+        """The first server-sent event of a streamed answer"""
+        return self.format_event('meta', {
+            'session_id': session_id,
+            'document_name': plan['document_name'],
+            'document_url': plan['document_url'],
+            'sources': plan['sources'],
+            'confidence': plan['confidence'],
+        })
+    
+    def answer_events(self, answer, plan, session_id):
+        """Server-sent events for an answer that is already complete"""
+        return [
+            self.meta_event(plan, session_id),
+            self.format_event('token', {'text': answer}),
+            self.format_event('done', self.build_response_data(answer, plan, session_id)),
+        ]
+    
+    def event_stream_response(self, events):
+        """Wrap an iterator (or async iterator) of server-sent events in a streaming response"""
+        response = StreamingHttpResponse(events, content_type='text/event-stream')
+        response['Cache-Control'] = 'no-cache'
+        response['X-Accel-Buffering'] = 'no'  # Stop reverse proxies from buffering the stream
+        return response
+
+
+class ChatbotView(ChatbotMixin, APIView):
+    """
+    Chatbot endpoint that answers questions based on documents in the media folder.
+    Uses Claude API for intelligent responses.
+    Send "stream": true (or Accept: text/event-stream) to receive the answer as server-sent events.
+    """
+    renderer_classes = [*api_settings.DEFAULT_RENDERER_CLASSES, EventStreamRenderer]
+    
+    def stream_answer(self, client, plan, conversation, session_id):
+        """
+        Stream the answer as server-sent events while Claude generates it.
+        
+        Events: 'meta' (session and document details) first, a 'token' per text delta,
+        then 'done' with the full response payload, or 'error' if generation fails.
+        The assistant message is saved once the stream finishes.
+        """
+        def events():
+            yield self.meta_event(plan, session_id)
+            
+            parts = []
+            try:
+                with client.messages.stream(
+                    model=CLAUDE_MODEL,
+                    max_tokens=plan['max_tokens'],
+                    messages=plan['messages']
+                ) as stream:
+                    for text in stream.text_stream:
+                        parts.append(text)
+                        yield self.format_event('token', {'text': text})
+            except Exception as e:
+                yield self.format_event('error', {'error': f'Error processing request: {str(e)}'})
+                return
+            
+            answer = ''.join(parts).strip()
+            self.save_answer(conversation, answer, plan)
+            yield self.format_event('done', self.build_response_data(answer, plan, session_id))
+        
+        return self.event_stream_response(events())
+    
+    def post(self, request):
+        if not HAS_ANTHROPIC:
+            return Response(
+                {'error': 'Required dependencies not installed. Please install: anthropic'},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+        
+        serializer = ChatbotQuerySerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+        
+        query = serializer.validated_data['query']
+        
+        # Get Claude API key from environment
+        claude_api_key = config('CLAUDE_API_KEY', default=None)
+        if not claude_api_key:
+            return Response(
+                {'error': 'Claude API key not configured. Please set CLAUDE_API_KEY in your environment variables.'},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+        
+        try:
+            # Shared client, so connections to the API are reused across requests
+            client = get_client(claude_api_key)
             
-            # Add conversation history as alternating user/assistant messages
-            for pair in history:
-                messages.append({"role": "user", "content": pair['user']})
-                messages.append({"role": "assistant", "content": pair['assistant']})
+            conversation, session_id, plan = self.prepare_answer(request, request.data, query)
+            if isinstance(plan, Response):
+                return plan
             
-            # Add current query
-            messages.append({"role": "user", "content": answer_prompt})
+            if 'answer' in plan:
+                # Small talk or a repeated question, answered without calling the model
+                answer = plan['answer']
+                self.save_answer(conversation, answer, plan)
+                if self.wants_stream(request, serializer.validated_data):
+                    return self.event_stream_response(iter(self.answer_events(answer, plan, session_id)))
+                return Response(self.build_response_data(answer, plan, session_id), status=status.HTTP_200_OK)
+            
+            if self.wants_stream(request, serializer.validated_data):
+                return self.stream_answer(client, plan, conversation, session_id)
             
             answer_response = client.messages.create(
-                model="claude-3-haiku-20240307",  # Cheapest Claude model
-                max_tokens=500,
-                messages=messages
+                model=CLAUDE_MODEL,
+                max_tokens=plan['max_tokens'],
+                messages=plan['messages']
             )
             
             answer = answer_response.content[0].text.strip()
             
-            # Use document URL - should already be full backend URL from get_documents_from_media()
-            document_url = selected_doc.get('url', '')
-            if not document_url:
-                # Fallback: construct full backend URL
-                full_media_url = getattr(settings, 'FULL_MEDIA_URL', None)
-                if full_media_url:
-                    full_media_url = full_media_url.rstrip('/')
-                    document_url = f"{full_media_url}/{selected_doc['relative_path']}"
-                else:
-                    document_url = f"/media/{selected_doc['relative_path']}"
-            
             # Save assistant message
-            assistant_message = ChatMessage.objects.create(
-                conversation=conversation,
-                role='assistant',
-                content=answer,
-                document_name=selected_doc['name'],
-                document_url=document_url
-            )
-            
-            response_data = {
-                'answer': answer,
-                'document_name': selected_doc['name'],
-                'document_url': document_url,
-                'confidence': 0.8,  # Simple confidence score
-                'session_id': session_id  # Return session_id for frontend to use
-            }
+            self.save_answer(conversation, answer, plan)
             
-            response_serializer = ChatbotResponseSerializer(data=response_data)
-            if response_serializer.is_valid():
-                return Response(response_serializer.validated_data, status=status.HTTP_200_OK)
-            else:
-                return Response(response_data, status=status.HTTP_200_OK)
+            return Response(self.build_response_data(answer, plan, session_id), status=status.HTTP_200_OK)
                 
         except Exception as e:
             return Response(
                 {'error': f'Error processing request: {str(e)}'},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
+
+
+@method_decorator(csrf_exempt, name='dispatch')
+class AsyncChatbotView(ChatbotMixin, View):
+    """
+    Async version of the chatbot endpoint for ASGI deployments.
+    
+    Accepts the same JSON body and returns the same responses (including server-sent
+    events) as ChatbotView, but awaits Claude on a process-wide AsyncAnthropic client,
+    so slow model calls do not hold a worker thread each.
+    """
+    
+    async def aiter_events(self, events):
+        """Async iterator over prepared events, as ASGI streaming responses expect"""
+        for event in events:
+            yield event
+    
+    async def stream_answer(self, client, plan, conversation, session_id):
+        """Async counterpart of ChatbotView.stream_answer"""
+        async def events():
+            yield self.meta_event(plan, session_id)
+            
+            parts = []
+            try:
+                async with client.messages.stream(
+                    model=CLAUDE_MODEL,
+                    max_tokens=plan['max_tokens'],
+                    messages=plan['messages']
+                ) as stream:
+                    async for text in stream.text_stream:
+                        parts.append(text)
+                        yield self.format_event('token', {'text': text})
+            except Exception as e:
+                yield self.format_event('error', {'error': f'Error processing request: {str(e)}'})
+                return
+            
+            answer = ''.join(parts).strip()
+            await sync_to_async(self.save_answer)(conversation, answer, plan)
+            yield self.format_event('done', self.build_response_data(answer, plan, session_id))
+        
+        return self.event_stream_response(events())
+    
+    async def post(self, request):
+        if not HAS_ANTHROPIC:
+            return JsonResponse(
+                {'error': 'Required dependencies not installed. Please install: anthropic'},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+        
+        try:
+            data = json.loads(request.body or b'{}')
+        except ValueError:
+            return JsonResponse({'error': 'Request body must be valid JSON'}, status=status.HTTP_400_BAD_REQUEST)
+        if not isinstance(data, dict):
+            return JsonResponse({'error': 'Request body must be a JSON object'}, status=status.HTTP_400_BAD_REQUEST)
+        
+        serializer = ChatbotQuerySerializer(data=data)
+        if not serializer.is_valid():
+            return JsonResponse(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+        
+        query = serializer.validated_data['query']
+        
+        # Get Claude API key from environment
+        claude_api_key = config('CLAUDE_API_KEY', default=None)
+        if not claude_api_key:
+            return JsonResponse(
+                {'error': 'Claude API key not configured. Please set CLAUDE_API_KEY in your environment variables.'},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+        
+        try:
+            client = get_async_client(claude_api_key)
+            
+            # Database and retrieval work runs in one hop to the sync thread
+            conversation, session_id, plan = await sync_to_async(self.prepare_answer)(request, data, query)
+            if isinstance(plan, Response):
+                return JsonResponse(plan.data, status=plan.status_code)
+            
+            if 'answer' in plan:
+                # Small talk or a repeated question, answered without calling the model
+                answer = plan['answer']
+                await sync_to_async(self.save_answer)(conversation, answer, plan)
+                if self.wants_stream(request, serializer.validated_data):
+                    return self.event_stream_response(self.aiter_events(self.answer_events(answer, plan, session_id)))
+                return JsonResponse(self.build_response_data(answer, plan, session_id), status=status.HTTP_200_OK)
+            
+            if self.wants_stream(request, serializer.validated_data):
+                return await self.stream_answer(client, plan, conversation, session_id)
+            
+            answer_response = await client.messages.create(
+                model=CLAUDE_MODEL,
+                max_tokens=plan['max_tokens'],
+                messages=plan['messages']
+            )
+            
+            answer = answer_response.content[0].text.strip()
+            
+            # Save assistant message
+            await sync_to_async(self.save_answer)(conversation, answer, plan)
+            
+            return JsonResponse(self.build_response_data(answer, plan, session_id), status=status.HTTP_200_OK)
+        
+        except Exception as e:
+            return JsonResponse(
+                {'error': f'Error processing request: {str(e)}'},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
@@ -3,3 +3,10 @@ from django.apps import AppConfig
 
 class HomeConfig(AppConfig):
     name = 'home'
+
+    def ready(self):
+        from main.mixins import connect_signals as connect_change_signals
+        from .cache import connect_signals
+        connect_signals()
+        # ETag versions of the ConditionalGetMixin dependencies; main is not an installed app
+        connect_change_signals()
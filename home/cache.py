@@ -0,0 +1,143 @@
+"""
+Caching and invalidation of the home page summaries.
+
+CACHE_DEPENDENCIES maps each cached summary to the models it is built from. Summaries
+are cached under a key versioned with the summary's version (see main.cache), and
+saving or deleting a record of one of those models replaces the version of the summaries
+it feeds. The versions are kept in the database, so summaries can be cached for hours in
+each worker process while edits still show up on the next request to any of them, even
+if a build from the old data is still running when the edit is committed.
+
+Each cached summary carries an ETag and a Last-Modified time computed when it was
+built, so summary_response() can answer conditional requests without touching the
+database or re-serializing.
+
+Changes made without signals (QuerySet.update(), bulk_create()) are only picked up
+when the summary expires.
+"""
+import hashlib
+import json
+import time
+from django.apps import apps
+from django.conf import settings
+from django.core.cache import caches
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models.signals import post_delete, post_save
+from rest_framework.response import Response
+
+from main.cache import get_many_or_build, get_or_build, get_versions, new_versions
+from main.mixins import conditional_response
+
+# Cache key of each summary and the models (app_label.ModelName) whose data it contains
+CACHE_DEPENDENCIES = {
+    'home_trackers_summary': [
+        'trackers.MP', 'trackers.Bill', 'trackers.Loan',
+        'trackers.Budget', 'trackers.Hansard', 'trackers.OrderPaper',
+    ],
+    'home_resources_summary': [
+        'resources.Explainers', 'resources.Report',
+        'resources.PartnerPublication', 'resources.Statement',
+    ],
+    # Article summaries show the author's name
+    'home_news_summary': ['news.News', 'auth.User'],
+    'home_blog_summary': ['blog.Blog', 'auth.User'],
+    'hot_in_parliament': ['news.HotInParliament', 'auth.User'],
+    'home_hero_images': ['home.HeroImage'],
+    'home_headlines': ['home.Headline'],
+}
+
+# Saves that only touch these fields leave every summary unchanged
+IGNORED_UPDATE_FIELDS = {
+    'auth.User': {'last_login'},
+}
+
+
+def get_summary_timeout():
+    """Seconds a summary stays cached if nothing it depends on changes"""
+    return getattr(settings, 'SUMMARY_CACHE_TIMEOUT', 60 * 60 * 6)
+
+
+def get_summary(key, build):
+    """
+    Return the cached entry for a summary, building and caching it on a miss.
+
+    Concurrent misses build the summary once, and an expired summary is served while
+    it is rebuilt in the background (see main.cache).
+
+    Args:
+        key: Summary cache key, one of CACHE_DEPENDENCIES
+        build: Callable returning the summary data
+
+    Returns:
+        Dict with the summary 'data', its 'etag' and its 'last_modified' timestamp
+    """
+    cache = caches['summaries']
+    versioned_key = summary_cache_key(key, get_versions([key])[key])
+    return get_or_build(cache, versioned_key, lambda: build_entry(build()), get_summary_timeout())
+
+
+def get_summaries(builds):
+    """
+    get_summary() for several summaries at once, read from the cache in one round trip.
+
+    Args:
+        builds: Dict mapping summary cache keys to the callables returning their data
+
+    Returns:
+        Dict mapping each key to its cached entry
+    """
+    cache = caches['summaries']
+    versions = get_versions(list(builds))
+    versioned_keys = {key: summary_cache_key(key, versions[key]) for key in builds}
+    entries = get_many_or_build(
+        cache,
+        {versioned_keys[key]: (lambda build=build: build_entry(build())) for key, build in builds.items()},
+        get_summary_timeout(),
+    )
+    return {key: entries[versioned_keys[key]] for key in builds}
+
+
+def summary_cache_key(key, version):
+    return f'{key}:{version}'
+
+
+def build_entry(data):
+    """Wrap summary data with its validators"""
+    content = json.dumps(data, cls=DjangoJSONEncoder, sort_keys=True)
+    return {
+        'data': data,
+        'etag': hashlib.md5(content.encode()).hexdigest(),
+        'last_modified': int(time.time()),
+    }
+
+
+def summary_response(request, entry):
+    """Response for a summary entry, or 304 Not Modified if the client's copy is current"""
+    return conditional_response(request, entry['etag'], entry['last_modified'], lambda: Response(entry['data']))
+
+
+def get_dependent_keys(model):
+    """Cache keys of the summaries built from a model"""
+    label = model._meta.label
+    return [key for key, models in CACHE_DEPENDENCIES.items() if label in models]
+
+
+def invalidate_summaries(sender, instance=None, update_fields=None, **kwargs):
+    """post_save/post_delete receiver: replace the version of the summaries fed by the changed model"""
+    ignored = IGNORED_UPDATE_FIELDS.get(sender._meta.label)
+    if ignored and update_fields and set(update_fields) <= ignored:
+        return
+
+    keys = get_dependent_keys(sender)
+    if keys:
+        # In the saving transaction, so the new version becomes visible with the change
+        new_versions(keys)
+
+
+def connect_signals():
+    """Connect the invalidation receiver to every model in CACHE_DEPENDENCIES"""
+    labels = {label for models in CACHE_DEPENDENCIES.values() for label in models}
+    for label in labels:
+        model = apps.get_model(label)
+        post_save.connect(invalidate_summaries, sender=model, dispatch_uid=f'summary_cache_{label}')
+        post_delete.connect(invalidate_summaries, sender=model, dispatch_uid=f'summary_cache_delete_{label}')
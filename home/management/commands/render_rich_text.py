@@ -0,0 +1,29 @@
+from django.core.management.base import BaseCommand
+from main.rendering import render_stale_html, rendered_html_models
+
+
+class Command(BaseCommand):
+    help = 'Render the stored HTML of rich text content that is missing or was rendered against another media base'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--force',
+            action='store_true',
+            help='Re-render every row, not only stale ones'
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=200,
+            help='Rows updated per query (default: 200)'
+        )
+
+    def handle(self, *args, **options):
+        total = 0
+        for model in rendered_html_models():
+            count = render_stale_html(model, force=options['force'], batch_size=options['batch_size'])
+            total += count
+            self.stdout.write(f"{model._meta.label}: {count}")
+        self.stdout.write(
+            self.style.SUCCESS(f"Rendered {total} rows.")
+        )
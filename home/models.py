@@ -44,3 +44,16 @@ class Headline(models.Model):
 
     def __str__(self):
         return self.text[:50] + ('...' if len(self.text) > 50 else '')
+
+
+class DataVersion(models.Model):
+    """
+    Version of a set of cached or validated data (see main.cache.get_versions), replaced
+    whenever the data changes. Kept in the database so every worker process sees it,
+    whatever the cache backend.
+    """
+    name = models.CharField(max_length=200, primary_key=True)
+    version = models.CharField(max_length=32)
+
+    def __str__(self):
+        return f'{self.name}: {self.version}'
@@ -1,10 +1,10 @@
 from rest_framework import serializers
-from main.utils import get_full_media_url
+from main.utils import MediaURLField
 from .models import HeroImage, Headline
 
 
 class HeroImageSerializer(serializers.ModelSerializer):
-    image = serializers.SerializerMethodField()
+    image = MediaURLField()
 
     class Meta:
         model = HeroImage
@@ -20,11 +20,6 @@ class HeroImageSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ['created_at', 'updated_at']
 
-    def get_image(self, obj):
-        if obj.image:
-            return get_full_media_url(obj.image.url)
-        return None
-
 
 class HeadlineSerializer(serializers.ModelSerializer):
     class Meta:
@@ -39,4 +34,3 @@ class HeadlineSerializer(serializers.ModelSerializer):
             'updated_at',
         ]
         read_only_fields = ['created_at', 'updated_at']
-
@@ -1,3 +1,246 @@
-from django.test import TestCase
+import json
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.cache import caches
+from django.test import SimpleTestCase, TestCase, override_settings
+from rest_framework.renderers import JSONRenderer
 
-# Create your tests here.
+from news.models import News
+
+from .cache import get_summary
+from .models import Headline
+from .views import HOME_SECTIONS
+
+try:
+    import fakeredis
+except ImportError:  # Only needed for the Redis tier tests
+    fakeredis = None
+
+TIERS = ['default', 'search', 'summaries', 'chatbot', 'sessions']
+
+
+def locmem_caches(max_entries, process='test'):
+    """
+    CACHES as settings builds them without REDIS_URL, with a small size limit. Caches of
+    different processes do not share storage.
+    """
+    return {
+        name: {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'LOCATION': f'{process}-{name}',
+            'OPTIONS': {'MAX_ENTRIES': max_entries, 'CULL_FREQUENCY': 2},
+        }
+        for name in TIERS
+    }
+
+
+def redis_caches(servers):
+    """CACHES as settings builds them with REDIS_URL / <TIER>_CACHE_URL, on fakeredis servers"""
+    return {
+        name: {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': f'redis://{name}',
+            'KEY_PREFIX': name,
+            'OPTIONS': {'connection_class': fakeredis.FakeConnection, 'server': servers[name]},
+        }
+        for name in TIERS
+    }
+
+
+class CacheTierSettingsTests(SimpleTestCase):
+
+    def test_every_tier_is_configured(self):
+        self.assertLessEqual(set(TIERS), set(settings.CACHES))
+        self.assertEqual(settings.SESSION_CACHE_ALIAS, 'sessions')
+
+    def test_tiers_do_not_share_storage(self):
+        # LocMemCache instances share storage by LOCATION, Redis caches by server and KEY_PREFIX
+        storage = {
+            (config.get('LOCATION'), config.get('KEY_PREFIX', '')) for config in settings.CACHES.values()
+        }
+        self.assertEqual(len(storage), len(settings.CACHES))
+
+
+@override_settings(CACHES=locmem_caches(max_entries=10))
+class LocMemCacheTierTests(SimpleTestCase):
+
+    def setUp(self):
+        for name in TIERS:
+            caches[name].clear()
+
+    def test_same_key_in_two_tiers(self):
+        caches['search'].set('key', 'search')
+        caches['summaries'].set('key', 'summaries')
+        self.assertEqual(caches['search'].get('key'), 'search')
+        self.assertEqual(caches['summaries'].get('key'), 'summaries')
+
+    def test_search_churn_does_not_evict_summaries(self):
+        caches['summaries'].set('home_headlines', ['headline'])
+        for i in range(50):
+            caches['search'].set(f'search:{i}', i)
+
+        self.assertEqual(caches['summaries'].get('home_headlines'), ['headline'])
+        # The search tier did cull its own entries
+        self.assertIsNone(caches['search'].get('search:0'))
+        self.assertEqual(caches['search'].get('search:49'), 49)
+
+    def test_clearing_a_tier_leaves_the_others(self):
+        for name in TIERS:
+            caches[name].set('key', name)
+        caches['search'].clear()
+
+        self.assertIsNone(caches['search'].get('key'))
+        for name in TIERS:
+            if name != 'search':
+                self.assertEqual(caches[name].get('key'), name)
+
+
+class RedisCacheTierTests(SimpleTestCase):
+
+    def setUp(self):
+        if fakeredis is None:
+            self.skipTest('fakeredis is not installed')
+
+    def test_shared_server_namespaces_each_tier(self):
+        server = fakeredis.FakeServer()
+        with override_settings(CACHES=redis_caches(dict.fromkeys(TIERS, server))):
+            caches['search'].set('key', 'search')
+            caches['summaries'].set('key', 'summaries')
+            caches['search'].delete('key')
+
+            self.assertIsNone(caches['search'].get('key'))
+            self.assertEqual(caches['summaries'].get('key'), 'summaries')
+
+    def test_separate_servers_isolate_eviction(self):
+        servers = {name: fakeredis.FakeServer() for name in TIERS}
+        with override_settings(CACHES=redis_caches(servers)):
+            for name in TIERS:
+                caches[name].set('key', name)
+            # What an eviction policy or a flush of the search server does to that tier
+            caches['search'].clear()
+
+            self.assertIsNone(caches['search'].get('key'))
+            for name in TIERS:
+                if name != 'search':
+                    self.assertEqual(caches[name].get('key'), name)
+
+
+@override_settings(CACHES=locmem_caches(max_entries=100))
+class SummaryInvalidationTests(TestCase):
+
+    def setUp(self):
+        caches['summaries'].clear()
+        self.builds = 0
+
+    def headlines(self):
+        return get_summary('home_headlines', self.build_headlines)['data']
+
+    def build_headlines(self):
+        self.builds += 1
+        return list(Headline.objects.values_list('text', flat=True))
+
+    def create_headline(self, text):
+        with self.captureOnCommitCallbacks(execute=True):
+            return Headline.objects.create(text=text)
+
+    def test_summary_is_cached(self):
+        self.create_headline('First')
+        self.assertEqual(self.headlines(), ['First'])
+        self.assertEqual(self.headlines(), ['First'])
+        self.assertEqual(self.builds, 1)
+
+    def test_save_and_delete_replace_the_version(self):
+        headline = self.create_headline('First')
+        self.assertEqual(self.headlines(), ['First'])
+
+        headline.text = 'Edited'
+        with self.captureOnCommitCallbacks(execute=True):
+            headline.save()
+        self.assertEqual(self.headlines(), ['Edited'])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            headline.delete()
+        self.assertEqual(self.headlines(), [])
+
+    def test_change_saved_by_another_process(self):
+        self.create_headline('First')
+        self.assertEqual(self.headlines(), ['First'])
+
+        with override_settings(CACHES=locmem_caches(max_entries=100, process='other')):
+            self.create_headline('Second')
+        self.assertEqual(self.headlines(), ['First', 'Second'])
+
+    def test_change_committed_during_a_build_is_not_lost(self):
+        def racing_build():
+            data = self.build_headlines()
+            # The edit commits after this build read the rows, before it is cached
+            self.create_headline('Late')
+            return data
+
+        self.assertEqual(get_summary('home_headlines', racing_build)['data'], [])
+        self.assertEqual(self.headlines(), ['Late'])
+
+    def test_login_does_not_invalidate_article_summaries(self):
+        user = User.objects.create(username='reporter', first_name='Old')
+
+        def author_name():
+            self.builds += 1
+            return User.objects.get(pk=user.pk).first_name
+
+        self.assertEqual(get_summary('home_news_summary', author_name)['data'], 'Old')
+
+        with self.captureOnCommitCallbacks(execute=True):
+            user.save(update_fields=['last_login'])
+        self.assertEqual(get_summary('home_news_summary', author_name)['data'], 'Old')
+        self.assertEqual(self.builds, 1)
+
+        user.first_name = 'Renamed'
+        with self.captureOnCommitCallbacks(execute=True):
+            user.save()
+        self.assertEqual(get_summary('home_news_summary', author_name)['data'], 'Renamed')
+
+    def test_home_page_etag(self):
+        self.create_headline('First')
+        response = self.client.get('/api/home/page/')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['headlines'][0]['text'], 'First')
+
+        etag = response['ETag']
+        self.assertEqual(self.client.get('/api/home/page/', HTTP_IF_NONE_MATCH=etag).status_code, 304)
+
+        self.create_headline('Second')
+        response = self.client.get('/api/home/page/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+
+
+@override_settings(CACHES=locmem_caches(max_entries=100))
+class HomePageTests(TestCase):
+
+    def setUp(self):
+        caches['summaries'].clear()
+        author = User.objects.create(username='reporter', first_name='Ann', last_name='Writer')
+        News.objects.create(title='Budget passed', content='<p>Text</p>', author=author, status='published')
+        self.headline = Headline.objects.create(text='Parliament resumes')
+
+    def test_sections_match_their_builders(self):
+        data = self.client.get('/api/home/page/').json()
+
+        self.assertEqual(set(data), set(HOME_SECTIONS) | {'versions'})
+        self.assertEqual(set(data['versions']), set(HOME_SECTIONS))
+        for name, (key, build) in HOME_SECTIONS.items():
+            self.assertEqual(data[name], json.loads(JSONRenderer().render(build())), name)
+        self.assertEqual(data['headlines'][0]['text'], 'Parliament resumes')
+
+    def test_edit_changes_only_its_section_version(self):
+        before = self.client.get('/api/home/page/').json()['versions']
+
+        self.headline.text = 'Parliament adjourns'
+        self.headline.save()
+        after = self.client.get('/api/home/page/').json()['versions']
+
+        self.assertNotEqual(after['headlines'], before['headlines'])
+        self.assertEqual(
+            {name: version for name, version in after.items() if name != 'headlines'},
+            {name: version for name, version in before.items() if name != 'headlines'},
+        )
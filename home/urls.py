@@ -1,12 +1,13 @@
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
-from .views import HeroImageViewSet, HeadlineViewSet
+from .views import HeroImageViewSet, HeadlineViewSet, HomePageView
 
 router = DefaultRouter()
 router.register(r'hero-images', HeroImageViewSet, basename='hero-image')
 router.register(r'headlines', HeadlineViewSet, basename='headline')
 
 urlpatterns = [
+    path('page/', HomePageView.as_view(), name='home-page'),
     path('', include(router.urls)),
 ]
 
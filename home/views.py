@@ -1,6 +1,18 @@
+import hashlib
 from rest_framework import viewsets, filters
 from rest_framework.pagination import PageNumberPagination
+from rest_framework.views import APIView
+from rest_framework.permissions import AllowAny
+from rest_framework.response import Response
 from django_filters.rest_framework import DjangoFilterBackend
+from django.utils.decorators import method_decorator
+from django.views.decorators.gzip import gzip_page
+from main.mixins import conditional_response
+from news.views import HomeNewsSummaryView, HotInParliamentView
+from blog.views import HomeBlogSummaryView
+from trackers.views import HomeSummaryView
+from resources.views import HomeResourcesSummaryView
+from .cache import get_summaries
 from .models import HeroImage, Headline
 from .serializers import HeroImageSerializer, HeadlineSerializer
 
@@ -35,3 +47,54 @@ class HeadlineViewSet(viewsets.ModelViewSet):
     ordering_fields = ['order', 'created_at']
     ordering = ['order', 'created_at']
     http_method_names = ['get', 'head', 'options']  # Read-only for public
+
+
+def build_hero_images():
+    hero_images = HeroImage.objects.filter(is_active=True).order_by('order', 'created_at')
+    return HeroImageSerializer(hero_images, many=True).data
+
+
+def build_headlines():
+    headlines = Headline.objects.filter(is_active=True).order_by('order', 'created_at')
+    return HeadlineSerializer(headlines, many=True).data
+
+
+# Home page sections: response key -> (summary cache key, builder)
+HOME_SECTIONS = {
+    'hero_images': ('home_hero_images', build_hero_images),
+    'headlines': ('home_headlines', build_headlines),
+    'hot_in_parliament': ('hot_in_parliament', HotInParliamentView().build_summary),
+    'news': ('home_news_summary', HomeNewsSummaryView().build_summary),
+    'blogs': ('home_blog_summary', HomeBlogSummaryView().build_summary),
+    'trackers': ('home_trackers_summary', HomeSummaryView().build_summary),
+    'resources': ('home_resources_summary', HomeResourcesSummaryView().build_summary),
+}
+
+
+@method_decorator(gzip_page, name='dispatch')
+class HomePageView(APIView):
+    """
+    Everything the home page shows in one response.
+
+    Each section is the cached summary its own endpoint serves (see home.cache), so
+    sections are rebuilt independently when their data changes, and all of them are
+    read from the cache in one round trip. 'versions' holds the ETag of each section;
+    the response's ETag combines them, so an unchanged home page is answered with
+    304 Not Modified.
+    """
+    permission_classes = [AllowAny]
+
+    def get(self, request):
+        entries = get_summaries({key: build for key, build in HOME_SECTIONS.values()})
+        sections = {name: entries[key] for name, (key, build) in HOME_SECTIONS.items()}
+
+        versions = {name: entry['etag'] for name, entry in sections.items()}
+        etag = hashlib.md5('|'.join(f'{name}:{version}' for name, version in versions.items()).encode()).hexdigest()
+        last_modified = max(entry['last_modified'] for entry in sections.values())
+
+        def get_response():
+            data = {name: entry['data'] for name, entry in sections.items()}
+            data['versions'] = versions
+            return Response(data)
+
+        return conditional_response(request, etag, last_modified, get_response)
@@ -12,5 +12,9 @@ import os
 from django.core.asgi import get_asgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'main.settings')
+# Under ASGI each request's database work may run on a different thread, so connections
+# kept open between requests pile up instead of being reused; close them after each one
+# unless CONN_MAX_AGE is set explicitly
+os.environ.setdefault('CONN_MAX_AGE', '0')
 
 application = get_asgi_application()
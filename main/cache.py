@@ -0,0 +1,163 @@
+"""
+Cache helper for expensive views: single-flight recomputation and stale-while-revalidate.
+
+get_or_build() stores a value together with the time until which it is fresh, and keeps
+it in the cache for a further stale_timeout seconds:
+
+- Fresh hit: the value is returned.
+- Stale hit: the stale value is returned at once and one worker, the one that takes
+  the refresh lock, rebuilds it on a background thread.
+- Miss: the worker that takes the lock builds the value; others wait for it (up to
+  wait_timeout) instead of running the same queries.
+
+The lock is a cache.add() key, so with a shared cache (Redis) it covers every worker
+process, and with LocMemCache every thread of one process.
+
+Values invalidated by data changes are cached under versioned keys: get_versions()
+returns the current version of a name to build the key from, and new_versions()
+replaces it when the data changes. Deleting the key instead would race with builds
+already running (or refreshing in the background) from the old data, which would write
+their result back after the delete; with a new version they write to a key no request
+reads any more.
+
+The versions are kept in the database (home.DataVersion), so a change made by one worker
+process is seen by every other one even when each keeps its own LocMemCache.
+new_versions() is called in the transaction making the change: a request that reads the
+new version also reads the new data.
+"""
+import logging
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from django.conf import settings
+from django.db import close_old_connections
+
+logger = logging.getLogger(__name__)
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_executor():
+    """Return the process-wide pool that refreshes stale cache entries"""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=getattr(settings, 'CACHE_REFRESH_WORKERS', 2),
+                thread_name_prefix='cache-refresh',
+            )
+        return _executor
+
+
+def get_or_build(cache, key, build, timeout, stale_timeout=None, lock_timeout=30, wait_timeout=5):
+    """
+    Return the cached value for key, building it with build() when needed.
+
+    Args:
+        cache: Cache to use, e.g. caches['search']
+        key: Cache key
+        build: Callable returning the value
+        timeout: Seconds the value is fresh
+        stale_timeout: Seconds a stale value may still be served while it is rebuilt
+            (defaults to timeout)
+        lock_timeout: Seconds after which a refresh lock is considered abandoned
+        wait_timeout: Seconds a miss waits for another worker's build before building
+            the value itself
+    """
+    stale_timeout = timeout if stale_timeout is None else stale_timeout
+    lock_key = f'{key}:lock'
+
+    entry = cache.get(key)
+    if isinstance(entry, tuple):
+        fresh_until, value = entry
+        if time.time() >= fresh_until and cache.add(lock_key, 1, lock_timeout):
+            get_executor().submit(_refresh, cache, key, lock_key, build, timeout, stale_timeout)
+        return value
+
+    if not cache.add(lock_key, 1, lock_timeout):
+        # Another worker is building the value; wait for it rather than duplicate the work
+        deadline = time.monotonic() + wait_timeout
+        while time.monotonic() < deadline:
+            time.sleep(0.05)
+            entry = cache.get(key)
+            if isinstance(entry, tuple):
+                return entry[1]
+        return build()
+
+    try:
+        return _build(cache, key, build, timeout, stale_timeout)
+    finally:
+        cache.delete(lock_key)
+
+
+def get_many_or_build(cache, builds, timeout, stale_timeout=None):
+    """
+    get_or_build() for several keys, fetched from the cache in one round trip.
+
+    Args:
+        builds: Dict mapping each cache key to the callable that builds its value
+
+    Returns:
+        Dict mapping each key to its value
+    """
+    entries = cache.get_many(list(builds))
+    now = time.time()
+    values = {}
+    for key, build in builds.items():
+        entry = entries.get(key)
+        if isinstance(entry, tuple) and now < entry[0]:
+            values[key] = entry[1]
+        else:
+            values[key] = get_or_build(cache, key, build, timeout, stale_timeout)
+    return values
+
+
+def _build(cache, key, build, timeout, stale_timeout):
+    value = build()
+    cache.set(key, (time.time() + timeout, value), timeout + stale_timeout)
+    return value
+
+
+def _refresh(cache, key, lock_key, build, timeout, stale_timeout):
+    """Refresh-pool task: rebuild a stale value, then release the lock"""
+    close_old_connections()
+    try:
+        _build(cache, key, build, timeout, stale_timeout)
+    except Exception as e:
+        # The stale value keeps being served; the next stale read retries
+        logger.warning(f"Could not refresh cache key {key}: {e}")
+    finally:
+        cache.delete(lock_key)
+        close_old_connections()
+
+
+def get_versions(names):
+    """
+    Current version of each name, starting one for names that have none.
+
+    Returns:
+        Dict mapping each name to its version
+    """
+    from home.models import DataVersion
+
+    versions = dict(DataVersion.objects.filter(name__in=names).values_list('name', 'version'))
+    missing = [name for name in names if name not in versions]
+    if missing:
+        DataVersion.objects.bulk_create(
+            [DataVersion(name=name, version=uuid.uuid4().hex) for name in missing], ignore_conflicts=True
+        )
+        versions.update(DataVersion.objects.filter(name__in=missing).values_list('name', 'version'))
+    return versions
+
+
+def new_versions(names):
+    """Replace the version of each name, making keys built from the old ones stale"""
+    from home.models import DataVersion
+
+    # Sorted, so concurrent transactions lock the rows in the same order
+    DataVersion.objects.bulk_create(
+        [DataVersion(name=name, version=uuid.uuid4().hex) for name in sorted(set(names))],
+        update_conflicts=True, unique_fields=['name'], update_fields=['version'],
+    )
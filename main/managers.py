@@ -0,0 +1,16 @@
+"""
+Model managers shared by the content apps
+"""
+from django.db import models
+
+
+class SearchableManager(models.Manager):
+    """
+    Default manager for models with a stored search_vector column.
+
+    The tsvector can be as large as the text it indexes, so it is left out of queries
+    unless asked for; filtering and ranking on it still work.
+    """
+
+    def get_queryset(self):
+        return super().get_queryset().defer('search_vector')
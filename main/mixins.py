@@ -0,0 +1,181 @@
+"""
+Reusable mixins and helpers for the read API views
+"""
+import hashlib
+from django.apps import apps
+from django.core.exceptions import FieldDoesNotExist, ImproperlyConfigured
+from django.db.models import Count, Max
+from django.db.models.signals import post_delete, post_save
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date, quote_etag
+from rest_framework.response import Response
+
+from .cache import get_versions, new_versions
+from .sparse import get_sparse_fields, narrow_queryset, select_field_names
+from .values import get_values_serializer
+
+
+def conditional_response(request, etag, last_modified, get_response):
+    """
+    Answer a conditional GET.
+
+    Returns 304 Not Modified when the client's If-None-Match / If-Modified-Since match
+    the validators, without calling get_response; otherwise calls it and adds the ETag
+    and Last-Modified headers to a successful response.
+
+    Args:
+        request: The request
+        etag: Unquoted or quoted entity tag of the current representation
+        last_modified: Unix timestamp of the last change, or None
+        get_response: Callable building the full response
+    """
+    etag = quote_etag(etag)
+    if request.method in ('GET', 'HEAD'):
+        response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+        if response is None:
+            response = get_response()
+            if response.status_code != 200:
+                return response
+    else:
+        return get_response()
+
+    response['ETag'] = etag
+    if last_modified is not None:
+        response['Last-Modified'] = http_date(last_modified)
+    # Let clients keep the response but check back with the validators every time
+    patch_cache_control(response, no_cache=True)
+    return response
+
+
+class ConditionalGetMixin:
+    """
+    ETag support for the list and retrieve actions of a ViewSet.
+
+    The ETag is derived from MAX(updated_at) and COUNT(*) of the filtered queryset, and of
+    every model in conditional_dependencies (models whose rows are shown in the response,
+    e.g. bill readings or article authors). New and edited records raise MAX(updated_at)
+    and deleted ones lower the count, so an unchanged resource is answered with 304 Not
+    Modified after a few aggregate queries and without serializing anything.
+
+    No Last-Modified header is sent: MAX(updated_at) does not change when a record is
+    deleted or leaves the filter, so If-Modified-Since would get false 304s.
+
+    Dependencies without an updated_at column (e.g. auth.User) must be listed in
+    TRACKED_MODELS, whose saves and deletes replace a version kept in the database.
+    """
+    conditional_dependencies = []
+
+    def list(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+        return conditional_response(
+            request, self.get_etag(queryset), None,
+            lambda: super(ConditionalGetMixin, self).list(request, *args, **kwargs)
+        )
+
+    def retrieve(self, request, *args, **kwargs):
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        queryset = self.filter_queryset(self.get_queryset()).filter(
+            **{self.lookup_field: self.kwargs[lookup_url_kwarg]}
+        )
+        return conditional_response(
+            request, self.get_etag(queryset), None,
+            lambda: super(ConditionalGetMixin, self).retrieve(request, *args, **kwargs)
+        )
+
+    def get_etag(self, queryset):
+        """Unquoted ETag of the queryset's representation"""
+        stats = [queryset.aggregate(last_modified=Max('updated_at'), count=Count('pk'))]
+        tracked = []
+        for model in self.conditional_dependencies:
+            if _has_updated_at(model):
+                stats.append(model.objects.aggregate(last_modified=Max('updated_at'), count=Count('pk')))
+            elif model._meta.label in TRACKED_MODELS:
+                tracked.append(change_version_name(model))
+            else:
+                raise ImproperlyConfigured(
+                    f'{model._meta.label} has no updated_at column; add it to main.mixins.TRACKED_MODELS'
+                )
+        versions = get_versions(tracked) if tracked else {}
+
+        # The same data renders differently per URL (filters, page) and format
+        version = '|'.join(
+            [self.request.get_full_path(), getattr(self.request, 'accepted_media_type', '') or '']
+            + [f"{item['last_modified'] and item['last_modified'].isoformat()}:{item['count']}" for item in stats]
+            + [versions[name] for name in tracked]
+        )
+        return hashlib.md5(version.encode()).hexdigest()
+
+
+def _has_updated_at(model):
+    try:
+        model._meta.get_field('updated_at')
+    except FieldDoesNotExist:
+        return False
+    return True
+
+
+def change_version_name(model):
+    return f'changes:{model._meta.label_lower}'
+
+
+# Models without an updated_at column shown by ConditionalGetMixin views, with the fields
+# the views do not show; saves touching only these leave the responses unchanged
+TRACKED_MODELS = {
+    'auth.User': {'last_login'},  # Author names
+}
+
+
+def new_change_version(sender, update_fields=None, **kwargs):
+    """post_save/post_delete receiver: change the ETags of responses showing the model"""
+    ignored = TRACKED_MODELS[sender._meta.label]
+    if ignored and update_fields and set(update_fields) <= ignored:
+        return
+    # In the saving transaction, so the new version becomes visible with the change
+    new_versions([change_version_name(sender)])
+
+
+def connect_signals():
+    """Connect the version receiver to every model in TRACKED_MODELS. Called once, from HomeConfig.ready()"""
+    for label in TRACKED_MODELS:
+        model = apps.get_model(label)
+        post_save.connect(new_change_version, sender=model, dispatch_uid=f'change_version_{label}')
+        post_delete.connect(new_change_version, sender=model, dispatch_uid=f'change_version_delete_{label}')
+
+
+class ValuesListMixin:
+    """
+    Serve the list action of a ViewSet from queryset.values() rows.
+
+    The list serializer is compiled into a values() projection (see main.values), so
+    a page is serialized without building model instances, with the same JSON. Only
+    for list serializers made of fields main.values supports.
+    """
+
+    def list(self, request, *args, **kwargs):
+        values_serializer = get_values_serializer(self.get_serializer_class())
+        sparse = get_sparse_fields(request)
+        if sparse is not None:
+            values_serializer = values_serializer.select(select_field_names(values_serializer.names, sparse))
+        rows = values_serializer.values(self.filter_queryset(self.get_queryset()))
+
+        page = self.paginate_queryset(rows)
+        if page is not None:
+            return self.get_paginated_response(values_serializer.serialize(page))
+        return Response(values_serializer.serialize(rows))
+
+
+class SparseQuerysetMixin:
+    """
+    Load only what a sparse fieldset (?fields= / ?omit=, see main.sparse) needs in the
+    list and retrieve actions of a ViewSet.
+
+    The serializer is narrowed by SparseFieldsMixin; this narrows the queryset to match
+    (see main.sparse.narrow_queryset). Serializers with fields whose sources cannot be
+    told (method fields not declared in Meta.values_fields) keep the full queryset.
+    """
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.action not in ('list', 'retrieve') or get_sparse_fields(self.request) is None:
+            return queryset
+        return narrow_queryset(self.get_serializer(), queryset)
@@ -0,0 +1,63 @@
+"""
+orjson-based JSON renderer and parser for the API (see REST_FRAMEWORK in settings).
+
+Drop-in replacements for DRF's JSONRenderer and JSONParser producing the same output:
+compact, UTF-8, with U+2028/U+2029 escaped. Values orjson does not handle the way DRF
+does (date/time, lazy strings, querysets, ...) are converted by DRF's own JSONEncoder
+and Decimals are written as the json module writes floats; dicts, lists, strings,
+numbers and UUIDs are encoded natively. (Floats with an exponent are the exception:
+orjson writes 1e-7 where the json module writes 1e-07.)
+"""
+import codecs
+from decimal import Decimal
+import orjson
+from django.conf import settings
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+
+_encoder = JSONEncoder()
+
+
+def _default(obj):
+    if isinstance(obj, Decimal):
+        # A float as in DRF, written the json module's way (1e+16, where orjson writes 1e16)
+        return orjson.Fragment(repr(float(obj)))
+    return _encoder.default(obj)
+
+
+class ORJSONRenderer(JSONRenderer):
+    """JSONRenderer encoding with orjson; indented output still uses the json module"""
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+
+        renderer_context = renderer_context or {}
+        if self.get_indent(accepted_media_type, renderer_context) or not self.compact or self.ensure_ascii:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        ret = orjson.dumps(data, default=_default, option=ORJSON_OPTIONS)
+        # Valid JSON but not valid JavaScript; escaped as JSONRenderer does
+        if b'\xe2\x80\xa8' in ret or b'\xe2\x80\xa9' in ret:
+            ret = ret.replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
+        return ret
+
+
+class ORJSONParser(JSONParser):
+    """JSONParser decoding with orjson"""
+    renderer_class = ORJSONRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        parser_context = parser_context or {}
+        encoding = parser_context.get('encoding', settings.DEFAULT_CHARSET)
+        if codecs.lookup(encoding).name != 'utf-8':
+            return super().parse(stream, media_type, parser_context)
+
+        try:
+            return orjson.loads(stream.read())
+        except orjson.JSONDecodeError as exc:
+            raise ParseError(f'JSON parse error - {exc}')
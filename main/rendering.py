@@ -0,0 +1,104 @@
+"""
+Rich text HTML rendered when it is saved rather than on every read.
+
+Models with RichTextField content store a copy of it with the image URLs made absolute
+(see process_content_images), together with the media base URL it was rendered
+against. Detail serializers return the stored copy through RenderedHTMLField, so
+reading a long article runs no regex; only rows rendered against another media base
+(or not rendered yet) fall back to rewriting on the fly until the render_rich_text
+command brings them up to date.
+"""
+from rest_framework import serializers
+
+from .utils import get_media_base_url, process_content_images
+
+
+class RenderedHTMLMixin:
+    """
+    Model mixin rendering rich text fields on save.
+
+    rendered_html_fields maps each rich text field to the field holding its rendered
+    HTML; the model also needs a rendered_media_base CharField.
+    """
+    rendered_html_fields = {'content': 'rendered_content'}
+
+    def render_html(self):
+        """Render every rich text field against the current media base"""
+        for field, rendered_field in self.rendered_html_fields.items():
+            setattr(self, rendered_field, process_content_images(getattr(self, field)) or '')
+        self.rendered_media_base = get_media_base_url()
+
+    def save(self, *args, **kwargs):
+        self.render_html()
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and set(update_fields) & set(self.rendered_html_fields):
+            kwargs['update_fields'] = {
+                *update_fields, *self.rendered_html_fields.values(), 'rendered_media_base'
+            }
+        super().save(*args, **kwargs)
+
+
+def get_rendered_html(obj, field):
+    """
+    HTML of a rich text field with absolute image URLs: the copy stored on save if it
+    was rendered against the current media base, otherwise rendered now.
+    """
+    value = getattr(obj, field)
+    if not value:
+        return value
+    if obj.rendered_media_base == get_media_base_url():
+        return getattr(obj, obj.rendered_html_fields[field])
+    return process_content_images(value)
+
+
+class RenderedHTMLField(serializers.Field):
+    """Read-only serializer field returning a rich text field's rendered HTML"""
+
+    def __init__(self, field, **kwargs):
+        self.html_field = field
+        kwargs['source'] = '*'
+        kwargs['read_only'] = True
+        super().__init__(**kwargs)
+
+    def to_representation(self, obj):
+        return get_rendered_html(obj, self.html_field)
+
+
+def rendered_html_models():
+    """Installed models that render rich text on save"""
+    from django.apps import apps
+    return [model for model in apps.get_models() if issubclass(model, RenderedHTMLMixin)]
+
+
+def render_stale_html(model, force=False, batch_size=200):
+    """
+    Re-render the rich text of rows rendered against another media base (or never
+    rendered), without calling save(), so timestamps and signals are left alone.
+
+    Args:
+        model: Model using RenderedHTMLMixin
+        force: Re-render every row
+        batch_size: Rows written per UPDATE
+
+    Returns:
+        Number of rows re-rendered
+    """
+    fields = list(model.rendered_html_fields)
+    rendered_fields = [*model.rendered_html_fields.values(), 'rendered_media_base']
+    queryset = model._base_manager.only('pk', *fields).order_by('pk')
+    if not force:
+        queryset = queryset.exclude(rendered_media_base=get_media_base_url())
+
+    count = 0
+    batch = []
+    for obj in queryset.iterator(chunk_size=batch_size):
+        obj.render_html()
+        batch.append(obj)
+        if len(batch) >= batch_size:
+            model._base_manager.bulk_update(batch, rendered_fields)
+            count += len(batch)
+            batch = []
+    if batch:
+        model._base_manager.bulk_update(batch, rendered_fields)
+        count += len(batch)
+    return count
@@ -0,0 +1,444 @@
+"""
+Search backends for GlobalSearchView, selected with the SEARCH_BACKEND setting.
+
+Both use PostgreSQL full-text search over stored, GIN-indexed tsvector columns and rank
+matches with ts_rank, so latency stays flat as content grows instead of scanning every
+row with icontains:
+
+- DocumentSearchBackend (default) queries the denormalized SearchDocument table of the
+  search app: one query returns the top results and counts for every category.
+- ModelSearchBackend queries the search_vector column of each content model, two
+  queries per category. It needs no index rebuild, so it is a fallback while the
+  SearchDocument table is being populated. Only this backend uses the search worker
+  pool (SEARCH_WORKERS) and SEARCH_TIMEOUT.
+
+Both return (results, counts, incomplete): incomplete lists the categories left out
+because their search failed or timed out, so callers can tell an empty category from a
+missing one and avoid caching a partial result.
+
+autocomplete() serves the search dropdown from the trigram indexes on SearchDocument
+titles and subtitles, so keystrokes never run a full search.
+"""
+import logging
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
+from django.conf import settings
+from django.db import close_old_connections
+from django.contrib.auth.models import User
+from django.contrib.postgres.search import SearchQuery, SearchRank, TrigramWordSimilarity
+from django.db.models import Case, Count, F, IntegerField, Q, Value, When, Window
+from django.db.models.functions import Greatest, RowNumber
+from django.utils.module_loading import import_string
+
+from news.models import News
+from blog.models import Blog
+from trackers.models import MP, Bill, Loan, Budget, Hansard, OrderPaper
+from resources.models import Explainers, Report, PartnerPublication, Statement
+from multimedia.models import Podcast, XSpace, Gallery, Poll
+from chatbot.retrieval import matching_document_paths
+
+from news.serializers import NewsListSerializer
+from blog.serializers import BlogListSerializer
+from trackers.serializers import (
+    MPListSerializer, BillListSerializer, LoanSerializer,
+    BudgetSerializer, HansardSerializer, OrderPaperSerializer
+)
+from resources.serializers import ExplainersSerializer, ReportSerializer, PartnerPublicationSerializer, StatementSerializer
+from multimedia.serializers import PodcastSerializer, XSpaceSerializer, GallerySerializer, PollSerializer
+
+logger = logging.getLogger(__name__)
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_executor():
+    """
+    Return the process-wide search worker pool, creating it on first use.
+
+    Every worker thread holds at most one database connection, so SEARCH_WORKERS caps
+    the connections search fan-out uses per process however many searches run at once;
+    extra category searches wait in the pool's queue.
+    """
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=getattr(settings, 'SEARCH_WORKERS', 4),
+                thread_name_prefix='search',
+            )
+        return _executor
+
+
+def build_search_query(query):
+    """
+    Build the full-text query for a search box string.
+
+    Matches the words as typed (websearch syntax, so quotes and -exclusions work), or
+    every word as a prefix so partially typed words still find results.
+    """
+    search_query = SearchQuery(query, search_type='websearch', config='english')
+    terms = re.findall(r'\w+', query.lower())
+    if terms:
+        search_query |= SearchQuery(' & '.join(f'{term}:*' for term in terms), search_type='raw', config='english')
+    return search_query
+
+
+def matching_authors(query, limit=100):
+    """
+    Ids of users whose username, first or last name starts with the query, through the
+    UPPER(...) prefix indexes on auth_user (news migration 0009)
+    """
+    return list(
+        User.objects.filter(
+            Q(username__istartswith=query) | Q(first_name__istartswith=query) | Q(last_name__istartswith=query)
+        ).values_list('id', flat=True)[:limit]
+    )
+
+
+def resolve_extra_matches(query):
+    """
+    Resolve the matches the search vectors cannot express to id and path lists.
+
+    They are looked up once per search, before the fan-out, and filtered on as plain
+    lists: OR-ed with a subquery, the search_vector condition could not use its index.
+    """
+    return {
+        'authors': matching_authors(query),
+        'files': matching_document_paths(query),
+    }
+
+
+def author_matches(matches):
+    """Match records written by one of the matching authors"""
+    return Q(author_id__in=matches['authors']) if matches['authors'] else None
+
+
+def file_matches(matches):
+    """Match records whose file's extracted text contains the query"""
+    return Q(file__in=matches['files']) if matches['files'] else None
+
+
+class ModelSearchBackend:
+    """
+    Searches every content type through the search_vector column of its own model.
+
+    Each category defines the base queryset (with the columns its serializer needs),
+    the serializer, the ordering used to break ties in rank and, optionally, extra
+    matches that the search vector cannot express (authors, text of attached files),
+    built from the lists resolve_extra_matches() returns.
+    """
+    categories = {
+        'news': {
+            'queryset': lambda: News.objects.filter(status='published').select_related('author').only(
+                'id', 'title', 'slug', 'author', 'category', 'image', 'published_date'
+            ),
+            'serializer': NewsListSerializer,
+            'ordering': ['-published_date'],
+            'extra': author_matches,
+        },
+        'blogs': {
+            'queryset': lambda: Blog.objects.filter(status='published').select_related('author').only(
+                'id', 'title', 'slug', 'author', 'category', 'image', 'published_date'
+            ),
+            'serializer': BlogListSerializer,
+            'ordering': ['-published_date'],
+            'extra': author_matches,
+        },
+        'mps': {
+            'queryset': lambda: MP.objects.only('id', 'name', 'party', 'constituency', 'district', 'photo'),
+            'serializer': MPListSerializer,
+            'ordering': ['name'],
+        },
+        'bills': {
+            'queryset': lambda: Bill.objects.only(
+                'id', 'title', 'bill_type', 'mover', 'status', 'year_introduced', 'created_at'
+            ),
+            'serializer': BillListSerializer,
+            'ordering': ['-created_at'],
+        },
+        'loans': {
+            'queryset': lambda: Loan.objects.only(
+                'id', 'sector', 'label', 'approved_amount', 'currency', 'source', 'approval_date'
+            ),
+            'serializer': LoanSerializer,
+            'ordering': ['-approval_date'],
+        },
+        'budgets': {
+            'queryset': lambda: Budget.objects.only('id', 'name', 'financial_year', 'file', 'created_at'),
+            'serializer': BudgetSerializer,
+            'ordering': ['-financial_year'],
+            'extra': file_matches,
+        },
+        'hansards': {
+            'queryset': lambda: Hansard.objects.only('id', 'name', 'date', 'file', 'created_at'),
+            'serializer': HansardSerializer,
+            'ordering': ['-date'],
+            'extra': file_matches,
+        },
+        'order_papers': {
+            'queryset': lambda: OrderPaper.objects.only('id', 'name', 'description', 'file', 'created_at'),
+            'serializer': OrderPaperSerializer,
+            'ordering': ['-created_at'],
+            'extra': file_matches,
+        },
+        'explainers': {
+            'queryset': lambda: Explainers.objects.only('id', 'name', 'description', 'file', 'created_at'),
+            'serializer': ExplainersSerializer,
+            'ordering': ['-created_at'],
+            'extra': file_matches,
+        },
+        'reports': {
+            'queryset': lambda: Report.objects.only('id', 'name', 'description', 'file', 'created_at'),
+            'serializer': ReportSerializer,
+            'ordering': ['-created_at'],
+            'extra': file_matches,
+        },
+        'partner_publications': {
+            'queryset': lambda: PartnerPublication.objects.only('id', 'name', 'description', 'file', 'created_at'),
+            'serializer': PartnerPublicationSerializer,
+            'ordering': ['-created_at'],
+            'extra': file_matches,
+        },
+        'statements': {
+            'queryset': lambda: Statement.objects.only('id', 'name', 'description', 'file', 'created_at'),
+            'serializer': StatementSerializer,
+            'ordering': ['-created_at'],
+            'extra': file_matches,
+        },
+        'podcasts': {
+            'queryset': lambda: Podcast.objects.only(
+                'id', 'title', 'host', 'guest', 'youtube_url', 'thumbnail', 'published_date', 'category'
+            ),
+            'serializer': PodcastSerializer,
+            'ordering': ['-published_date'],
+        },
+        'xspaces': {
+            'queryset': lambda: XSpace.objects.only(
+                'id', 'title', 'host', 'scheduled_date', 'x_space_url', 'thumbnail', 'status'
+            ),
+            'serializer': XSpaceSerializer,
+            'ordering': ['-scheduled_date'],
+        },
+        'gallery': {
+            'queryset': lambda: Gallery.objects.only(
+                'id', 'title', 'description', 'image', 'category', 'event_date', 'photographer'
+            ),
+            'serializer': GallerySerializer,
+            'ordering': ['-featured', '-event_date'],
+        },
+        'polls': {
+            'queryset': lambda: Poll.objects.filter(status='active').only(
+                'id', 'title', 'description', 'category', 'status', 'start_date', 'end_date', 'featured'
+            ),
+            'serializer': PollSerializer,
+            'ordering': ['-featured', '-created_at'],
+        },
+    }
+
+    def search(self, query, limit, count=True):
+        """
+        Search all categories in parallel on the shared search worker pool.
+
+        Categories that fail, or are not done within SEARCH_TIMEOUT seconds, come back
+        with no results and a None count, and are listed in incomplete, so one slow
+        category cannot hold up the whole search.
+
+        Args:
+            count: Whether to count the matches of each category
+
+        Returns:
+            Tuple of (results, counts, incomplete): results and counts are dicts keyed
+            by category, counts is None when count is False, and incomplete is the list
+            of categories left out
+        """
+        results = {}
+        counts = {}
+        incomplete = []
+
+        matches = resolve_extra_matches(query)
+        executor = get_executor()
+        futures = {
+            executor.submit(self._search_category_task, category, query, limit, count, matches): category
+            for category in self.categories
+        }
+
+        done, _not_done = wait(futures, timeout=getattr(settings, 'SEARCH_TIMEOUT', 5))
+        for future, category in futures.items():
+            if future not in done:
+                # Dropped if it has not started yet; a running query finishes in the background
+                future.cancel()
+                logger.warning(f"Timed out searching {category}")
+                results[category] = []
+                counts[category] = None
+                incomplete.append(category)
+                continue
+            try:
+                category_results, category_count = future.result()
+                results[category] = category_results
+                counts[category] = category_count
+            except Exception as e:
+                # Log error but don't fail entire search
+                logger.warning(f"Error searching {category}: {e}")
+                results[category] = []
+                counts[category] = None
+                incomplete.append(category)
+
+        return results, counts if count else None, incomplete
+
+    def _search_category_task(self, category, query, limit, count, matches):
+        """
+        Worker-pool task: search one category.
+
+        Worker threads outlive requests, so their connections are recycled here the way
+        Django does at the start and end of a request (CONN_MAX_AGE, health checks).
+        """
+        close_old_connections()
+        try:
+            return self.search_category(category, query, limit, count, matches)
+        finally:
+            close_old_connections()
+
+    def search_category(self, category, query, limit, count=True, matches=None):
+        """
+        Search one category, best matches first.
+
+        The total number of matches is read from a COUNT(*) OVER () window on the page
+        rows, so the page and the count come from a single query.
+
+        Args:
+            matches: The query's resolve_extra_matches() (resolved here if not given)
+
+        Returns:
+            Tuple of (serialized results, total number of matches or None)
+        """
+        config = self.categories[category]
+        search_query = build_search_query(query)
+
+        filters = Q(search_vector=search_query)
+        if 'extra' in config:
+            if matches is None:
+                matches = resolve_extra_matches(query)
+            extra = config['extra'](matches)
+            if extra is not None:
+                filters |= extra
+
+        queryset = config['queryset']().filter(filters).annotate(
+            rank=SearchRank(F('search_vector'), search_query)
+        )
+        if count:
+            queryset = queryset.annotate(total=Window(Count('*')))
+        page = list(queryset.order_by('-rank', *config['ordering'])[:limit])
+
+        serializer = config['serializer'](page, many=True)
+        if not count:
+            return serializer.data, None
+        return serializer.data, page[0].total if page else 0
+
+
+class DocumentSearchBackend:
+    """
+    Searches the SearchDocument table kept in sync by the search app's signals.
+
+    Results are the serialized payloads stored at index time, so no content model is
+    loaded except for categories marked 'live' (polls, whose vote counts change).
+    """
+
+    def search(self, query, limit, count=True):
+        """
+        Search all categories in one query, ranking within each category and counting
+        its matches with window functions.
+
+        Args:
+            count: Whether to count the matches of each category
+
+        Returns:
+            Tuple of (results, counts, incomplete) as for ModelSearchBackend.search;
+            incomplete is always empty, as the single query either answers for every
+            category or fails
+        """
+        from search.indexing import SEARCH_TYPES
+        from search.models import SearchDocument
+
+        search_query = build_search_query(query)
+        windows = {
+            'position': Window(
+                RowNumber(),
+                partition_by=F('doc_type'),
+                order_by=[F('rank').desc(), F('date').desc(nulls_last=True), F('title').asc()],
+            ),
+        }
+        if count:
+            windows['total'] = Window(Count('*'), partition_by=F('doc_type'))
+        # The file matches are resolved to a list first: OR-ed with a subquery, the
+        # search_vector condition could not use the GIN index
+        filters = Q(search_vector=search_query)
+        paths = matching_document_paths(query)
+        if paths:
+            filters |= Q(file_path__in=paths)
+        matches = SearchDocument.objects.filter(filters).annotate(
+            rank=SearchRank(F('search_vector'), search_query)
+        ).annotate(**windows).filter(position__lte=limit).order_by('doc_type', 'position')
+
+        results = {doc_type: [] for doc_type in SEARCH_TYPES}
+        counts = {doc_type: 0 for doc_type in SEARCH_TYPES}
+        live_ids = {}
+        for row in matches.values('doc_type', 'object_id', 'payload', *windows):
+            doc_type = row['doc_type']
+            if doc_type not in SEARCH_TYPES:
+                continue
+            if count:
+                counts[doc_type] = row['total']
+            if SEARCH_TYPES[doc_type].get('live'):
+                live_ids.setdefault(doc_type, []).append(row['object_id'])
+            else:
+                results[doc_type].append(row['payload'])
+
+        for doc_type, ids in live_ids.items():
+            config = SEARCH_TYPES[doc_type]
+            objects = config['queryset']().in_bulk(ids)
+            results[doc_type] = [config['serializer'](objects[pk]).data for pk in ids if pk in objects]
+
+        return results, counts if count else None, []
+
+
+def autocomplete(query, limit):
+    """
+    Suggest records whose title or subtitle has a word starting with the query, then
+    records whose title or subtitle is a close (misspelt) match.
+
+    Both conditions are served by the pg_trgm GIN indexes on SearchDocument, and only
+    the columns needed for a suggestion are read.
+
+    Returns:
+        List of dicts with the category, id, title, subtitle and slug of each match
+    """
+    from search.models import SearchDocument
+
+    word_prefix = r'\m' + re.escape(query)
+    prefix_match = Q(title__iregex=word_prefix) | Q(subtitle__iregex=word_prefix)
+    matches = SearchDocument.objects.filter(
+        prefix_match | Q(title__trigram_word_similar=query) | Q(subtitle__trigram_word_similar=query)
+    ).annotate(
+        is_prefix=Case(When(prefix_match, then=Value(1)), default=Value(0), output_field=IntegerField()),
+        similarity=Greatest(TrigramWordSimilarity(query, 'title'), TrigramWordSimilarity(query, 'subtitle')),
+    ).order_by('-is_prefix', '-similarity', F('date').desc(nulls_last=True), 'title')[:limit]
+
+    return [
+        {
+            'type': doc_type,
+            'id': object_id,
+            'title': title,
+            'subtitle': subtitle,
+            'slug': slug,
+        }
+        for doc_type, object_id, title, subtitle, slug in matches.values_list(
+            'doc_type', 'object_id', 'title', 'subtitle', 'payload__slug'
+        )
+    ]
+
+
+def get_search_backend():
+    """Return an instance of the search backend named by the SEARCH_BACKEND setting"""
+    return import_string(getattr(settings, 'SEARCH_BACKEND', 'main.search.DocumentSearchBackend'))()
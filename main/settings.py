@@ -40,6 +40,7 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',
     'ckeditor',
     'ckeditor_uploader',
     'accounts',
@@ -52,6 +53,7 @@ INSTALLED_APPS = [
     'multimedia',
     'trackers',
     'chatbot',
+    'search',
     'rest_framework',
     'corsheaders',
 ]
@@ -99,6 +101,10 @@ DATABASES = {
         'PASSWORD': config('PGPASSWORD', default=''),
         'HOST': config('PGHOST', default='localhost'),
         'PORT': config('PGPORT', default='5432'),
+        # Keep connections open between requests (and search worker tasks) instead of
+        # reconnecting every time; main/asgi.py defaults CONN_MAX_AGE to 0 under ASGI
+        'CONN_MAX_AGE': config('CONN_MAX_AGE', default=60, cast=int),
+        'CONN_HEALTH_CHECKS': True,
     }
 }
 
@@ -195,18 +201,89 @@ CSRF_TRUSTED_ORIGINS = [
 # Default primary key field type
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
+# REST framework: JSON is encoded and decoded with orjson (main.renderers); set the
+# classes back to rest_framework.renderers.JSONRenderer / rest_framework.parsers.JSONParser
+# to use the json module
+REST_FRAMEWORK = {
+    'DEFAULT_RENDERER_CLASSES': [
+        'main.renderers.ORJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
+    'DEFAULT_PARSER_CLASSES': [
+        'main.renderers.ORJSONParser',
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
+    ],
+}
+
 # Cache configuration
-CACHES = {
-    'default': {
+# Each tier is a separate cache with its own size limit, so long-tail search queries
+# cannot evict the home page summaries. With REDIS_URL set (Redis or any server speaking
+# its protocol) caches are shared by every worker process; a tier can be moved to its own
+# server, with its own memory limit and eviction policy, with <TIER>_CACHE_URL (e.g.
+# SEARCH_CACHE_URL). Without either, each process keeps a LocMemCache per tier.
+REDIS_URL = config('REDIS_URL', default='')
+
+
+def _cache_tier(name, timeout, max_entries):
+    location = config(f'{name.upper()}_CACHE_URL', default=REDIS_URL)
+    if location:
+        return {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': location,
+            'KEY_PREFIX': name,
+            'TIMEOUT': timeout,
+        }
+    return {
         'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
-        'LOCATION': 'unique-snowflake',
-        'TIMEOUT': 300,  # 5 minutes default timeout
+        'LOCATION': name,
+        'TIMEOUT': timeout,
         'OPTIONS': {
-            'MAX_ENTRIES': 1000
+            'MAX_ENTRIES': max_entries
         }
     }
+
+
+CACHES = {
+    'default': _cache_tier('default', 300, 1000),  # 5 minutes default timeout
+    'search': _cache_tier('search', 600, 5000),  # Search and autocomplete results
+    'summaries': _cache_tier('summaries', 600, 500),  # Home page summaries and other shared listings
+    'chatbot': _cache_tier('chatbot', 60 * 60 * 24, 2000),  # Chatbot answers
+    'sessions': _cache_tier('sessions', 60 * 60 * 24 * 14, 5000),
 }
 
+# Sessions are read from the cache and written through to the database
+SESSION_ENGINE = 'django.contrib.sessions.backends.cached_db'
+SESSION_CACHE_ALIAS = 'sessions'
+
+# Home page summaries are invalidated in every worker process when their data changes (their versions
+# are kept in the database, see home.cache), so they can be kept long
+SUMMARY_CACHE_TIMEOUT = 60 * 60 * 6
+CACHE_REFRESH_WORKERS = 2  # Threads rebuilding expired entries in the background (main.cache)
+
+# Chatbot retrieval configuration
+CHATBOT_CHUNK_SIZE = 1500  # Characters per indexed passage
+CHATBOT_CHUNK_OVERLAP = 200  # Characters shared between consecutive passages
+CHATBOT_TOP_K = 6  # Passages sent to the model per question
+CHATBOT_ANSWER_CACHE_TIMEOUT = 60 * 60 * 24  # Seconds a repeated question is answered from the cache
+
+# Global search backend: DocumentSearchBackend needs the index built with rebuild_search_index,
+# ModelSearchBackend searches each model's own search_vector column
+SEARCH_BACKEND = config('SEARCH_BACKEND', default='main.search.DocumentSearchBackend')
+SEARCH_WORKERS = config('SEARCH_WORKERS', default=4, cast=int)  # Database connections ModelSearchBackend may use per process
+SEARCH_TIMEOUT = config('SEARCH_TIMEOUT', default=5, cast=float)  # Seconds ModelSearchBackend waits for its categories
+
+# Document ingestion pipeline (text extraction and indexing of uploaded PDFs)
+DOCUMENT_INGESTION_WORKERS = config('DOCUMENT_INGESTION_WORKERS', default=2, cast=int)
+DOCUMENT_INGESTION_MAX_ATTEMPTS = 3
+DOCUMENT_INGESTION_RETRY_DELAY = 30  # Seconds before the first retry, doubled for each further attempt
+
+# Bulk extraction (extract_document_text) runs on a process pool
+DOCUMENT_EXTRACTION_WORKERS = config('DOCUMENT_EXTRACTION_WORKERS', default=0, cast=int)  # 0 = one per CPU
+DOCUMENT_EXTRACTION_TIMEOUT = 120  # Seconds allowed per PDF
+DOCUMENT_EXTRACTION_MEMORY_LIMIT_MB = 1024  # Address space cap per worker process
+DOCUMENT_EXTRACTION_TASKS_PER_CHILD = 50  # PDFs a worker reads before it is replaced
+
 # CKEditor Configuration
 CKEDITOR_CONFIGS = {
     'default': {
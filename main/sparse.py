@@ -0,0 +1,164 @@
+"""
+Sparse fieldsets: ?fields= and ?omit= on GET requests.
+
+?fields=id,name returns only the listed fields and ?omit=phone_no,email every field but
+the listed ones. Dotted names reach into nested serializers, e.g.
+?fields=title,members.id,members.name on a committee, or ?omit=members.bio. Unknown
+names are ignored.
+
+Serializers opt in with SparseFieldsMixin. Views using SparseQuerysetMixin (main.mixins)
+also narrow the queryset with only() to the columns the remaining fields read and skip
+prefetching relations they leave out, and ValuesListMixin fetches only their values.
+"""
+from django.core.exceptions import FieldDoesNotExist
+from rest_framework import serializers
+
+from .rendering import RenderedHTMLField
+
+SAFE_METHODS = ('GET', 'HEAD')
+
+_UNSET = object()
+
+
+def _parse(value):
+    """'a,b.c,b.d' -> {'a': {}, 'b': {'c': {}, 'd': {}}}"""
+    tree = {}
+    for path in value.split(','):
+        node = tree
+        for name in filter(None, (part.strip() for part in path.split('.'))):
+            node = node.setdefault(name, {})
+    return tree
+
+
+def get_sparse_fields(request):
+    """
+    The sparse fieldset requested, as a tuple of (fields, omit) trees (either may be
+    None), or None when the request asks for every field.
+    """
+    if request is None or request.method not in SAFE_METHODS:
+        return None
+    fields = request.query_params.get('fields')
+    omit = request.query_params.get('omit')
+    if not fields and not omit:
+        return None
+    return (_parse(fields) if fields else None, _parse(omit) if omit else None)
+
+
+def select_field_names(names, sparse):
+    """The names left of a serializer's field names under a (fields, omit) fieldset"""
+    fields, omit = sparse
+    return [
+        name for name in names
+        if (fields is None or name in fields) and not (omit and omit.get(name) == {})
+    ]
+
+
+class SparseFieldsMixin:
+    """
+    ModelSerializer mixin applying the request's sparse fieldset to its fields.
+
+    The top-level serializer reads ?fields= / ?omit= from the request in its context and
+    hands the dotted parts down to nested serializers using this mixin.
+    """
+
+    def get_fields(self):
+        fields = super().get_fields()
+        sparse = getattr(self, '_sparse_fields', _UNSET)
+        if sparse is _UNSET:
+            parent = self.parent.parent if isinstance(self.parent, serializers.ListSerializer) else self.parent
+            sparse = get_sparse_fields(self.context.get('request')) if parent is None else None
+        if sparse is None:
+            return fields
+
+        include, omit = sparse
+        selected = select_field_names(fields, sparse)
+        for name in list(fields):
+            if name not in selected:
+                del fields[name]
+                continue
+            nested = getattr(fields[name], 'child', fields[name])
+            nested_sparse = ((include or {}).get(name) or None, (omit or {}).get(name) or None)
+            if isinstance(nested, SparseFieldsMixin) and nested_sparse != (None, None):
+                nested._sparse_fields = nested_sparse
+        return fields
+
+
+def _field_sources(serializer, field):
+    """
+    Names of the model fields (columns or relations) a serializer field reads, or None
+    when that cannot be told.
+    """
+    model = serializer.Meta.model
+    values_fields = getattr(serializer.Meta, 'values_fields', {})
+    if field.field_name in values_fields:
+        lookups, _function = values_fields[field.field_name]
+        return [lookup.split('__')[0] for lookup in lookups]
+    if isinstance(field, RenderedHTMLField):
+        return [field.html_field, model.rendered_html_fields[field.html_field], 'rendered_media_base']
+    if isinstance(field, serializers.SerializerMethodField) or field.source == '*':
+        return None
+
+    name = field.source.split('.')[0]
+    if name.endswith('_display'):
+        name = name.removeprefix('get_').removesuffix('_display')
+    try:
+        model._meta.get_field(name)
+    except FieldDoesNotExist:
+        return None
+    return [name]
+
+
+def _select_related_lookups(name, nested):
+    """query.select_related tree -> select_related() lookups"""
+    if not nested:
+        return [name]
+    return [f'{name}__{lookup}' for key, value in nested.items() for lookup in _select_related_lookups(key, value)]
+
+
+def narrow_queryset(serializer, queryset):
+    """
+    Narrow a queryset to what a serializer, narrowed by a sparse fieldset, reads: only()
+    its columns, and drop the prefetches of relations it no longer shows.
+
+    The queryset is returned unchanged if some field reads attributes that cannot be
+    mapped to model fields (e.g. undeclared method fields).
+    """
+    select_related = queryset.query.select_related
+    if select_related is True:
+        return queryset
+
+    sources = set()
+    for field in serializer.fields.values():
+        field_sources = _field_sources(serializer, field)
+        if field_sources is None:
+            return queryset
+        sources.update(field_sources)
+
+    if select_related and not set(select_related) <= sources:
+        # Stop joining relations the remaining fields do not show
+        lookups = [
+            lookup for name in select_related if name in sources
+            for lookup in _select_related_lookups(name, select_related[name])
+        ]
+        queryset = queryset.select_related(None)
+        if lookups:
+            queryset = queryset.select_related(*lookups)
+        select_related = queryset.query.select_related
+
+    opts = queryset.model._meta
+    columns = {opts.pk.name}
+    # Relations followed with select_related() cannot be deferred
+    columns.update(select_related or ())
+    for name in sources:
+        model_field = opts.get_field(name)
+        if model_field.concrete and not model_field.many_to_many:
+            columns.add(name)
+
+    prefetches = queryset._prefetch_related_lookups
+    kept = [
+        lookup for lookup in prefetches
+        if getattr(lookup, 'prefetch_through', lookup).split('__')[0] in sources
+    ]
+    if len(kept) != len(prefetches):
+        queryset = queryset.prefetch_related(None).prefetch_related(*kept)
+    return queryset.only(*sorted(columns))
@@ -0,0 +1,225 @@
+import datetime
+import io
+import threading
+import time
+import uuid
+from decimal import Decimal
+from django.core.cache.backends.locmem import LocMemCache
+from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
+from django.utils.translation import gettext_lazy
+from rest_framework.exceptions import ParseError
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+
+from news.models import News
+
+from .cache import get_many_or_build, get_or_build, get_versions, new_versions
+from .renderers import ORJSONParser, ORJSONRenderer
+from .sparse import _parse, get_sparse_fields, select_field_names
+from .utils import MediaURLField, get_full_media_url, get_media_base_url, media_url, process_content_images
+
+
+def wait_for(condition, timeout=5):
+    """Wait for a background refresh to get somewhere"""
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise AssertionError('Timed out waiting for the cache refresh')
+        time.sleep(0.01)
+
+
+class GetOrBuildTests(SimpleTestCase):
+
+    def setUp(self):
+        self.cache = LocMemCache('main-tests', {})
+        self.cache.clear()
+        self.builds = 0
+
+    def build(self, value='value'):
+        def build():
+            self.builds += 1
+            return value
+        return build
+
+    def test_miss_builds_and_caches(self):
+        self.assertEqual(get_or_build(self.cache, 'key', self.build(), 60), 'value')
+        self.assertEqual(get_or_build(self.cache, 'key', self.build('other'), 60), 'value')
+        self.assertEqual(self.builds, 1)
+        self.assertIsNone(self.cache.get('key:lock'))
+
+    def test_concurrent_misses_build_once(self):
+        started = threading.Event()
+
+        def slow_build():
+            started.set()
+            time.sleep(0.2)
+            return self.build()()
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(get_or_build(self.cache, 'key', slow_build, 60)))
+            for _ in range(5)
+        ]
+        threads[0].start()
+        started.wait()
+        for thread in threads[1:]:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(results, ['value'] * 5)
+        self.assertEqual(self.builds, 1)
+
+    def test_stale_value_is_served_while_refreshed(self):
+        get_or_build(self.cache, 'key', self.build('old'), timeout=0, stale_timeout=60)
+
+        self.assertEqual(get_or_build(self.cache, 'key', self.build('new'), timeout=60), 'old')
+        wait_for(lambda: self.cache.get('key')[1] == 'new')
+        self.assertEqual(get_or_build(self.cache, 'key', self.build('newer'), timeout=60), 'new')
+        self.assertEqual(self.builds, 2)
+
+    def test_failed_refresh_keeps_value_and_releases_lock(self):
+        get_or_build(self.cache, 'key', self.build('old'), timeout=0, stale_timeout=60)
+
+        def failing_build():
+            raise ValueError('database is down')
+
+        with self.assertLogs('main.cache', 'WARNING'):
+            self.assertEqual(get_or_build(self.cache, 'key', failing_build, timeout=60), 'old')
+            wait_for(lambda: self.cache.get('key:lock') is None)
+        self.assertEqual(self.cache.get('key')[1], 'old')
+
+    def test_get_many_or_build(self):
+        get_or_build(self.cache, 'cached', self.build('cached'), 60)
+
+        values = get_many_or_build(self.cache, {'cached': self.build('other'), 'missing': self.build('built')}, 60)
+
+        self.assertEqual(values, {'cached': 'cached', 'missing': 'built'})
+        self.assertEqual(self.builds, 2)
+
+
+class VersionTests(TestCase):
+
+    def test_version_is_started_once(self):
+        first = get_versions(['a', 'b'])
+        self.assertNotEqual(first['a'], first['b'])
+        self.assertEqual(get_versions(['a', 'b']), first)
+
+    def test_new_versions(self):
+        before = get_versions(['a', 'b'])
+        new_versions(['a', 'c'])
+        after = get_versions(['a', 'b', 'c'])
+
+        self.assertNotEqual(after['a'], before['a'])
+        self.assertEqual(after['b'], before['b'])
+        self.assertEqual(len(after['c']), 32)
+
+
+class ORJSONTests(SimpleTestCase):
+    data = {
+        'text': 'Mbarara \u2028 Gulu \u2029 Kampala \u00e9',
+        'numbers': [0, -1, 2 ** 40, 1.5, 1e16, None, True],
+        'decimals': [Decimal('12.50'), Decimal('1E+16'), Decimal('0.1')],
+        'date': datetime.date(2024, 6, 13),
+        'datetime': datetime.datetime(2024, 6, 13, 14, 30, 5, 123456, tzinfo=datetime.timezone.utc),
+        'time': datetime.time(9, 15),
+        'duration': datetime.timedelta(days=1, seconds=5),
+        'uuid': uuid.UUID('12345678-1234-5678-1234-567812345678'),
+        'lazy': gettext_lazy('Parliament'),
+        'nested': {1: [{'a': ()}], 'b': set()},
+    }
+
+    def test_same_output_as_json_renderer(self):
+        self.assertEqual(ORJSONRenderer().render(self.data), JSONRenderer().render(self.data))
+
+    def test_line_separators_are_escaped(self):
+        content = ORJSONRenderer().render({'text': '\u2028\u2029'})
+        self.assertEqual(content, b'{"text":"\\u2028\\u2029"}')
+
+    def test_indented_output(self):
+        media_type = 'application/json; indent=2'
+        self.assertEqual(
+            ORJSONRenderer().render(self.data, media_type), JSONRenderer().render(self.data, media_type)
+        )
+
+    def test_none_renders_empty(self):
+        self.assertEqual(ORJSONRenderer().render(None), b'')
+
+    def test_parse(self):
+        stream = io.BytesIO('{"title": "Budget \u00e9", "amount": 1.5, "ids": [1, 2]}'.encode())
+        self.assertEqual(ORJSONParser().parse(stream), {'title': 'Budget \u00e9', 'amount': 1.5, 'ids': [1, 2]})
+
+    def test_parse_other_encoding(self):
+        stream = io.BytesIO('{"title": "Budget \u00e9"}'.encode('latin-1'))
+        self.assertEqual(
+            ORJSONParser().parse(stream, parser_context={'encoding': 'latin-1'}), {'title': 'Budget \u00e9'}
+        )
+
+    def test_parse_error(self):
+        with self.assertRaises(ParseError):
+            ORJSONParser().parse(io.BytesIO(b'{"title": '))
+
+
+class SparseFieldsTests(SimpleTestCase):
+
+    def sparse(self, method='get', **params):
+        return get_sparse_fields(Request(getattr(RequestFactory(), method)('/', params)))
+
+    def test_parse(self):
+        self.assertEqual(
+            _parse('id, title,members.id,members.name,,documents.'),
+            {'id': {}, 'title': {}, 'members': {'id': {}, 'name': {}}, 'documents': {}}
+        )
+
+    def test_get_sparse_fields(self):
+        self.assertIsNone(self.sparse())
+        self.assertIsNone(self.sparse(fields=''))
+        self.assertEqual(self.sparse(fields='id,name'), ({'id': {}, 'name': {}}, None))
+        self.assertEqual(self.sparse(omit='bio'), (None, {'bio': {}}))
+        self.assertEqual(self.sparse(fields='id', omit='id'), ({'id': {}}, {'id': {}}))
+
+    def test_only_read_requests(self):
+        self.assertIsNone(self.sparse('post', fields='id'))
+
+    def test_select_field_names(self):
+        names = ['id', 'name', 'members', 'bio']
+        self.assertEqual(select_field_names(names, ({'name': {}, 'id': {}, 'unknown': {}}, None)), ['id', 'name'])
+        self.assertEqual(select_field_names(names, (None, {'bio': {}})), ['id', 'name', 'members'])
+        # Omitting a nested field keeps its parent
+        self.assertEqual(select_field_names(names, (None, {'members': {'bio': {}}})), names)
+        self.assertEqual(select_field_names(names, ({'id': {}, 'bio': {}}, {'bio': {}})), ['id'])
+
+
+@override_settings(FULL_MEDIA_URL='https://cdn.example.com/media/')
+class MediaURLTests(SimpleTestCase):
+
+    def test_base_url_follows_the_settings(self):
+        self.assertEqual(get_media_base_url(), 'https://cdn.example.com/media')
+        with override_settings(FULL_MEDIA_URL='', DEBUG=True, MEDIA_URL='/uploads/'):
+            self.assertEqual(get_media_base_url(), 'http://localhost:8000/uploads')
+        self.assertEqual(get_media_base_url(), 'https://cdn.example.com/media')
+
+    def test_media_url(self):
+        self.assertEqual(media_url('news/chart 1.png'), 'https://cdn.example.com/media/news/chart%201.png')
+        self.assertIsNone(media_url(''))
+        self.assertIsNone(media_url(None))
+
+    def test_media_url_field(self):
+        field = MediaURLField()
+        self.assertTrue(field.read_only)
+        self.assertEqual(
+            field.to_representation(News(image='news/chart.png').image), 'https://cdn.example.com/media/news/chart.png'
+        )
+        self.assertIsNone(field.to_representation(News().image))
+
+    def test_relative_paths(self):
+        for path in ['/media/news/chart.png', 'media/news/chart.png', 'news/chart.png']:
+            self.assertEqual(get_full_media_url(path), 'https://cdn.example.com/media/news/chart.png')
+        self.assertIsNone(get_full_media_url(''))
+
+    def test_absolute_urls_are_left_alone(self):
+        html = '<img src="https://example.com/logo.png"><img alt="" src=\'/media/news/chart.png\'>'
+        self.assertEqual(
+            process_content_images(html),
+            '<img src="https://example.com/logo.png"><img alt="" src=\'https://cdn.example.com/media/news/chart.png\'>'
+        )
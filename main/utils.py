@@ -2,8 +2,55 @@
 Utility functions for the main app
 """
 import re
+from functools import lru_cache
 from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.utils.encoding import filepath_to_uri
 from decouple import config
+from rest_framework import serializers
+
+
+@lru_cache(maxsize=None)
+def get_media_base_url():
+    """
+    Full URL that media paths are appended to, without a trailing slash.
+
+    Resolved once per process: settings.FULL_MEDIA_URL, or MEDIA_URL on the local
+    server in DEBUG, or MEDIA_URL on BACKEND_DOMAIN.
+    """
+    # Use full backend URL from settings
+    full_media_url = getattr(settings, 'FULL_MEDIA_URL', None)
+    if full_media_url:
+        return full_media_url.rstrip('/')
+
+    # Fallback: construct from MEDIA_URL
+    if settings.DEBUG:
+        return f"http://localhost:8000{settings.MEDIA_URL}".rstrip('/')
+
+    # In production, try to get from environment or use default
+    backend_domain = config('BACKEND_DOMAIN', default='https://pwatch-backend-production.up.railway.app')
+    return f"{backend_domain}{settings.MEDIA_URL}".rstrip('/')
+
+
+@receiver(setting_changed)
+def clear_media_base_url(setting, **kwargs):
+    """Resolve the base URL again when the settings it is built from change (override_settings)"""
+    if setting in ('FULL_MEDIA_URL', 'MEDIA_URL', 'DEBUG'):
+        get_media_base_url.cache_clear()
+
+
+def media_url(name):
+    """
+    Full URL of a stored media file, built from its name (FieldFile.name, relative to
+    MEDIA_ROOT) without going through the storage backend.
+
+    Returns:
+        The URL, or None for an empty name
+    """
+    if not name:
+        return None
+    return f"{get_media_base_url()}/{filepath_to_uri(name)}"
 
 
 def get_full_media_url(relative_url):
@@ -25,20 +72,23 @@ def get_full_media_url(relative_url):
     elif relative_url.startswith('media/'):
         relative_url = relative_url[6:]  # Remove 'media/'
     
-    # Get full media URL from settings
-    full_media_url = getattr(settings, 'FULL_MEDIA_URL', None)
-    if full_media_url:
-        # Remove trailing slash if present
-        full_media_url = full_media_url.rstrip('/')
-        return f"{full_media_url}/{relative_url}"
-    
-    # Fallback: construct from MEDIA_URL
-    if settings.DEBUG:
-        return f"http://localhost:8000{settings.MEDIA_URL}{relative_url}"
-    else:
-        # In production, try to get from environment or use default
-        backend_domain = config('BACKEND_DOMAIN', default='https://pwatch-backend-production.up.railway.app')
-        return f"{backend_domain}{settings.MEDIA_URL}{relative_url}"
+    return f"{get_media_base_url()}/{relative_url}"
+
+
+class MediaURLField(serializers.Field):
+    """
+    Read-only serializer field rendering a FileField/ImageField as its full URL.
+
+    Equivalent to get_full_media_url(obj.file.url), but the URL is built straight from
+    the stored file name and the base URL resolved once per process.
+    """
+
+    def __init__(self, **kwargs):
+        kwargs['read_only'] = True
+        super().__init__(**kwargs)
+
+    def to_representation(self, value):
+        return media_url(value.name) if value else None
 
 
 def process_content_images(html_content):
@@ -55,15 +105,7 @@ def process_content_images(html_content):
         return html_content
     
     # Get full media URL base
-    full_media_url = getattr(settings, 'FULL_MEDIA_URL', None)
-    if not full_media_url:
-        if settings.DEBUG:
-            full_media_url = f"http://localhost:8000{settings.MEDIA_URL}"
-        else:
-            backend_domain = config('BACKEND_DOMAIN', default='https://pwatch-backend-production.up.railway.app')
-            full_media_url = f"{backend_domain}{settings.MEDIA_URL}"
-    
-    full_media_url = full_media_url.rstrip('/')
+    full_media_url = get_media_base_url()
     
     # Pattern to match img tags with src attributes
     # Matches: <img src="/media/..." or <img src="media/..." or <img src="ckeditor/..."
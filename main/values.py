@@ -0,0 +1,121 @@
+"""
+Read-only list serialization straight from values() rows.
+
+A ValuesSerializer is compiled once from a ModelSerializer class into the list of
+lookups to fetch with queryset.values() and, per output field, how to turn the row's
+value into the field's representation. Rows are then serialized without building model
+instances or going through DRF's per-field machinery, and the JSON is the same as the
+ModelSerializer's.
+
+Supported fields:
+
+- Model fields; only those whose representation differs from the database value
+  (dates, decimals, ...) go through the DRF field's to_representation()
+- MediaURLField: the URL is built from the stored file name
+- Choice labels (source='get_<field>_display' or '<field>_display'): looked up in the
+  choice field's label map
+- SerializerMethodField, when Meta.values_fields declares it as
+  {'name': ((lookup, ...), function)}; function gets the lookups' values in order
+
+Anything else raises ImproperlyConfigured when the serializer is compiled.
+"""
+import copy
+from functools import lru_cache
+from django.core.exceptions import FieldDoesNotExist, ImproperlyConfigured
+from rest_framework import serializers
+
+from .utils import MediaURLField, media_url
+
+# Fields whose representation is the database value itself
+PASSTHROUGH_FIELDS = (
+    serializers.CharField, serializers.IntegerField, serializers.BooleanField,
+)
+
+
+def _label_getter(choices):
+    labels = {value: str(label) for value, label in choices}
+    return lambda value: labels.get(value, value)
+
+
+class ValuesSerializer:
+    """A ModelSerializer compiled into a values() projection"""
+
+    def __init__(self, serializer_class):
+        self.serializer_class = serializer_class
+        model = serializer_class.Meta.model
+        values_fields = getattr(serializer_class.Meta, 'values_fields', {})
+
+        self.lookups = []
+        self.fields = []  # (name, lookups, convert, is_method) per output field
+        for name, field in serializer_class().fields.items():
+            if name in values_fields:
+                lookups, function = values_fields[name]
+                self.fields.append((name, tuple(lookups), function, True))
+                self.lookups.extend(lookups)
+                continue
+
+            if isinstance(field, serializers.SerializerMethodField):
+                raise ImproperlyConfigured(
+                    f"{serializer_class.__name__}.{name}: declare it in Meta.values_fields "
+                    f"to serialize it from values()"
+                )
+
+            source = field.source
+            if isinstance(field, MediaURLField):
+                convert = media_url
+            elif source.endswith('_display'):
+                source = source.removeprefix('get_').removesuffix('_display')
+                try:
+                    convert = _label_getter(model._meta.get_field(source).flatchoices)
+                except FieldDoesNotExist:
+                    raise ImproperlyConfigured(f"{serializer_class.__name__}.{name}: no choice field '{source}'")
+            elif '.' in source or source == '*' or isinstance(field, serializers.RelatedField):
+                raise ImproperlyConfigured(
+                    f"{serializer_class.__name__}.{name}: {type(field).__name__} cannot be serialized from values()"
+                )
+            elif type(field) in PASSTHROUGH_FIELDS:
+                convert = None
+            else:
+                convert = field.to_representation
+
+            self.fields.append((name, (source,), convert, False))
+            self.lookups.append(source)
+
+        self.lookups = list(dict.fromkeys(self.lookups))
+
+    @property
+    def names(self):
+        """Output field names, in order"""
+        return [name for name, *_rest in self.fields]
+
+    def select(self, names):
+        """A copy serializing only the given output fields"""
+        selected = copy.copy(self)
+        selected.fields = [field for field in self.fields if field[0] in names]
+        selected.lookups = list(dict.fromkeys(lookup for _name, lookups, *_rest in selected.fields for lookup in lookups))
+        return selected
+
+    def values(self, queryset):
+        """The queryset's rows with only the lookups the output needs"""
+        return queryset.values(*(self.lookups or ['pk']))
+
+    def to_representation(self, row):
+        data = {}
+        for name, lookups, convert, is_method in self.fields:
+            if is_method:
+                data[name] = convert(*(row[lookup] for lookup in lookups))
+                continue
+            value = row[lookups[0]]
+            if convert is not None and value is not None:
+                value = convert(value)
+            data[name] = value
+        return data
+
+    def serialize(self, rows):
+        return [self.to_representation(row) for row in rows]
+
+
+@lru_cache(maxsize=None)
+def get_values_serializer(serializer_class):
+    """The compiled ValuesSerializer of a ModelSerializer class"""
+    return ValuesSerializer(serializer_class)
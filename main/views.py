@@ -5,30 +5,14 @@ from django.conf import settings
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.permissions import AllowAny
-from django.core.cache import cache
-from django.db.models import Q
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from django.core.cache import caches
 import os
 import zipfile
 import tempfile
 from pathlib import Path
 
-# Import models
-from news.models import News
-from blog.models import Blog
-from trackers.models import MP, Bill, Loan, Budget, Hansard, OrderPaper
-from resources.models import Explainers, Report, PartnerPublication, Statement
-from multimedia.models import Podcast, XSpace, Gallery, Poll
-
-# Import serializers
-from news.serializers import NewsListSerializer
-from blog.serializers import BlogListSerializer
-from trackers.serializers import (
-    MPListSerializer, BillListSerializer, LoanSerializer,
-    BudgetSerializer, HansardSerializer, OrderPaperSerializer
-)
-from resources.serializers import ExplainersSerializer, ReportSerializer, PartnerPublicationSerializer, StatementSerializer
-from multimedia.serializers import PodcastSerializer, XSpaceSerializer, GallerySerializer, PollSerializer
+from .cache import get_or_build
+from .search import autocomplete, get_search_backend
 
 
 def home(request):
@@ -40,8 +24,8 @@ def home(request):
 
 class GlobalSearchView(APIView):
     """
-    Optimized global search endpoint that searches across all content types.
-    Uses parallel queries, query optimization, and caching for sub-second performance.
+    Global search endpoint that searches across all content types.
+    Uses PostgreSQL full-text search (see main.search) and caching for sub-second performance.
     """
     permission_classes = [AllowAny]
 
@@ -54,251 +38,77 @@ class GlobalSearchView(APIView):
         except (ValueError, TypeError):
             limit = 5
 
+        # counts=false skips counting matches, e.g. for the search dropdown
+        count = request.query_params.get('counts', 'true').lower() not in ('false', '0', 'no')
+
         if not query:
             return Response({
                 'query': '',
                 'total_results': 0,
                 'results': {},
-                'counts': {}
+                'counts': {},
+                'partial': False,
             })
 
-        # Check cache first
-        cache_key = f'search:{query.lower()}:{limit}'
-        cached_result = cache.get(cache_key)
-        if cached_result:
-            return Response(cached_result)
+        # Cached results, computed once when several requests miss at the same time
+        cache_key = f'search:{query.lower()}:{limit}:{int(count)}'
+        response_data = get_or_build(
+            caches['search'], cache_key, lambda: self.build_results(query, limit, count), timeout=600
+        )
+        if response_data.get('partial'):
+            # Some categories failed or timed out; the next request searches them again
+            caches['search'].delete(cache_key)
 
-        # Perform parallel searches
-        results = {}
-        counts = {}
-        
-        with ThreadPoolExecutor(max_workers=10) as executor:
-            # Submit all search tasks
-            futures = {
-                executor.submit(self._search_news, query, limit): 'news',
-                executor.submit(self._search_blogs, query, limit): 'blogs',
-                executor.submit(self._search_mps, query, limit): 'mps',
-                executor.submit(self._search_bills, query, limit): 'bills',
-                executor.submit(self._search_loans, query, limit): 'loans',
-                executor.submit(self._search_budgets, query, limit): 'budgets',
-                executor.submit(self._search_hansards, query, limit): 'hansards',
-                executor.submit(self._search_order_papers, query, limit): 'order_papers',
-                executor.submit(self._search_explainers, query, limit): 'explainers',
-                executor.submit(self._search_reports, query, limit): 'reports',
-                executor.submit(self._search_partner_publications, query, limit): 'partner_publications',
-                executor.submit(self._search_statements, query, limit): 'statements',
-                executor.submit(self._search_podcasts, query, limit): 'podcasts',
-                executor.submit(self._search_xspaces, query, limit): 'xspaces',
-                executor.submit(self._search_gallery, query, limit): 'gallery',
-                executor.submit(self._search_polls, query, limit): 'polls',
-            }
+        return Response(response_data)
 
-            # Collect results as they complete
-            for future in as_completed(futures):
-                category = futures[future]
-                try:
-                    category_results, category_count = future.result(timeout=5)  # 5 second timeout per category
-                    results[category] = category_results
-                    counts[category] = category_count
-                except Exception as e:
-                    # Log error but don't fail entire search
-                    import logging
-                    logger = logging.getLogger(__name__)
-                    logger.warning(f"Error searching {category}: {e}")
-                    results[category] = []
-                    counts[category] = 0
+    def build_results(self, query, limit, count):
+        # Perform parallel searches
+        results, counts, incomplete = get_search_backend().search(query, limit, count=count)
 
-        # Calculate total results
-        total_results = sum(counts.values())
+        # Calculate total results (None when counts were skipped); categories left out
+        # have a None count
+        total_results = sum(c for c in counts.values() if c is not None) if counts is not None else None
 
-        # Prepare response
-        response_data = {
+        return {
             'query': query,
             'total_results': total_results,
             'results': results,
-            'counts': counts
+            'counts': counts,
+            # True when some categories are missing because they failed or timed out
+            'partial': bool(incomplete),
         }
 
-        # Cache for 10 minutes
-        cache.set(cache_key, response_data, 600)
-
-        return Response(response_data)
-
-    def _search_news(self, query, limit):
-        """Search news articles"""
-        q = Q(title__icontains=query) | Q(author__username__icontains=query) | Q(author__first_name__icontains=query) | Q(author__last_name__icontains=query) | Q(content__icontains=query)
-        queryset = News.objects.filter(q, status='published').select_related('author').only(
-            'id', 'title', 'slug', 'author', 'category', 'image', 'published_date'
-        ).order_by('-published_date')[:limit]
-        
-        serializer = NewsListSerializer(queryset, many=True)
-        count = News.objects.filter(q, status='published').count()
-        return serializer.data, count
-
-    def _search_blogs(self, query, limit):
-        """Search blog posts"""
-        q = Q(title__icontains=query) | Q(author__username__icontains=query) | Q(author__first_name__icontains=query) | Q(author__last_name__icontains=query) | Q(content__icontains=query)
-        queryset = Blog.objects.filter(q, status='published').select_related('author').only(
-            'id', 'title', 'slug', 'author', 'category', 'image', 'published_date'
-        ).order_by('-published_date')[:limit]
-        
-        serializer = BlogListSerializer(queryset, many=True)
-        count = Blog.objects.filter(q, status='published').count()
-        return serializer.data, count
-
-    def _search_mps(self, query, limit):
-        """Search Members of Parliament"""
-        q = Q(name__icontains=query) | Q(party__icontains=query) | Q(constituency__icontains=query) | Q(district__icontains=query)
-        queryset = MP.objects.filter(q).only(
-            'id', 'name', 'party', 'constituency', 'district', 'photo'
-        ).order_by('name')[:limit]
-        
-        serializer = MPListSerializer(queryset, many=True)
-        count = MP.objects.filter(q).count()
-        return serializer.data, count
-
-    def _search_bills(self, query, limit):
-        """Search bills"""
-        q = Q(title__icontains=query) | Q(mover__icontains=query) | Q(description__icontains=query)
-        queryset = Bill.objects.filter(q).only(
-            'id', 'title', 'bill_type', 'mover', 'status', 'year_introduced', 'created_at'
-        ).order_by('-created_at')[:limit]
-        
-        serializer = BillListSerializer(queryset, many=True)
-        count = Bill.objects.filter(q).count()
-        return serializer.data, count
-
-    def _search_loans(self, query, limit):
-        """Search loans"""
-        q = Q(label__icontains=query) | Q(description__icontains=query) | Q(source__icontains=query)
-        queryset = Loan.objects.filter(q).only(
-            'id', 'sector', 'label', 'approved_amount', 'currency', 'source', 'approval_date'
-        ).order_by('-approval_date')[:limit]
-        
-        serializer = LoanSerializer(queryset, many=True)
-        count = Loan.objects.filter(q).count()
-        return serializer.data, count
-
-    def _search_budgets(self, query, limit):
-        """Search budgets"""
-        q = Q(name__icontains=query) | Q(financial_year__icontains=query)
-        queryset = Budget.objects.filter(q).only(
-            'id', 'name', 'financial_year', 'file', 'created_at'
-        ).order_by('-financial_year')[:limit]
-        
-        serializer = BudgetSerializer(queryset, many=True)
-        count = Budget.objects.filter(q).count()
-        return serializer.data, count
-
-    def _search_hansards(self, query, limit):
-        """Search hansards"""
-        q = Q(name__icontains=query)
-        queryset = Hansard.objects.filter(q).only(
-            'id', 'name', 'date', 'file', 'created_at'
-        ).order_by('-date')[:limit]
-        
-        serializer = HansardSerializer(queryset, many=True)
-        count = Hansard.objects.filter(q).count()
-        return serializer.data, count
-
-    def _search_order_papers(self, query, limit):
-        """Search order papers"""
-        q = Q(name__icontains=query) | Q(description__icontains=query)
-        queryset = OrderPaper.objects.filter(q).only(
-            'id', 'name', 'description', 'file', 'created_at'
-        ).order_by('-created_at')[:limit]
-        
-        serializer = OrderPaperSerializer(queryset, many=True)
-        count = OrderPaper.objects.filter(q).count()
-        return serializer.data, count
-
-    def _search_explainers(self, query, limit):
-        """Search explainers"""
-        q = Q(name__icontains=query) | Q(description__icontains=query)
-        queryset = Explainers.objects.filter(q).only(
-            'id', 'name', 'description', 'file', 'created_at'
-        ).order_by('-created_at')[:limit]
-        
-        serializer = ExplainersSerializer(queryset, many=True)
-        count = Explainers.objects.filter(q).count()
-        return serializer.data, count
 
-    def _search_reports(self, query, limit):
-        """Search reports"""
-        q = Q(name__icontains=query) | Q(description__icontains=query)
-        queryset = Report.objects.filter(q).only(
-            'id', 'name', 'description', 'file', 'created_at'
-        ).order_by('-created_at')[:limit]
-        
-        serializer = ReportSerializer(queryset, many=True)
-        count = Report.objects.filter(q).count()
-        return serializer.data, count
-
-    def _search_partner_publications(self, query, limit):
-        """Search partner publications"""
-        q = Q(name__icontains=query) | Q(description__icontains=query)
-        queryset = PartnerPublication.objects.filter(q).only(
-            'id', 'name', 'description', 'file', 'created_at'
-        ).order_by('-created_at')[:limit]
-        
-        serializer = PartnerPublicationSerializer(queryset, many=True)
-        count = PartnerPublication.objects.filter(q).count()
-        return serializer.data, count
-
-    def _search_statements(self, query, limit):
-        """Search statements"""
-        q = Q(name__icontains=query) | Q(description__icontains=query)
-        queryset = Statement.objects.filter(q).only(
-            'id', 'name', 'description', 'file', 'created_at'
-        ).order_by('-created_at')[:limit]
-        
-        serializer = StatementSerializer(queryset, many=True)
-        count = Statement.objects.filter(q).count()
-        return serializer.data, count
+class AutocompleteView(APIView):
+    """
+    Search-as-you-type suggestions for the search dropdown.
+    Matches titles and names by word prefix and tolerates typos ("Kyagulanyi", "Mbarara"),
+    using trigram indexes instead of the full search.
+    Queries shorter than three characters get no suggestions: they have no trigram the
+    indexes could look up, so they would scan every row.
+    """
+    permission_classes = [AllowAny]
+    min_length = 3
 
-    def _search_podcasts(self, query, limit):
-        """Search podcasts"""
-        q = Q(title__icontains=query) | Q(host__icontains=query) | Q(description__icontains=query) | Q(guest__icontains=query) | Q(tags__icontains=query)
-        queryset = Podcast.objects.filter(q).only(
-            'id', 'title', 'host', 'guest', 'youtube_url', 'thumbnail', 'published_date', 'category'
-        ).order_by('-published_date')[:limit]
-        
-        serializer = PodcastSerializer(queryset, many=True)
-        count = Podcast.objects.filter(q).count()
-        return serializer.data, count
+    def get(self, request):
+        query = ' '.join(request.query_params.get('q', '').split())
+        try:
+            limit = int(request.query_params.get('limit', 8))
+            limit = max(1, min(limit, 20))
+        except (ValueError, TypeError):
+            limit = 8
 
-    def _search_xspaces(self, query, limit):
-        """Search X Spaces"""
-        q = Q(title__icontains=query) | Q(host__icontains=query) | Q(description__icontains=query) | Q(topics__icontains=query) | Q(speakers__icontains=query)
-        queryset = XSpace.objects.filter(q).only(
-            'id', 'title', 'host', 'scheduled_date', 'x_space_url', 'thumbnail', 'status'
-        ).order_by('-scheduled_date')[:limit]
-        
-        serializer = XSpaceSerializer(queryset, many=True)
-        count = XSpace.objects.filter(q).count()
-        return serializer.data, count
+        if len(query) < self.min_length:
+            return Response({'query': query, 'suggestions': []})
 
-    def _search_gallery(self, query, limit):
-        """Search gallery images"""
-        q = Q(title__icontains=query) | Q(description__icontains=query) | Q(photographer__icontains=query) | Q(tags__icontains=query)
-        queryset = Gallery.objects.filter(q).only(
-            'id', 'title', 'description', 'image', 'category', 'event_date', 'photographer'
-        ).order_by('-featured', '-event_date')[:limit]
-        
-        serializer = GallerySerializer(queryset, many=True)
-        count = Gallery.objects.filter(q).count()
-        return serializer.data, count
+        cache_key = f'autocomplete:{query.lower()}:{limit}'
+        suggestions = caches['search'].get(cache_key)
+        if suggestions is None:
+            suggestions = autocomplete(query, limit)
+            # Cache for 10 minutes, like full search results
+            caches['search'].set(cache_key, suggestions, 600)
 
-    def _search_polls(self, query, limit):
-        """Search polls"""
-        q = Q(title__icontains=query) | Q(description__icontains=query) | Q(category__icontains=query)
-        queryset = Poll.objects.filter(q, status='active').only(
-            'id', 'title', 'description', 'category', 'status', 'start_date', 'end_date', 'featured'
-        ).order_by('-featured', '-created_at')[:limit]
-        
-        serializer = PollSerializer(queryset, many=True)
-        count = Poll.objects.filter(q, status='active').count()
-        return serializer.data, count
+        return Response({'query': query, 'suggestions': suggestions})
 
 
 @staff_member_required
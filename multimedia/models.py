@@ -1,5 +1,8 @@
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVector, SearchVectorField
 from django.db import models
 from django.utils import timezone
+from main.managers import SearchableManager
 
 
 class XSpace(models.Model):
@@ -36,11 +39,25 @@ class XSpace(models.Model):
     )
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+    search_vector = models.GeneratedField(
+        expression=(
+            SearchVector('title', weight='A', config='english')
+            + SearchVector('host', weight='B', config='english')
+            + SearchVector('topics', weight='B', config='english')
+            + SearchVector('speakers', weight='B', config='english')
+            + SearchVector('description', weight='C', config='english')
+        ),
+        output_field=SearchVectorField(),
+        db_persist=True,
+    )
+
+    objects = SearchableManager()
 
     class Meta:
         ordering = ['-scheduled_date', '-created_at']
         verbose_name = 'X Space'
         verbose_name_plural = 'X Spaces'
+        indexes = [GinIndex(fields=['search_vector'])]
 
     def __str__(self):
         return self.title
@@ -71,11 +88,25 @@ class Podcast(models.Model):
     )
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+    search_vector = models.GeneratedField(
+        expression=(
+            SearchVector('title', weight='A', config='english')
+            + SearchVector('host', weight='B', config='english')
+            + SearchVector('guest', weight='B', config='english')
+            + SearchVector('tags', weight='B', config='english')
+            + SearchVector('description', weight='C', config='english')
+        ),
+        output_field=SearchVectorField(),
+        db_persist=True,
+    )
+
+    objects = SearchableManager()
 
     class Meta:
         ordering = ['-published_date', '-created_at']
         verbose_name = 'Podcast'
         verbose_name_plural = 'Podcasts'
+        indexes = [GinIndex(fields=['search_vector'])]
 
     def __str__(self):
         return self.title
@@ -103,11 +134,24 @@ class Gallery(models.Model):
     featured = models.BooleanField(default=False, help_text="Whether this image should be featured")
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+    search_vector = models.GeneratedField(
+        expression=(
+            SearchVector('title', weight='A', config='english')
+            + SearchVector('photographer', weight='B', config='english')
+            + SearchVector('tags', weight='B', config='english')
+            + SearchVector('description', weight='C', config='english')
+        ),
+        output_field=SearchVectorField(),
+        db_persist=True,
+    )
+
+    objects = SearchableManager()
 
     class Meta:
         ordering = ['-featured', '-event_date', '-created_at']
         verbose_name = 'Gallery Image'
         verbose_name_plural = 'Gallery Images'
+        indexes = [GinIndex(fields=['search_vector'])]
 
     def __str__(self):
         return self.title
@@ -143,11 +187,23 @@ class Poll(models.Model):
     featured = models.BooleanField(default=False, help_text="Feature this poll on the homepage")
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+    search_vector = models.GeneratedField(
+        expression=(
+            SearchVector('title', weight='A', config='english')
+            + SearchVector('category', weight='B', config='english')
+            + SearchVector('description', weight='C', config='english')
+        ),
+        output_field=SearchVectorField(),
+        db_persist=True,
+    )
+
+    objects = SearchableManager()
 
     class Meta:
         ordering = ['-featured', '-created_at']
         verbose_name = 'Poll'
         verbose_name_plural = 'Polls'
+        indexes = [GinIndex(fields=['search_vector'])]
 
     def __str__(self):
         return self.title
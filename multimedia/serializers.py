@@ -1,11 +1,12 @@
 from rest_framework import serializers
-from main.utils import get_full_media_url
+from main.utils import MediaURLField
+from main.sparse import SparseFieldsMixin
 from .models import XSpace, Podcast, Gallery, Poll, PollOption, PollVote
 
 
-class XSpaceSerializer(serializers.ModelSerializer):
+class XSpaceSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     status_display = serializers.CharField(source='get_status_display', read_only=True)
-    thumbnail = serializers.SerializerMethodField()
+    thumbnail = MediaURLField()
 
     class Meta:
         model = XSpace
@@ -27,14 +28,9 @@ class XSpaceSerializer(serializers.ModelSerializer):
             'updated_at',
         ]
 
-    def get_thumbnail(self, obj):
-        if obj.thumbnail:
-            return get_full_media_url(obj.thumbnail.url)
-        return None
 
-
-class PodcastSerializer(serializers.ModelSerializer):
-    thumbnail = serializers.SerializerMethodField()
+class PodcastSerializer(SparseFieldsMixin, serializers.ModelSerializer):
+    thumbnail = MediaURLField()
 
     class Meta:
         model = Podcast
@@ -55,14 +51,9 @@ class PodcastSerializer(serializers.ModelSerializer):
             'updated_at',
         ]
 
-    def get_thumbnail(self, obj):
-        if obj.thumbnail:
-            return get_full_media_url(obj.thumbnail.url)
-        return None
-
 
-class GallerySerializer(serializers.ModelSerializer):
-    image = serializers.SerializerMethodField()
+class GallerySerializer(SparseFieldsMixin, serializers.ModelSerializer):
+    image = MediaURLField()
 
     class Meta:
         model = Gallery
@@ -80,13 +71,8 @@ class GallerySerializer(serializers.ModelSerializer):
             'updated_at',
         ]
 
-    def get_image(self, obj):
-        if obj.image:
-            return get_full_media_url(obj.image.url)
-        return None
 
-
-class PollOptionSerializer(serializers.ModelSerializer):
+class PollOptionSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     vote_count = serializers.IntegerField(read_only=True)
     vote_percentage = serializers.FloatField(read_only=True)
 
@@ -102,7 +88,7 @@ class PollOptionSerializer(serializers.ModelSerializer):
         ]
 
 
-class PollSerializer(serializers.ModelSerializer):
+class PollSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     options = PollOptionSerializer(many=True, read_only=True)
     total_votes = serializers.IntegerField(read_only=True)
     is_active = serializers.BooleanField(read_only=True)
@@ -130,7 +116,7 @@ class PollSerializer(serializers.ModelSerializer):
         ]
 
 
-class PollVoteSerializer(serializers.ModelSerializer):
+class PollVoteSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = PollVote
         fields = [
@@ -140,4 +126,3 @@ class PollVoteSerializer(serializers.ModelSerializer):
             'created_at',
         ]
         read_only_fields = ['created_at']
-
@@ -4,6 +4,7 @@ from rest_framework.response import Response
 from rest_framework.pagination import PageNumberPagination
 from django_filters.rest_framework import DjangoFilterBackend
 from django.utils import timezone
+from main.mixins import ConditionalGetMixin, ValuesListMixin, SparseQuerysetMixin
 from .models import XSpace, Podcast, Gallery, Poll, PollOption, PollVote
 from .serializers import XSpaceSerializer, PodcastSerializer, GallerySerializer, PollSerializer, PollOptionSerializer, PollVoteSerializer
 
@@ -14,7 +15,7 @@ class XSpacePagination(PageNumberPagination):
     max_page_size = 100
 
 
-class XSpaceViewSet(viewsets.ModelViewSet):
+class XSpaceViewSet(ConditionalGetMixin, SparseQuerysetMixin, viewsets.ModelViewSet):
     """
     ViewSet for X Spaces events
     
@@ -38,7 +39,7 @@ class PodcastPagination(PageNumberPagination):
     max_page_size = 100
 
 
-class PodcastViewSet(viewsets.ModelViewSet):
+class PodcastViewSet(ConditionalGetMixin, SparseQuerysetMixin, viewsets.ModelViewSet):
     """
     ViewSet for Podcasts
     
@@ -62,7 +63,7 @@ class GalleryPagination(PageNumberPagination):
     max_page_size = 100
 
 
-class GalleryViewSet(viewsets.ModelViewSet):
+class GalleryViewSet(ConditionalGetMixin, ValuesListMixin, SparseQuerysetMixin, viewsets.ModelViewSet):
     """
     ViewSet for Gallery Images
     
@@ -86,7 +87,7 @@ class PollPagination(PageNumberPagination):
     max_page_size = 50
 
 
-class PollViewSet(viewsets.ModelViewSet):
+class PollViewSet(SparseQuerysetMixin, viewsets.ModelViewSet):
     """
     ViewSet for Polls
     
@@ -0,0 +1,33 @@
+# Generated by Django 6.0 on 2026-10-18 04:58
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('news', '0007_news_search_vector_news_news_news_search__87782f_gin'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='hotinparliament',
+            name='rendered_content',
+            field=models.TextField(blank=True, editable=False, help_text='Content with absolute image URLs, rendered on save'),
+        ),
+        migrations.AddField(
+            model_name='hotinparliament',
+            name='rendered_media_base',
+            field=models.CharField(blank=True, editable=False, max_length=255),
+        ),
+        migrations.AddField(
+            model_name='news',
+            name='rendered_content',
+            field=models.TextField(blank=True, editable=False, help_text='Content with absolute image URLs, rendered on save'),
+        ),
+        migrations.AddField(
+            model_name='news',
+            name='rendered_media_base',
+            field=models.CharField(blank=True, editable=False, max_length=255),
+        ),
+    ]
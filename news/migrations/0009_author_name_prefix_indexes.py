@@ -0,0 +1,24 @@
+# Generated by Django 6.0 on 2026-10-18 05:20
+
+from django.db import migrations
+
+# Expression indexes serving the case-insensitive prefix lookups (istartswith) that
+# main.search.matching_authors runs on author names
+AUTHOR_NAME_COLUMNS = ['username', 'first_name', 'last_name']
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('news', '0008_hotinparliament_rendered_content_and_more'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql=f'CREATE INDEX IF NOT EXISTS auth_user_{column}_upper_like '
+                f'ON auth_user (UPPER({column}::text) text_pattern_ops)',
+            reverse_sql=f'DROP INDEX IF EXISTS auth_user_{column}_upper_like',
+        )
+        for column in AUTHOR_NAME_COLUMNS
+    ]
@@ -1,18 +1,19 @@
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVector, SearchVectorField
 from django.db import models
-from django.db.models.signals import post_save, post_delete
-from django.dispatch import receiver
 from django.contrib.auth.models import User
 from django.utils import timezone
 from django.utils.text import slugify
-from django.core.cache import cache
 from ckeditor.fields import RichTextField
+from main.managers import SearchableManager
+from main.rendering import RenderedHTMLMixin
 
 
 def default_published_date():
     return timezone.now().date()
 
 
-class News(models.Model):
+class News(RenderedHTMLMixin, models.Model):
     STATUS_CHOICES = [
         ('draft', 'Draft'),
         ('published', 'Published'),
@@ -31,15 +32,28 @@ class News(models.Model):
     author = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, blank=True, related_name='news_articles', db_index=True)
     category = models.CharField(max_length=50, choices=CATEGORY_CHOICES, default='news_updates')
     content = RichTextField()
+    rendered_content = models.TextField(blank=True, editable=False, help_text="Content with absolute image URLs, rendered on save")
+    rendered_media_base = models.CharField(max_length=255, blank=True, editable=False)
     image = models.ImageField(upload_to='news/', blank=True, null=True)
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='draft')
     published_date = models.DateField(default=default_published_date)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+    search_vector = models.GeneratedField(
+        expression=(
+            SearchVector('title', weight='A', config='english')
+            + SearchVector('content', weight='C', config='english')
+        ),
+        output_field=SearchVectorField(),
+        db_persist=True,
+    )
+
+    objects = SearchableManager()
 
     class Meta:
         verbose_name_plural = 'News'
         ordering = ['-published_date', '-created_at']
+        indexes = [GinIndex(fields=['search_vector'])]
 
     def save(self, *args, **kwargs):
         if not self.slug:
@@ -54,12 +68,14 @@ class News(models.Model):
         return dict(self.CATEGORY_CHOICES).get(self.category, self.category)
 
 
-class HotInParliament(models.Model):
+class HotInParliament(RenderedHTMLMixin, models.Model):
     """Model for 'Hot in Parliament' items displayed on the home page"""
     title = models.CharField(max_length=500, db_index=True)
     slug = models.SlugField(max_length=550, unique=True, blank=True, db_index=True)
     author = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, blank=True, related_name='hot_in_parliament', db_index=True)
     content = RichTextField()
+    rendered_content = models.TextField(blank=True, editable=False, help_text="Content with absolute image URLs, rendered on save")
+    rendered_media_base = models.CharField(max_length=255, blank=True, editable=False)
     image = models.ImageField(upload_to='hot_in_parliament/', blank=True, null=True)
     link_url = models.URLField(blank=True, null=True, help_text="Optional link to related article or external resource")
     is_active = models.BooleanField(default=True, help_text="Whether this item should be displayed")
@@ -81,10 +97,3 @@ class HotInParliament(models.Model):
     def __str__(self):
         return self.title
 
-
-# Signal to clear cache when HotInParliament items are saved or deleted
-@receiver(post_save, sender=HotInParliament)
-@receiver(post_delete, sender=HotInParliament)
-def clear_hot_in_parliament_cache(sender, instance, **kwargs):
-    """Clear the cache when Hot in Parliament items are modified"""
-    cache.delete('hot_in_parliament')
\ No newline at end of file
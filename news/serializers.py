@@ -1,13 +1,22 @@
 from rest_framework import serializers
-from main.utils import get_full_media_url, process_content_images
+from main.utils import MediaURLField
+from main.rendering import RenderedHTMLField
+from main.sparse import SparseFieldsMixin
 from .models import News, HotInParliament
 
 
-class NewsListSerializer(serializers.ModelSerializer):
+def author_name(first_name, last_name, username):
+    """Author name from values() of the author's fields, as get_author() renders it"""
+    if username is None:
+        return 'Unknown'
+    return f"{first_name} {last_name}".strip() or username
+
+
+class NewsListSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     """Simplified serializer for news list view"""
     category_display = serializers.CharField(read_only=True)
     author = serializers.SerializerMethodField()
-    image = serializers.SerializerMethodField()
+    image = MediaURLField()
 
     class Meta:
         model = News
@@ -21,24 +30,22 @@ class NewsListSerializer(serializers.ModelSerializer):
             'image',
             'published_date',
         ]
+        values_fields = {
+            'author': (('author__first_name', 'author__last_name', 'author__username'), author_name),
+        }
 
     def get_author(self, obj):
         if obj.author:
             return obj.author.get_full_name() or obj.author.username
         return 'Unknown'
 
-    def get_image(self, obj):
-        if obj.image:
-            return get_full_media_url(obj.image.url)
-        return None
 
-
-class NewsDetailSerializer(serializers.ModelSerializer):
+class NewsDetailSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     """Full serializer for news detail view"""
     category_display = serializers.CharField(read_only=True)
     author = serializers.SerializerMethodField()
-    image = serializers.SerializerMethodField()
-    content = serializers.SerializerMethodField()
+    image = MediaURLField()
+    content = RenderedHTMLField('content')
 
     class Meta:
         model = News
@@ -63,23 +70,12 @@ class NewsDetailSerializer(serializers.ModelSerializer):
             return obj.author.get_full_name() or obj.author.username
         return 'Unknown'
 
-    def get_image(self, obj):
-        if obj.image:
-            return get_full_media_url(obj.image.url)
-        return None
-    
-    def get_content(self, obj):
-        """Process content HTML to convert relative image URLs to absolute URLs"""
-        if obj.content:
-            return process_content_images(obj.content)
-        return obj.content
 
-
-class HomeNewsSummarySerializer(serializers.ModelSerializer):
+class HomeNewsSummarySerializer(SparseFieldsMixin, serializers.ModelSerializer):
     """Minimal serializer for home page news summary"""
     category_display = serializers.CharField(read_only=True)
     author = serializers.SerializerMethodField()
-    image = serializers.SerializerMethodField()
+    image = MediaURLField()
     
     class Meta:
         model = News
@@ -90,17 +86,12 @@ class HomeNewsSummarySerializer(serializers.ModelSerializer):
             return obj.author.get_full_name() or obj.author.username
         return 'Unknown'
 
-    def get_image(self, obj):
-        if obj.image:
-            return get_full_media_url(obj.image.url)
-        return None
-
 
-class HotInParliamentSerializer(serializers.ModelSerializer):
+class HotInParliamentSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     """Serializer for Hot in Parliament items"""
     author = serializers.SerializerMethodField()
-    image = serializers.SerializerMethodField()
-    content = serializers.SerializerMethodField()
+    image = MediaURLField()
+    content = RenderedHTMLField('content')
 
     class Meta:
         model = HotInParliament
@@ -119,14 +110,3 @@ class HotInParliamentSerializer(serializers.ModelSerializer):
         if obj.author:
             return obj.author.get_full_name() or obj.author.username
         return 'Unknown'
-
-    def get_image(self, obj):
-        if obj.image:
-            return get_full_media_url(obj.image.url)
-        return None
-    
-    def get_content(self, obj):
-        """Process content HTML to convert relative image URLs to absolute URLs"""
-        if obj.content:
-            return process_content_images(obj.content)
-        return obj.content
\ No newline at end of file
@@ -1,3 +1,193 @@
-from django.test import TestCase
+from django.contrib.auth.models import User
+from django.core.cache import caches
+from django.core.exceptions import ImproperlyConfigured
+from django.test import TestCase, override_settings
+from rest_framework import serializers
 
-# Create your tests here.
+from home.tests import locmem_caches
+from main.rendering import get_rendered_html, render_stale_html
+from main.utils import get_media_base_url
+from main.values import ValuesSerializer, get_values_serializer
+from .models import News
+from .serializers import NewsListSerializer
+
+CONTENT = '<p>Text</p><img src="/media/news/chart.png"><img src="https://example.com/logo.png">'
+
+
+class ConditionalGetTests(TestCase):
+
+    def setUp(self):
+        caches['default'].clear()
+        self.author = User.objects.create(username='reporter', first_name='Ann', last_name='Writer')
+        self.news = self.create_news('Budget passed')
+
+    def create_news(self, title, status='published'):
+        with self.captureOnCommitCallbacks(execute=True):
+            return News.objects.create(title=title, content='<p>Text</p>', author=self.author, status=status)
+
+    def get(self, url, etag=None):
+        if etag is None:
+            return self.client.get(url)
+        return self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+    def assertChanged(self, url, etag):
+        response = self.get(url, etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+        return response['ETag']
+
+    def test_unchanged_list_is_not_modified(self):
+        response = self.get('/api/news/')
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('ETag', response)
+        self.assertNotIn('Last-Modified', response)
+
+        response = self.get('/api/news/', response['ETag'])
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b'')
+
+    def test_if_modified_since_alone_is_not_answered_with_304(self):
+        response = self.client.get('/api/news/', HTTP_IF_MODIFIED_SINCE='Fri, 01 Jan 2100 00:00:00 GMT')
+        self.assertEqual(response.status_code, 200)
+
+    def test_etag_changes_with_the_data(self):
+        etag = self.get('/api/news/')['ETag']
+
+        self.news.title = 'Budget amended'
+        with self.captureOnCommitCallbacks(execute=True):
+            self.news.save()
+        etag = self.assertChanged('/api/news/', etag)
+
+        other = self.create_news('Loan approved')
+        etag = self.assertChanged('/api/news/', etag)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            other.delete()
+        self.assertChanged('/api/news/', etag)
+
+    def test_etag_changes_when_a_record_leaves_the_list(self):
+        self.create_news('Loan approved')
+        etag = self.get('/api/news/')['ETag']
+
+        # Unpublished without touching updated_at; the list's latest change stays the same
+        News.objects.filter(pk=self.news.pk).update(status='draft')
+        self.assertChanged('/api/news/', etag)
+
+    def test_etag_changes_when_the_author_is_renamed(self):
+        etag = self.get('/api/news/')['ETag']
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.author.save(update_fields=['last_login'])
+        self.assertEqual(self.get('/api/news/', etag).status_code, 304)
+
+        self.author.first_name = 'Anne'
+        with self.captureOnCommitCallbacks(execute=True):
+            self.author.save()
+        response = self.get('/api/news/', etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['results'][0]['author'], 'Anne Writer')
+
+    def test_author_renamed_by_another_process(self):
+        etag = self.get('/api/news/')['ETag']
+
+        with override_settings(CACHES=locmem_caches(max_entries=100, process='other')):
+            self.author.first_name = 'Anne'
+            self.author.save()
+        self.assertChanged('/api/news/', etag)
+
+    def test_etag_depends_on_the_url(self):
+        self.assertNotEqual(self.get('/api/news/')['ETag'], self.get('/api/news/?page_size=1')['ETag'])
+
+    def test_detail(self):
+        url = f'/api/news/{self.news.slug}/'
+        etag = self.get(url)['ETag']
+        self.assertEqual(self.get(url, etag).status_code, 304)
+
+        self.news.title = 'Budget amended'
+        with self.captureOnCommitCallbacks(execute=True):
+            self.news.save()
+        self.assertChanged(url, etag)
+
+
+class RenderedHTMLTests(TestCase):
+
+    def setUp(self):
+        self.news = News.objects.create(title='Budget passed', content=CONTENT, status='published')
+
+    def test_content_is_rendered_on_save(self):
+        base = get_media_base_url()
+        self.news.refresh_from_db()
+        self.assertEqual(
+            self.news.rendered_content,
+            f'<p>Text</p><img src="{base}/news/chart.png"><img src="https://example.com/logo.png">'
+        )
+        self.assertEqual(self.news.rendered_media_base, base)
+
+    def test_update_fields_include_the_rendered_copy(self):
+        self.news.content = '<img src="/media/news/map.png">'
+        self.news.save(update_fields=['content'])
+        self.news.refresh_from_db()
+        self.assertEqual(self.news.rendered_content, f'<img src="{get_media_base_url()}/news/map.png">')
+
+    def test_detail_returns_the_stored_copy(self):
+        News.objects.filter(pk=self.news.pk).update(rendered_content='<p>Stored</p>')
+        response = self.client.get(f'/api/news/{self.news.slug}/')
+        self.assertEqual(response.json()['content'], '<p>Stored</p>')
+
+    def test_copy_rendered_against_another_media_base(self):
+        News.objects.filter(pk=self.news.pk).update(rendered_content='<p>Old</p>', rendered_media_base='https://old.example.com/media')
+        self.news.refresh_from_db()
+        self.assertIn(f'{get_media_base_url()}/news/chart.png', get_rendered_html(self.news, 'content'))
+
+        self.assertEqual(render_stale_html(News), 1)
+        self.assertEqual(render_stale_html(News), 0)
+        self.news.refresh_from_db()
+        self.assertIn(f'{get_media_base_url()}/news/chart.png', self.news.rendered_content)
+
+
+class ValuesSerializerTests(TestCase):
+
+    def setUp(self):
+        author = User.objects.create(username='reporter', first_name='Ann', last_name='Writer')
+        nameless = User.objects.create(username='desk')
+        News.objects.create(title='With image', content='x', author=author, image='news/chart.png', category='parliament')
+        News.objects.create(title='Nameless author', content='x', author=nameless)
+        News.objects.create(title='No author', content='x', category='unknown')
+
+    def test_same_output_as_the_model_serializer(self):
+        queryset = News.objects.order_by('pk')
+        values_serializer = get_values_serializer(NewsListSerializer)
+
+        self.assertEqual(
+            values_serializer.serialize(values_serializer.values(queryset)),
+            NewsListSerializer(queryset, many=True).data
+        )
+
+    def test_select(self):
+        values_serializer = get_values_serializer(NewsListSerializer).select(['title', 'author'])
+
+        self.assertEqual(
+            values_serializer.lookups, ['title', 'author__first_name', 'author__last_name', 'author__username']
+        )
+        rows = values_serializer.serialize(values_serializer.values(News.objects.order_by('pk')))
+        self.assertEqual(rows[0], {'title': 'With image', 'author': 'Ann Writer'})
+        self.assertEqual([row['author'] for row in rows], ['Ann Writer', 'desk', 'Unknown'])
+
+    def test_undeclared_method_field(self):
+        class Serializer(serializers.ModelSerializer):
+            teaser = serializers.SerializerMethodField()
+
+            class Meta:
+                model = News
+                fields = ['id', 'teaser']
+
+        with self.assertRaises(ImproperlyConfigured):
+            ValuesSerializer(Serializer)
+
+    def test_list_endpoint(self):
+        News.objects.update(status='published')
+        response = self.client.get('/api/news/?ordering=title')
+        self.assertEqual(
+            response.json()['results'],
+            NewsListSerializer(News.objects.order_by('title'), many=True).data
+        )
@@ -4,9 +4,9 @@ from rest_framework.views import APIView
 from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
 from django_filters.rest_framework import DjangoFilterBackend
-from django.views.decorators.cache import cache_page
-from django.utils.decorators import method_decorator
-from django.core.cache import cache
+from django.contrib.auth.models import User
+from main.mixins import ConditionalGetMixin, ValuesListMixin, SparseQuerysetMixin
+from home.cache import get_summary, summary_response
 from .models import News, HotInParliament
 from .serializers import NewsListSerializer, NewsDetailSerializer, HomeNewsSummarySerializer, HotInParliamentSerializer
 
@@ -17,7 +17,7 @@ class NewsPagination(PageNumberPagination):
     max_page_size = 100
 
 
-class NewsViewSet(viewsets.ModelViewSet):
+class NewsViewSet(ConditionalGetMixin, ValuesListMixin, SparseQuerysetMixin, viewsets.ModelViewSet):
     """
     ViewSet for News model
 
@@ -26,6 +26,7 @@ class NewsViewSet(viewsets.ModelViewSet):
     Search by title, author, and content
     """
     queryset = News.objects.all().order_by('-published_date')
+    conditional_dependencies = [User]  # Author names
     pagination_class = NewsPagination
     filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
     filterset_fields = ['category', 'status', 'author']
@@ -61,18 +62,14 @@ class HomeNewsSummaryView(APIView):
     """
     Optimized endpoint for home page news summary.
     Returns latest 3 published news articles in a single response.
-    Cached for 10 minutes to improve performance.
+    Cached until the data it shows changes (see home.cache).
     """
     permission_classes = [AllowAny]
 
-    @method_decorator(cache_page(600))  # Cache for 10 minutes
     def get(self, request):
-        cache_key = 'home_news_summary'
-        cached_data = cache.get(cache_key)
-        
-        if cached_data is not None:
-            return Response(cached_data)
-        
+        return summary_response(request, get_summary('home_news_summary', self.build_summary))
+
+    def build_summary(self):
         # Fetch latest 3 published news articles with optimized query
         # Using only() to fetch only needed fields
         news_articles = News.objects.filter(
@@ -81,15 +78,9 @@ class HomeNewsSummaryView(APIView):
             'id', 'title', 'slug', 'author', 'category', 'image', 'published_date'
         ).order_by('-published_date', '-created_at')[:3]
         
-        # Serialize data
-        data = {
+        return {
             'results': HomeNewsSummarySerializer(news_articles, many=True).data
         }
-        
-        # Cache the response
-        cache.set(cache_key, data, 600)  # Cache for 10 minutes
-        
-        return Response(data)
 
 
 # Hot in Parliament endpoint - optimized and cached
@@ -97,39 +88,29 @@ class HotInParliamentView(APIView):
     """
     Optimized endpoint for Hot in Parliament items.
     Returns active items ordered by order and published_date.
-    Cached for 10 minutes to improve performance.
+    Cached until the data it shows changes (see home.cache).
     Use ?nocache=1 to bypass cache for debugging.
     """
     permission_classes = [AllowAny]
 
     def get(self, request):
         # Allow bypassing cache with ?nocache=1 parameter
-        bypass_cache = request.query_params.get('nocache') == '1'
-        
-        if not bypass_cache:
-            cache_key = 'hot_in_parliament'
-            cached_data = cache.get(cache_key)
-            
-            if cached_data is not None:
-                return Response(cached_data)
-        
+        if request.query_params.get('nocache') == '1':
+            return Response(self.build_summary())
+
+        return summary_response(request, get_summary('hot_in_parliament', self.build_summary))
+
+    def build_summary(self):
         # Fetch active hot in parliament items with optimized query
         hot_items = HotInParliament.objects.filter(
             is_active=True
         ).select_related('author').only(
-            'id', 'title', 'slug', 'author', 'content', 'image', 'link_url', 'published_date'
+            'id', 'title', 'slug', 'author', 'content', 'rendered_content', 'rendered_media_base', 'image', 'link_url', 'published_date'
         ).order_by('order', '-published_date', '-created_at')
         
-        # Serialize data
-        data = {
+        return {
             'results': HotInParliamentSerializer(hot_items, many=True).data
         }
-        
-        # Cache the response (unless bypassing)
-        if not bypass_cache:
-            cache.set(cache_key, data, 600)  # Cache for 10 minutes
-        
-        return Response(data)
 
 
 # Hot in Parliament detail endpoint
@@ -148,4 +129,4 @@ class HotInParliamentDetailView(APIView):
             return Response(
                 {'error': 'Hot in Parliament item not found'},
                 status=404
-            )
\ No newline at end of file
+            )
@@ -0,0 +1,33 @@
+# Generated by Django 6.0 on 2026-10-18 05:13
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('resources', '0004_explainers_search_vector_and_more'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='explainers',
+            name='file',
+            field=models.FileField(blank=True, db_index=True, null=True, upload_to=''),
+        ),
+        migrations.AlterField(
+            model_name='partnerpublication',
+            name='file',
+            field=models.FileField(blank=True, db_index=True, null=True, upload_to=''),
+        ),
+        migrations.AlterField(
+            model_name='report',
+            name='file',
+            field=models.FileField(blank=True, db_index=True, null=True, upload_to=''),
+        ),
+        migrations.AlterField(
+            model_name='statement',
+            name='file',
+            field=models.FileField(blank=True, db_index=True, null=True, upload_to=''),
+        ),
+    ]
@@ -1,57 +1,104 @@
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVector, SearchVectorField
 from django.db import models
+from main.managers import SearchableManager
 
 # Create your models here.
 class Explainers(models.Model):
     name = models.CharField(max_length=100, db_index=True)
     description = models.TextField(null=True, blank=True)
-    file = models.FileField(null=True, blank=True)
+    file = models.FileField(null=True, blank=True, db_index=True)
 
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+    search_vector = models.GeneratedField(
+        expression=(
+            SearchVector('name', weight='A', config='english')
+            + SearchVector('description', weight='C', config='english')
+        ),
+        output_field=SearchVectorField(),
+        db_persist=True,
+    )
+
+    objects = SearchableManager()
 
     class Meta:
         verbose_name = 'Explainer'
         ordering = ['-created_at']
+        indexes = [GinIndex(fields=['search_vector'])]
 
 
 class Report(models.Model):
     name = models.CharField(max_length=100, db_index=True)
     description = models.TextField(null=True, blank=True)
-    file = models.FileField(null=True, blank=True)
+    file = models.FileField(null=True, blank=True, db_index=True)
     date_received = models.DateField(null=True, blank=True, help_text="Date the report was received")
 
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+    search_vector = models.GeneratedField(
+        expression=(
+            SearchVector('name', weight='A', config='english')
+            + SearchVector('description', weight='C', config='english')
+        ),
+        output_field=SearchVectorField(),
+        db_persist=True,
+    )
+
+    objects = SearchableManager()
 
     class Meta:
         verbose_name = 'Report'
         ordering = ['-created_at']
+        indexes = [GinIndex(fields=['search_vector'])]
 
 
 class PartnerPublication(models.Model):
     name = models.CharField(max_length=100, db_index=True)
     description = models.TextField(null=True, blank=True)
-    file = models.FileField(null=True, blank=True)
+    file = models.FileField(null=True, blank=True, db_index=True)
     date_received = models.DateField(null=True, blank=True, help_text="Date the publication was received")
 
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+    search_vector = models.GeneratedField(
+        expression=(
+            SearchVector('name', weight='A', config='english')
+            + SearchVector('description', weight='C', config='english')
+        ),
+        output_field=SearchVectorField(),
+        db_persist=True,
+    )
+
+    objects = SearchableManager()
 
     class Meta:
         verbose_name = 'PartnerPublication'
         ordering = ['-created_at']
+        indexes = [GinIndex(fields=['search_vector'])]
 
 
 class Statement(models.Model):
     name = models.CharField(max_length=100, db_index=True)
     description = models.TextField(null=True, blank=True)
-    file = models.FileField(null=True, blank=True)
+    file = models.FileField(null=True, blank=True, db_index=True)
     date_received = models.DateField(null=True, blank=True, help_text="Date the statement was received")
 
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+    search_vector = models.GeneratedField(
+        expression=(
+            SearchVector('name', weight='A', config='english')
+            + SearchVector('description', weight='C', config='english')
+        ),
+        output_field=SearchVectorField(),
+        db_persist=True,
+    )
+
+    objects = SearchableManager()
 
     class Meta:
         verbose_name = 'Statement'
         ordering = ['-created_at']
+        indexes = [GinIndex(fields=['search_vector'])]
 
@@ -1,11 +1,12 @@
 from rest_framework import serializers
-from main.utils import get_full_media_url
+from main.utils import MediaURLField
+from main.sparse import SparseFieldsMixin
 from .models import Explainers, Report, PartnerPublication, Statement
 
 
-class ExplainersSerializer(serializers.ModelSerializer):
+class ExplainersSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     """Serializer for Explainers"""
-    file = serializers.SerializerMethodField()
+    file = MediaURLField()
 
     class Meta:
         model = Explainers
@@ -19,15 +20,10 @@ class ExplainersSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ['created_at', 'updated_at']
 
-    def get_file(self, obj):
-        if obj.file:
-            return get_full_media_url(obj.file.url)
-        return None
 
-
-class ReportSerializer(serializers.ModelSerializer):
+class ReportSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     """Serializer for Reports"""
-    file = serializers.SerializerMethodField()
+    file = MediaURLField()
 
     class Meta:
         model = Report
@@ -42,15 +38,10 @@ class ReportSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ['created_at', 'updated_at']
 
-    def get_file(self, obj):
-        if obj.file:
-            return get_full_media_url(obj.file.url)
-        return None
-
 
-class PartnerPublicationSerializer(serializers.ModelSerializer):
+class PartnerPublicationSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     """Serializer for Partner Publications"""
-    file = serializers.SerializerMethodField()
+    file = MediaURLField()
 
     class Meta:
         model = PartnerPublication
@@ -65,15 +56,10 @@ class PartnerPublicationSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ['created_at', 'updated_at']
 
-    def get_file(self, obj):
-        if obj.file:
-            return get_full_media_url(obj.file.url)
-        return None
 
-
-class StatementSerializer(serializers.ModelSerializer):
+class StatementSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     """Serializer for Statements"""
-    file = serializers.SerializerMethodField()
+    file = MediaURLField()
 
     class Meta:
         model = Statement
@@ -88,64 +74,39 @@ class StatementSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ['created_at', 'updated_at']
 
-    def get_file(self, obj):
-        if obj.file:
-            return get_full_media_url(obj.file.url)
-        return None
-
 
 # Lightweight serializers for home page summary
-class HomeSummaryExplainerSerializer(serializers.ModelSerializer):
+class HomeSummaryExplainerSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     """Minimal serializer for Explainer home summary"""
-    file = serializers.SerializerMethodField()
+    file = MediaURLField()
     
     class Meta:
         model = Explainers
         fields = ['id', 'name', 'file']
 
-    def get_file(self, obj):
-        if obj.file:
-            return get_full_media_url(obj.file.url)
-        return None
 
-
-class HomeSummaryReportSerializer(serializers.ModelSerializer):
+class HomeSummaryReportSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     """Minimal serializer for Report home summary"""
-    file = serializers.SerializerMethodField()
+    file = MediaURLField()
     
     class Meta:
         model = Report
         fields = ['id', 'name', 'file']
 
-    def get_file(self, obj):
-        if obj.file:
-            return get_full_media_url(obj.file.url)
-        return None
-
 
-class HomeSummaryPartnerPublicationSerializer(serializers.ModelSerializer):
+class HomeSummaryPartnerPublicationSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     """Minimal serializer for PartnerPublication home summary"""
-    file = serializers.SerializerMethodField()
+    file = MediaURLField()
     
     class Meta:
         model = PartnerPublication
         fields = ['id', 'name', 'file']
 
-    def get_file(self, obj):
-        if obj.file:
-            return get_full_media_url(obj.file.url)
-        return None
 
-
-class HomeSummaryStatementSerializer(serializers.ModelSerializer):
+class HomeSummaryStatementSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     """Minimal serializer for Statement home summary"""
-    file = serializers.SerializerMethodField()
+    file = MediaURLField()
     
     class Meta:
         model = Statement
         fields = ['id', 'name', 'file']
-
-    def get_file(self, obj):
-        if obj.file:
-            return get_full_media_url(obj.file.url)
-        return None
\ No newline at end of file
@@ -2,11 +2,9 @@ from rest_framework import viewsets, filters
 from rest_framework.pagination import PageNumberPagination
 from rest_framework.views import APIView
 from rest_framework.permissions import AllowAny
-from rest_framework.response import Response
 from django_filters.rest_framework import DjangoFilterBackend
-from django.views.decorators.cache import cache_page
-from django.utils.decorators import method_decorator
-from django.core.cache import cache
+from main.mixins import ConditionalGetMixin, SparseQuerysetMixin
+from home.cache import get_summary, summary_response
 from .models import Explainers, Report, PartnerPublication, Statement
 from .serializers import (
     ExplainersSerializer, ReportSerializer, PartnerPublicationSerializer, StatementSerializer,
@@ -21,7 +19,7 @@ class ResourcePagination(PageNumberPagination):
     max_page_size = 100
 
 
-class ExplainersViewSet(viewsets.ModelViewSet):
+class ExplainersViewSet(ConditionalGetMixin, SparseQuerysetMixin, viewsets.ModelViewSet):
     """
     ViewSet for Explainers
 
@@ -36,7 +34,7 @@ class ExplainersViewSet(viewsets.ModelViewSet):
     ordering = ['-created_at']
 
 
-class ReportViewSet(viewsets.ModelViewSet):
+class ReportViewSet(ConditionalGetMixin, SparseQuerysetMixin, viewsets.ModelViewSet):
     """
     ViewSet for Reports & Briefs
 
@@ -51,7 +49,7 @@ class ReportViewSet(viewsets.ModelViewSet):
     ordering = ['-created_at']
 
 
-class PartnerPublicationViewSet(viewsets.ModelViewSet):
+class PartnerPublicationViewSet(ConditionalGetMixin, SparseQuerysetMixin, viewsets.ModelViewSet):
     """
     ViewSet for Partner Publications
 
@@ -66,7 +64,7 @@ class PartnerPublicationViewSet(viewsets.ModelViewSet):
     ordering = ['-created_at']
 
 
-class StatementViewSet(viewsets.ModelViewSet):
+class StatementViewSet(ConditionalGetMixin, SparseQuerysetMixin, viewsets.ModelViewSet):
     """
     ViewSet for Statements
 
@@ -86,18 +84,14 @@ class HomeResourcesSummaryView(APIView):
     """
     Optimized endpoint for home page resources summary.
     Returns latest 5 items from each resource type in a single response.
-    Cached for 10 minutes to improve performance.
+    Cached until the data it shows changes (see home.cache).
     """
     permission_classes = [AllowAny]
 
-    @method_decorator(cache_page(600))  # Cache for 10 minutes
     def get(self, request):
-        cache_key = 'home_resources_summary'
-        cached_data = cache.get(cache_key)
-        
-        if cached_data is not None:
-            return Response(cached_data)
-        
+        return summary_response(request, get_summary('home_resources_summary', self.build_summary))
+
+    def build_summary(self):
         # Fetch latest 5 items from each resource type with optimized queries
         # Using only() to fetch only needed fields
         explainers = Explainers.objects.only('id', 'name', 'file').order_by('-created_at')[:5]
@@ -105,15 +99,9 @@ class HomeResourcesSummaryView(APIView):
         partner_publications = PartnerPublication.objects.only('id', 'name', 'file').order_by('-created_at')[:5]
         statements = Statement.objects.only('id', 'name', 'file').order_by('-created_at')[:5]
         
-        # Serialize data
-        data = {
+        return {
             'explainers': HomeSummaryExplainerSerializer(explainers, many=True).data,
             'reports': HomeSummaryReportSerializer(reports, many=True).data,
             'partner_publications': HomeSummaryPartnerPublicationSerializer(partner_publications, many=True).data,
             'statements': HomeSummaryStatementSerializer(statements, many=True).data,
         }
-        
-        # Cache the response
-        cache.set(cache_key, data, 600)  # Cache for 10 minutes
-        
-        return Response(data)
\ No newline at end of file
@@ -0,0 +1,17 @@
+from django.contrib import admin
+from .models import SearchDocument
+
+
+@admin.register(SearchDocument)
+class SearchDocumentAdmin(admin.ModelAdmin):
+    list_display = ['title', 'doc_type', 'object_id', 'date', 'updated_at']
+    list_filter = ['doc_type']
+    search_fields = ['title', 'subtitle']
+    readonly_fields = [
+        'doc_type', 'object_id', 'title', 'subtitle', 'body', 'date',
+        'file_path', 'facets', 'payload', 'updated_at'
+    ]
+
+    def has_add_permission(self, request):
+        # Documents are created by the indexing signals, not by hand
+        return False
@@ -0,0 +1,322 @@
+"""
+Keeps the SearchDocument table in sync with the searchable content models.
+
+SEARCH_TYPES lists, per search category, the records that should be findable (e.g.
+only published news), the serializer whose output is returned as the search result,
+and how to build the indexed text. Saving or deleting a record updates its search
+document through signals; rebuild_search_index() reindexes everything.
+"""
+import html
+import logging
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.utils.html import strip_tags
+
+from news.models import News
+from blog.models import Blog
+from trackers.models import MP, Bill, Loan, Budget, Hansard, OrderPaper
+from resources.models import Explainers, Report, PartnerPublication, Statement
+from multimedia.models import Podcast, XSpace, Gallery, Poll
+
+from news.serializers import NewsListSerializer
+from blog.serializers import BlogListSerializer
+from trackers.serializers import (
+    MPListSerializer, BillListSerializer, LoanSerializer,
+    BudgetSerializer, HansardSerializer, OrderPaperSerializer
+)
+from resources.serializers import ExplainersSerializer, ReportSerializer, PartnerPublicationSerializer, StatementSerializer
+from multimedia.serializers import PodcastSerializer, XSpaceSerializer, GallerySerializer, PollSerializer
+
+from .models import SearchDocument
+
+logger = logging.getLogger(__name__)
+
+BATCH_SIZE = 500
+
+
+def plain_text(value):
+    """Convert rich text HTML to plain text for indexing"""
+    if not value:
+        return ''
+    return ' '.join(html.unescape(strip_tags(value)).split())
+
+
+def join_text(*values):
+    """Join the non-empty values with spaces"""
+    return ' '.join(str(value) for value in values if value)
+
+
+def author_name(obj):
+    if obj.author:
+        return obj.author.get_full_name() or obj.author.username
+    return ''
+
+
+def day(value):
+    """Date of a date or datetime value"""
+    return value.date() if hasattr(value, 'date') else value
+
+
+def article_document(obj):
+    return {
+        'title': obj.title,
+        'subtitle': join_text(author_name(obj), obj.author.username if obj.author else ''),
+        'body': plain_text(obj.content),
+        'date': obj.published_date,
+        'facets': {'category': obj.category},
+    }
+
+
+def file_document(obj):
+    return {
+        'title': obj.name,
+        'body': obj.description or '',
+        'date': day(obj.created_at),
+        'file_path': obj.file.name if obj.file else '',
+    }
+
+
+SEARCH_TYPES = {
+    'news': {
+        'model': News,
+        'queryset': lambda: News.objects.filter(status='published').select_related('author'),
+        'serializer': NewsListSerializer,
+        'document': article_document,
+    },
+    'blogs': {
+        'model': Blog,
+        'queryset': lambda: Blog.objects.filter(status='published').select_related('author'),
+        'serializer': BlogListSerializer,
+        'document': article_document,
+    },
+    'mps': {
+        'model': MP,
+        'queryset': lambda: MP.objects.all(),
+        'serializer': MPListSerializer,
+        'document': lambda obj: {
+            'title': obj.name,
+            'subtitle': join_text(obj.party, obj.constituency, obj.district),
+            'facets': {'party': obj.party, 'district': obj.district},
+        },
+    },
+    'bills': {
+        'model': Bill,
+        'queryset': lambda: Bill.objects.all(),
+        'serializer': BillListSerializer,
+        'document': lambda obj: {
+            'title': obj.title,
+            'subtitle': obj.mover,
+            'body': obj.description,
+            'date': day(obj.created_at),
+            'facets': {'bill_type': obj.bill_type, 'status': obj.status},
+        },
+    },
+    'loans': {
+        'model': Loan,
+        'queryset': lambda: Loan.objects.all(),
+        'serializer': LoanSerializer,
+        'document': lambda obj: {
+            'title': obj.label,
+            'subtitle': join_text(obj.source, obj.get_source_display()),
+            'body': obj.description,
+            'date': obj.approval_date,
+            'facets': {'sector': obj.sector, 'source': obj.source, 'currency': obj.currency},
+        },
+    },
+    'budgets': {
+        'model': Budget,
+        'queryset': lambda: Budget.objects.all(),
+        'serializer': BudgetSerializer,
+        'document': lambda obj: {
+            'title': obj.name,
+            'subtitle': obj.financial_year,
+            'date': day(obj.created_at),
+            'file_path': obj.file.name if obj.file else '',
+            'facets': {'financial_year': obj.financial_year},
+        },
+    },
+    'hansards': {
+        'model': Hansard,
+        'queryset': lambda: Hansard.objects.all(),
+        'serializer': HansardSerializer,
+        'document': lambda obj: {
+            'title': obj.name,
+            'date': obj.date,
+            'file_path': obj.file.name if obj.file else '',
+        },
+    },
+    'order_papers': {
+        'model': OrderPaper,
+        'queryset': lambda: OrderPaper.objects.all(),
+        'serializer': OrderPaperSerializer,
+        'document': file_document,
+    },
+    'explainers': {
+        'model': Explainers,
+        'queryset': lambda: Explainers.objects.all(),
+        'serializer': ExplainersSerializer,
+        'document': file_document,
+    },
+    'reports': {
+        'model': Report,
+        'queryset': lambda: Report.objects.all(),
+        'serializer': ReportSerializer,
+        'document': file_document,
+    },
+    'partner_publications': {
+        'model': PartnerPublication,
+        'queryset': lambda: PartnerPublication.objects.all(),
+        'serializer': PartnerPublicationSerializer,
+        'document': file_document,
+    },
+    'statements': {
+        'model': Statement,
+        'queryset': lambda: Statement.objects.all(),
+        'serializer': StatementSerializer,
+        'document': file_document,
+    },
+    'podcasts': {
+        'model': Podcast,
+        'queryset': lambda: Podcast.objects.all(),
+        'serializer': PodcastSerializer,
+        'document': lambda obj: {
+            'title': obj.title,
+            'subtitle': join_text(obj.host, obj.guest, obj.tags),
+            'body': obj.description,
+            'date': day(obj.published_date),
+            'facets': {'category': obj.category},
+        },
+    },
+    'xspaces': {
+        'model': XSpace,
+        'queryset': lambda: XSpace.objects.all(),
+        'serializer': XSpaceSerializer,
+        'document': lambda obj: {
+            'title': obj.title,
+            'subtitle': join_text(obj.host, obj.topics),
+            'body': join_text(obj.speakers, obj.description),
+            'date': day(obj.scheduled_date),
+            'facets': {'status': obj.status},
+        },
+    },
+    'gallery': {
+        'model': Gallery,
+        'queryset': lambda: Gallery.objects.all(),
+        'serializer': GallerySerializer,
+        'document': lambda obj: {
+            'title': obj.title,
+            'subtitle': join_text(obj.photographer, obj.tags),
+            'body': obj.description,
+            'date': obj.event_date,
+            'facets': {'category': obj.category, 'featured': obj.featured},
+        },
+    },
+    'polls': {
+        'model': Poll,
+        'queryset': lambda: Poll.objects.filter(status='active').prefetch_related('options'),
+        'serializer': PollSerializer,
+        'document': lambda obj: {
+            'title': obj.title,
+            'subtitle': obj.category,
+            'body': obj.description,
+            'date': day(obj.created_at),
+            'facets': {'featured': obj.featured},
+        },
+        # Vote counts and is_active change without the poll being saved, so poll results
+        # are serialized from the database when returned instead of from the payload
+        'live': True,
+    },
+}
+
+# Search categories fed by each model
+TYPES_BY_MODEL = {}
+for _doc_type, _config in SEARCH_TYPES.items():
+    TYPES_BY_MODEL.setdefault(_config['model'], []).append(_doc_type)
+
+
+def build_search_document(doc_type, obj):
+    """Build an unsaved SearchDocument for a record"""
+    config = SEARCH_TYPES[doc_type]
+    fields = config['document'](obj)
+
+    return SearchDocument(
+        doc_type=doc_type,
+        object_id=obj.pk,
+        title=(fields['title'] or '')[:500],
+        subtitle=(fields.get('subtitle') or '')[:500],
+        body=fields.get('body') or '',
+        date=fields.get('date'),
+        file_path=fields.get('file_path', ''),
+        facets=fields.get('facets', {}),
+        payload=config['serializer'](obj).data,
+    )
+
+
+def save_search_documents(documents):
+    """Insert or update search documents in one query"""
+    SearchDocument.objects.bulk_create(
+        documents,
+        update_conflicts=True,
+        unique_fields=['doc_type', 'object_id'],
+        update_fields=['title', 'subtitle', 'body', 'date', 'file_path', 'facets', 'payload', 'updated_at'],
+    )
+
+
+def index_record(doc_type, pk):
+    """Index one record, or remove its search document if it should not be searchable"""
+    obj = SEARCH_TYPES[doc_type]['queryset']().filter(pk=pk).first()
+    if obj is None:
+        SearchDocument.objects.filter(doc_type=doc_type, object_id=pk).delete()
+    else:
+        save_search_documents([build_search_document(doc_type, obj)])
+
+
+def rebuild_search_index(doc_types=None):
+    """
+    Reindex every record of the given search categories (all by default) and remove
+    documents for records that no longer exist or are no longer searchable.
+
+    Returns:
+        Dict of the number of documents indexed per category
+    """
+    counts = {}
+    for doc_type in doc_types or SEARCH_TYPES:
+        queryset = SEARCH_TYPES[doc_type]['queryset']()
+        batch = []
+        indexed_ids = []
+        for obj in queryset.iterator(chunk_size=BATCH_SIZE):
+            batch.append(build_search_document(doc_type, obj))
+            indexed_ids.append(obj.pk)
+            if len(batch) >= BATCH_SIZE:
+                save_search_documents(batch)
+                batch = []
+        if batch:
+            save_search_documents(batch)
+
+        SearchDocument.objects.filter(doc_type=doc_type).exclude(object_id__in=indexed_ids).delete()
+        counts[doc_type] = len(indexed_ids)
+
+    return counts
+
+
+def update_search_documents(sender, instance, **kwargs):
+    """post_save receiver: reindex the saved record"""
+    for doc_type in TYPES_BY_MODEL.get(sender, []):
+        try:
+            with transaction.atomic():
+                index_record(doc_type, instance.pk)
+        except Exception as e:
+            # Never fail a save because of the search index; rebuild_search_index repairs it
+            logger.warning(f"Could not index {doc_type} {instance.pk}: {e}")
+
+
+def delete_search_documents(sender, instance, **kwargs):
+    """post_delete receiver: remove the deleted record from the search index"""
+    SearchDocument.objects.filter(doc_type__in=TYPES_BY_MODEL.get(sender, []), object_id=instance.pk).delete()
+
+
+def connect_signals():
+    """Connect the index receivers to every model in SEARCH_TYPES"""
+    for model in TYPES_BY_MODEL:
+        post_save.connect(update_search_documents, sender=model, dispatch_uid=f'search_index_{model._meta.label}')
+        post_delete.connect(delete_search_documents, sender=model, dispatch_uid=f'search_unindex_{model._meta.label}')
@@ -0,0 +1,26 @@
+from django.core.management.base import BaseCommand, CommandError
+from search.indexing import SEARCH_TYPES, rebuild_search_index
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the global search index from the searchable content models'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'types',
+            nargs='*',
+            help=f"Search categories to rebuild (default: all of {', '.join(SEARCH_TYPES)})"
+        )
+
+    def handle(self, *args, **options):
+        unknown = set(options['types']) - set(SEARCH_TYPES)
+        if unknown:
+            raise CommandError(f"Unknown search categories: {', '.join(sorted(unknown))}")
+
+        counts = rebuild_search_index(options['types'] or None)
+
+        for doc_type, count in counts.items():
+            self.stdout.write(f"{doc_type}: {count}")
+        self.stdout.write(
+            self.style.SUCCESS(f"Indexed {sum(counts.values())} documents.")
+        )
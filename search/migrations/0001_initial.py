@@ -0,0 +1,41 @@
+# Generated by Django 6.0 on 2026-10-18 04:44
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+import django.core.serializers.json
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SearchDocument',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('doc_type', models.CharField(help_text="Search category, e.g. 'news' or 'mps'", max_length=50)),
+                ('object_id', models.PositiveBigIntegerField(help_text='Primary key of the indexed record')),
+                ('title', models.CharField(max_length=500)),
+                ('subtitle', models.CharField(blank=True, help_text='Secondary text such as author, party or host', max_length=500)),
+                ('body', models.TextField(blank=True, help_text="Plain text of the record's description or content")),
+                ('date', models.DateField(blank=True, help_text='Date used to order equally ranked results', null=True)),
+                ('file_path', models.CharField(blank=True, help_text='Attached document, relative to MEDIA_ROOT', max_length=500)),
+                ('facets', models.JSONField(blank=True, default=dict, encoder=django.core.serializers.json.DjangoJSONEncoder)),
+                ('payload', models.JSONField(default=dict, encoder=django.core.serializers.json.DjangoJSONEncoder, help_text='Serialized search result')),
+                ('search_vector', models.GeneratedField(db_persist=True, expression=django.contrib.postgres.search.CombinedSearchVector(django.contrib.postgres.search.CombinedSearchVector(django.contrib.postgres.search.SearchVector('title', config='english', weight='A'), '||', django.contrib.postgres.search.SearchVector('subtitle', config='english', weight='B'), django.contrib.postgres.search.SearchConfig('english')), '||', django.contrib.postgres.search.SearchVector('body', config='english', weight='C'), django.contrib.postgres.search.SearchConfig('english')), output_field=django.contrib.postgres.search.SearchVectorField())),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Search Document',
+                'verbose_name_plural': 'Search Documents',
+                'ordering': ['doc_type', '-date', 'title'],
+                'indexes': [django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='search_sear_search__b5d516_gin'), models.Index(fields=['file_path'], name='search_sear_file_pa_1d41f0_idx')],
+                'unique_together': {('doc_type', 'object_id')},
+            },
+        ),
+    ]
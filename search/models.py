@@ -0,0 +1,48 @@
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVector, SearchVectorField
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models
+
+
+class SearchDocument(models.Model):
+    """
+    Denormalized search entry for one record of a searchable model.
+
+    Kept in sync by signals (see search.indexing) so global search can rank, count and
+    render every content type from this one table.
+    """
+    doc_type = models.CharField(max_length=50, help_text="Search category, e.g. 'news' or 'mps'")
+    object_id = models.PositiveBigIntegerField(help_text="Primary key of the indexed record")
+    title = models.CharField(max_length=500)
+    subtitle = models.CharField(max_length=500, blank=True, help_text="Secondary text such as author, party or host")
+    body = models.TextField(blank=True, help_text="Plain text of the record's description or content")
+    date = models.DateField(null=True, blank=True, help_text="Date used to order equally ranked results")
+    file_path = models.CharField(max_length=500, blank=True, help_text="Attached document, relative to MEDIA_ROOT")
+    facets = models.JSONField(default=dict, blank=True, encoder=DjangoJSONEncoder)
+    payload = models.JSONField(default=dict, encoder=DjangoJSONEncoder, help_text="Serialized search result")
+    search_vector = models.GeneratedField(
+        expression=(
+            SearchVector('title', weight='A', config='english')
+            + SearchVector('subtitle', weight='B', config='english')
+            + SearchVector('body', weight='C', config='english')
+        ),
+        output_field=SearchVectorField(),
+        db_persist=True,
+    )
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ['doc_type', '-date', 'title']
+        verbose_name = 'Search Document'
+        verbose_name_plural = 'Search Documents'
+        unique_together = ['doc_type', 'object_id']
+        indexes = [
+            GinIndex(fields=['search_vector']),
+            models.Index(fields=['file_path']),
+            # Trigram indexes for autocomplete: word-prefix and typo-tolerant matching
+            GinIndex(fields=['title'], opclasses=['gin_trgm_ops'], name='search_title_trgm'),
+            GinIndex(fields=['subtitle'], opclasses=['gin_trgm_ops'], name='search_subtitle_trgm'),
+        ]
+
+    def __str__(self):
+        return f"{self.doc_type}: {self.title}"
@@ -0,0 +1,175 @@
+import time
+from unittest import mock
+from django.contrib.auth.models import User
+from django.core.cache import caches
+from django.test import SimpleTestCase, TestCase, override_settings
+
+from chatbot.models import DocumentText
+from chatbot.retrieval import index_document_text
+from main.search import DocumentSearchBackend, ModelSearchBackend, autocomplete
+from news.models import News
+from trackers.models import Hansard
+from .models import SearchDocument
+
+
+class SearchTests(TestCase):
+
+    def setUp(self):
+        author = User.objects.create(username='akampala', first_name='Kyagulanyi', last_name='Writer')
+        self.news = News.objects.create(
+            title='Budget passed', content='<p>The national budget was passed.</p>',
+            author=author, status='published'
+        )
+        News.objects.create(title='Budget draft', content='Not yet', status='draft')
+        self.hansard = Hansard.objects.create(name='Sitting of 4 June', file='hansards/sitting.pdf')
+        document = DocumentText.objects.create(
+            relative_path='hansards/sitting.pdf', file_size=1, file_mtime=0,
+            text='Members debated irrigation schemes.', status=DocumentText.STATUS_DONE
+        )
+        index_document_text(document)
+
+    def test_records_are_indexed_on_save(self):
+        self.assertEqual(
+            set(SearchDocument.objects.values_list('doc_type', 'object_id')),
+            {('news', self.news.pk), ('hansards', self.hansard.pk)}
+        )
+
+    def test_document_backend(self):
+        results, counts, incomplete = DocumentSearchBackend().search('budget', 5)
+        self.assertEqual(incomplete, [])
+        self.assertEqual([item['id'] for item in results['news']], [self.news.pk])
+        self.assertEqual(counts['news'], 1)
+        self.assertEqual(counts['hansards'], 0)
+
+    def test_document_backend_matches_file_contents(self):
+        results, counts, incomplete = DocumentSearchBackend().search('irrigation', 5)
+        self.assertEqual([item['id'] for item in results['hansards']], [self.hansard.pk])
+        self.assertEqual(counts['hansards'], 1)
+
+    def test_document_backend_without_counts(self):
+        results, counts, incomplete = DocumentSearchBackend().search('budget', 5, count=False)
+        self.assertIsNone(counts)
+        self.assertEqual(len(results['news']), 1)
+
+    def test_model_backend(self):
+        backend = ModelSearchBackend()
+
+        results, count = backend.search_category('news', 'budget', 5)
+        self.assertEqual(([item['id'] for item in results], count), ([self.news.pk], 1))
+
+        # Author names and file contents are matched through resolved id and path lists
+        results, count = backend.search_category('news', 'kyagu', 5)
+        self.assertEqual(([item['id'] for item in results], count), ([self.news.pk], 1))
+        results, count = backend.search_category('hansards', 'irrigation', 5)
+        self.assertEqual(([item['id'] for item in results], count), ([self.hansard.pk], 1))
+
+    def test_unmatched_file_contents_are_not_searched(self):
+        DocumentText.objects.update(status=DocumentText.STATUS_PROCESSING)
+        self.assertEqual(ModelSearchBackend().search_category('hansards', 'irrigation', 5), ([], 0))
+        self.assertEqual(DocumentSearchBackend().search('irrigation', 5)[1]['hansards'], 0)
+
+    def test_search_endpoint(self):
+        caches['search'].clear()
+        response = self.client.get('/api/search/?q=budget&limit=3')
+
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(data['total_results'], 1)
+        self.assertEqual(data['results']['news'][0]['title'], 'Budget passed')
+        self.assertFalse(data['partial'])
+
+    def test_partial_results_are_not_cached(self):
+        caches['search'].clear()
+        backend = mock.Mock()
+        backend.search.side_effect = [
+            ({'news': [], 'bills': [{'id': 1}]}, {'news': None, 'bills': 1}, ['news']),
+            ({'news': [{'id': 2}], 'bills': [{'id': 1}]}, {'news': 1, 'bills': 1}, []),
+        ]
+
+        with mock.patch('main.views.get_search_backend', return_value=backend):
+            data = self.client.get('/api/search/?q=budget').json()
+            self.assertEqual((data['partial'], data['counts']['news'], data['total_results']), (True, None, 1))
+
+            data = self.client.get('/api/search/?q=budget').json()
+            self.assertEqual((data['partial'], data['total_results']), (False, 2))
+            # The complete result is cached
+            self.assertEqual(self.client.get('/api/search/?q=budget').json(), data)
+        self.assertEqual(backend.search.call_count, 2)
+
+
+class AutocompleteTests(TestCase):
+
+    def setUp(self):
+        caches['search'].clear()
+
+    def suggest(self, query, **params):
+        response = self.client.get('/api/search/autocomplete/', {'q': query, **params})
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def test_word_prefix_matching(self):
+        News.objects.create(title='Budget passed', content='x', status='published')
+        Hansard.objects.create(name='Sitting of 4 June', file='hansards/sitting.pdf')
+
+        self.assertEqual([item['title'] for item in autocomplete('budg', 8)][:1], ['Budget passed'])
+        # Any word of the title, not only the first
+        self.assertEqual([item['title'] for item in autocomplete('jun', 8)][:1], ['Sitting of 4 June'])
+        self.assertEqual(autocomplete('zzzz', 8), [])
+
+    def test_short_queries_get_no_suggestions(self):
+        with mock.patch('main.views.autocomplete') as autocomplete_mock:
+            self.assertEqual(self.suggest(' bu '), {'query': 'bu', 'suggestions': []})
+            self.assertEqual(self.suggest('')['suggestions'], [])
+        autocomplete_mock.assert_not_called()
+
+    def test_limit_is_clamped(self):
+        with mock.patch('main.views.autocomplete', return_value=[]) as autocomplete_mock:
+            for limit, expected in [(None, 8), ('5', 5), ('0', 1), ('-3', 1), ('100', 20), ('many', 8)]:
+                caches['search'].clear()
+                params = {} if limit is None else {'limit': limit}
+                self.suggest('budget', **params)
+                self.assertEqual(autocomplete_mock.call_args.args, ('budget', expected))
+
+    def test_suggestions_are_cached(self):
+        suggestions = [{'type': 'news', 'id': 1, 'title': 'Budget passed', 'subtitle': '', 'slug': 'budget-passed'}]
+        with mock.patch('main.views.autocomplete', return_value=suggestions) as autocomplete_mock:
+            self.assertEqual(self.suggest('Budget')['suggestions'], suggestions)
+            self.assertEqual(self.suggest('budget')['suggestions'], suggestions)
+        autocomplete_mock.assert_called_once()
+
+
+@mock.patch('main.search.resolve_extra_matches', lambda query: {'authors': [], 'files': []})
+class SearchFanOutTests(SimpleTestCase):
+
+    def test_slow_category_does_not_hold_up_the_search(self):
+        backend = ModelSearchBackend()
+
+        def search_category(category, query, limit, count=True, matches=None):
+            if category == 'news':
+                time.sleep(1)
+            return [category], 1
+
+        with mock.patch.object(backend, 'search_category', search_category), \
+                override_settings(SEARCH_TIMEOUT=0.2), self.assertLogs('main.search', 'WARNING'):
+            started = time.monotonic()
+            results, counts, incomplete = backend.search('budget', 5)
+
+        self.assertLess(time.monotonic() - started, 1)
+        self.assertEqual(list(results), list(backend.categories))
+        self.assertEqual((results['news'], counts['news'], incomplete), ([], None, ['news']))
+        self.assertEqual((results['bills'], counts['bills']), (['bills'], 1))
+
+    def test_failing_category(self):
+        backend = ModelSearchBackend()
+
+        def search_category(category, query, limit, count=True, matches=None):
+            if category == 'bills':
+                raise ValueError('bad query')
+            return [category], 1
+
+        with mock.patch.object(backend, 'search_category', search_category), self.assertLogs('main.search', 'WARNING'):
+            results, counts, incomplete = backend.search('budget', 5, count=False)
+
+        self.assertEqual((results['bills'], incomplete), ([], ['bills']))
+        self.assertEqual(results['news'], ['news'])
+        self.assertIsNone(counts)
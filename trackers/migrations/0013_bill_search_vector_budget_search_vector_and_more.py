@@ -0,0 +1,69 @@
+# Generated by Django 6.0 on 2026-10-18 04:42
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('trackers', '0012_committee_begin_date_end_date'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='bill',
+            name='search_vector',
+            field=models.GeneratedField(db_persist=True, expression=django.contrib.postgres.search.CombinedSearchVector(django.contrib.postgres.search.CombinedSearchVector(django.contrib.postgres.search.SearchVector('title', config='english', weight='A'), '||', django.contrib.postgres.search.SearchVector('mover', config='english', weight='B'), django.contrib.postgres.search.SearchConfig('english')), '||', django.contrib.postgres.search.SearchVector('description', config='english', weight='C'), django.contrib.postgres.search.SearchConfig('english')), output_field=django.contrib.postgres.search.SearchVectorField()),
+        ),
+        migrations.AddField(
+            model_name='budget',
+            name='search_vector',
+            field=models.GeneratedField(db_persist=True, expression=django.contrib.postgres.search.CombinedSearchVector(django.contrib.postgres.search.SearchVector('name', config='english', weight='A'), '||', django.contrib.postgres.search.SearchVector('financial_year', config='english', weight='B'), django.contrib.postgres.search.SearchConfig('english')), output_field=django.contrib.postgres.search.SearchVectorField()),
+        ),
+        migrations.AddField(
+            model_name='hansard',
+            name='search_vector',
+            field=models.GeneratedField(db_persist=True, expression=django.contrib.postgres.search.SearchVector('name', config='english', weight='A'), output_field=django.contrib.postgres.search.SearchVectorField()),
+        ),
+        migrations.AddField(
+            model_name='loan',
+            name='search_vector',
+            field=models.GeneratedField(db_persist=True, expression=django.contrib.postgres.search.CombinedSearchVector(django.contrib.postgres.search.CombinedSearchVector(django.contrib.postgres.search.SearchVector('label', config='english', weight='A'), '||', django.contrib.postgres.search.SearchVector('source', config='english', weight='B'), django.contrib.postgres.search.SearchConfig('english')), '||', django.contrib.postgres.search.SearchVector('description', config='english', weight='C'), django.contrib.postgres.search.SearchConfig('english')), output_field=django.contrib.postgres.search.SearchVectorField()),
+        ),
+        migrations.AddField(
+            model_name='mp',
+            name='search_vector',
+            field=models.GeneratedField(db_persist=True, expression=django.contrib.postgres.search.CombinedSearchVector(django.contrib.postgres.search.CombinedSearchVector(django.contrib.postgres.search.CombinedSearchVector(django.contrib.postgres.search.SearchVector('name', config='english', weight='A'), '||', django.contrib.postgres.search.SearchVector('party', config='english', weight='B'), django.contrib.postgres.search.SearchConfig('english')), '||', django.contrib.postgres.search.SearchVector('constituency', config='english', weight='B'), django.contrib.postgres.search.SearchConfig('english')), '||', django.contrib.postgres.search.SearchVector('district', config='english', weight='B'), django.contrib.postgres.search.SearchConfig('english')), output_field=django.contrib.postgres.search.SearchVectorField()),
+        ),
+        migrations.AddField(
+            model_name='orderpaper',
+            name='search_vector',
+            field=models.GeneratedField(db_persist=True, expression=django.contrib.postgres.search.CombinedSearchVector(django.contrib.postgres.search.SearchVector('name', config='english', weight='A'), '||', django.contrib.postgres.search.SearchVector('description', config='english', weight='C'), django.contrib.postgres.search.SearchConfig('english')), output_field=django.contrib.postgres.search.SearchVectorField()),
+        ),
+        migrations.AddIndex(
+            model_name='bill',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='trackers_bi_search__840f16_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='budget',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='trackers_bu_search__613849_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='hansard',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='trackers_ha_search__69a8f6_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='loan',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='trackers_lo_search__7f7fd1_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='mp',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='trackers_mp_search__092e98_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='orderpaper',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='trackers_or_search__0c6475_gin'),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 6.0 on 2026-10-18 04:58
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('trackers', '0013_bill_search_vector_budget_search_vector_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='mp',
+            name='rendered_bio',
+            field=models.TextField(blank=True, editable=False, help_text='Bio with absolute image URLs, rendered on save'),
+        ),
+        migrations.AddField(
+            model_name='mp',
+            name='rendered_media_base',
+            field=models.CharField(blank=True, editable=False, max_length=255),
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 6.0 on 2026-10-18 05:13
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('trackers', '0014_mp_rendered_bio_mp_rendered_media_base'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='budget',
+            name='file',
+            field=models.FileField(db_index=True, help_text='Budget PDF document', upload_to='budgets/'),
+        ),
+        migrations.AlterField(
+            model_name='hansard',
+            name='file',
+            field=models.FileField(db_index=True, upload_to=''),
+        ),
+        migrations.AlterField(
+            model_name='orderpaper',
+            name='file',
+            field=models.FileField(blank=True, db_index=True, null=True, upload_to=''),
+        ),
+    ]
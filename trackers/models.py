@@ -1,5 +1,9 @@
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVector, SearchVectorField
 from django.db import models
 from ckeditor.fields import RichTextField
+from main.managers import SearchableManager
+from main.rendering import RenderedHTMLMixin
 
 
 class Bill(models.Model):
@@ -26,11 +30,23 @@ class Bill(models.Model):
     video_url = models.URLField(blank=True, null=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+    search_vector = models.GeneratedField(
+        expression=(
+            SearchVector('title', weight='A', config='english')
+            + SearchVector('mover', weight='B', config='english')
+            + SearchVector('description', weight='C', config='english')
+        ),
+        output_field=SearchVectorField(),
+        db_persist=True,
+    )
+
+    objects = SearchableManager()
 
     class Meta:
         ordering = ['-created_at']
         verbose_name = 'Bill'
         verbose_name_plural = 'Bills'
+        indexes = [GinIndex(fields=['search_vector'])]
 
     def __str__(self):
         return self.title
@@ -67,7 +83,7 @@ class BillReading(models.Model):
         return f"{self.bill.title} - {self.get_stage_display()}"
 
 
-class MP(models.Model):
+class MP(RenderedHTMLMixin, models.Model):
     """Model for Members of Parliament"""
     # Personal Information
     first_name = models.CharField(max_length=100)
@@ -87,15 +103,32 @@ class MP(models.Model):
     # Additional Information
     photo = models.ImageField(upload_to='mps/', blank=True, null=True)
     bio = RichTextField(blank=True, null=True)
+    rendered_bio = models.TextField(blank=True, editable=False, help_text="Bio with absolute image URLs, rendered on save")
+    rendered_media_base = models.CharField(max_length=255, blank=True, editable=False)
 
     # Timestamps
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+    search_vector = models.GeneratedField(
+        expression=(
+            SearchVector('name', weight='A', config='english')
+            + SearchVector('party', weight='B', config='english')
+            + SearchVector('constituency', weight='B', config='english')
+            + SearchVector('district', weight='B', config='english')
+        ),
+        output_field=SearchVectorField(),
+        db_persist=True,
+    )
+
+    objects = SearchableManager()
+
+    rendered_html_fields = {'bio': 'rendered_bio'}
 
     class Meta:
         ordering = ['last_name', 'first_name']
         verbose_name = 'Member of Parliament'
         verbose_name_plural = 'Members of Parliament'
+        indexes = [GinIndex(fields=['search_vector'])]
 
     def __str__(self):
         return self.name
@@ -229,11 +262,23 @@ class Loan(models.Model):
 
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+    search_vector = models.GeneratedField(
+        expression=(
+            SearchVector('label', weight='A', config='english')
+            + SearchVector('source', weight='B', config='english')
+            + SearchVector('description', weight='C', config='english')
+        ),
+        output_field=SearchVectorField(),
+        db_persist=True,
+    )
+
+    objects = SearchableManager()
 
     class Meta:
         ordering = ['-approval_date', '-created_at']
         verbose_name = 'Loan'
         verbose_name_plural = 'Loans'
+        indexes = [GinIndex(fields=['search_vector'])]
 
     def __str__(self):
         return f"{self.get_sector_display()}: {self.label[:50]}"
@@ -247,14 +292,22 @@ class Hansard(models.Model):
     )
     date = models.DateField(null=True, blank=True, help_text="Date of the Hansard session")
     date_received = models.DateField(null=True, blank=True, help_text="Date the Hansard was received")
-    file = models.FileField()
+    file = models.FileField(db_index=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+    search_vector = models.GeneratedField(
+        expression=SearchVector('name', weight='A', config='english'),
+        output_field=SearchVectorField(),
+        db_persist=True,
+    )
+
+    objects = SearchableManager()
 
     class Meta:
         ordering = ['-date', '-created_at']
         verbose_name = 'Hansard'
         verbose_name_plural = 'Hansards'
+        indexes = [GinIndex(fields=['search_vector'])]
 
     def __str__(self):
         return self.name
@@ -264,7 +317,7 @@ class Budget(models.Model):
     """Model for National Budget Documents"""
     name = models.CharField(max_length=200, help_text="Budget document name", db_index=True)
     financial_year = models.CharField(max_length=20, help_text="Financial year (e.g., 2024/2025)")
-    file = models.FileField(upload_to='budgets/', help_text="Budget PDF document")
+    file = models.FileField(upload_to='budgets/', help_text="Budget PDF document", db_index=True)
     budget_total_amount = models.DecimalField(
         max_digits=20,
         decimal_places=2,
@@ -274,11 +327,22 @@ class Budget(models.Model):
     )
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+    search_vector = models.GeneratedField(
+        expression=(
+            SearchVector('name', weight='A', config='english')
+            + SearchVector('financial_year', weight='B', config='english')
+        ),
+        output_field=SearchVectorField(),
+        db_persist=True,
+    )
+
+    objects = SearchableManager()
 
     class Meta:
         ordering = ['-financial_year', '-created_at']
         verbose_name = 'Budget'
         verbose_name_plural = 'Budgets'
+        indexes = [GinIndex(fields=['search_vector'])]
 
     def __str__(self):
         return f"{self.name} - {self.financial_year}"
@@ -286,15 +350,26 @@ class Budget(models.Model):
 class OrderPaper(models.Model):
     name = models.CharField(max_length=100, db_index=True)
     description = models.TextField(null=True, blank=True)
-    file = models.FileField(null=True, blank=True)
+    file = models.FileField(null=True, blank=True, db_index=True)
     date_received = models.DateField(null=True, blank=True, help_text="Date the order paper was received")
 
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+    search_vector = models.GeneratedField(
+        expression=(
+            SearchVector('name', weight='A', config='english')
+            + SearchVector('description', weight='C', config='english')
+        ),
+        output_field=SearchVectorField(),
+        db_persist=True,
+    )
+
+    objects = SearchableManager()
 
     class Meta:
         verbose_name = 'Order Paper'
         ordering = ['-created_at']
+        indexes = [GinIndex(fields=['search_vector'])]
 
         
 class Committee(models.Model):
@@ -1,14 +1,16 @@
 from rest_framework import serializers
-from main.utils import get_full_media_url, process_content_images
+from main.utils import MediaURLField
+from main.rendering import RenderedHTMLField
+from main.sparse import SparseFieldsMixin
 from .models import Bill, BillReading, MP, DebtData, Loan, Hansard, Budget, OrderPaper, Committee, CommitteeDocument
 
 
-class BillReadingSerializer(serializers.ModelSerializer):
+class BillReadingSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     stage_display = serializers.CharField(source='get_stage_display', read_only=True)
-    document = serializers.SerializerMethodField()
-    committee_report = serializers.SerializerMethodField()
-    analysis = serializers.SerializerMethodField()
-    mp_photo = serializers.SerializerMethodField()
+    document = MediaURLField()
+    committee_report = MediaURLField()
+    analysis = MediaURLField()
+    mp_photo = MediaURLField()
 
     class Meta:
         model = BillReading
@@ -26,28 +28,8 @@ class BillReadingSerializer(serializers.ModelSerializer):
             'updated_at',
         ]
 
-    def get_document(self, obj):
-        if obj.document:
-            return get_full_media_url(obj.document.url)
-        return None
 
-    def get_committee_report(self, obj):
-        if obj.committee_report:
-            return get_full_media_url(obj.committee_report.url)
-        return None
-
-    def get_analysis(self, obj):
-        if obj.analysis:
-            return get_full_media_url(obj.analysis.url)
-        return None
-
-    def get_mp_photo(self, obj):
-        if obj.mp_photo:
-            return get_full_media_url(obj.mp_photo.url)
-        return None
-
-
-class BillSerializer(serializers.ModelSerializer):
+class BillSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     bill_type_display = serializers.CharField(source='get_bill_type_display', read_only=True)
     status_display = serializers.CharField(source='get_status_display', read_only=True)
     readings = BillReadingSerializer(many=True, read_only=True)
@@ -72,7 +54,7 @@ class BillSerializer(serializers.ModelSerializer):
         ]
 
 
-class BillListSerializer(serializers.ModelSerializer):
+class BillListSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     """Simplified serializer for bill listing"""
     bill_type_display = serializers.CharField(source='get_bill_type_display', read_only=True)
     status_display = serializers.CharField(source='get_status_display', read_only=True)
@@ -92,9 +74,9 @@ class BillListSerializer(serializers.ModelSerializer):
         ]
 
 
-class MPListSerializer(serializers.ModelSerializer):
+class MPListSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     """Simplified serializer for MP listing"""
-    photo = serializers.SerializerMethodField()
+    photo = MediaURLField()
 
     class Meta:
         model = MP
@@ -112,16 +94,11 @@ class MPListSerializer(serializers.ModelSerializer):
             'email',
         ]
 
-    def get_photo(self, obj):
-        if obj.photo:
-            return get_full_media_url(obj.photo.url)
-        return None
 
-
-class MPDetailSerializer(serializers.ModelSerializer):
+class MPDetailSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     """Full serializer for MP detail view"""
-    photo = serializers.SerializerMethodField()
-    bio = serializers.SerializerMethodField()
+    photo = MediaURLField()
+    bio = RenderedHTMLField('bio')
 
     class Meta:
         model = MP
@@ -142,20 +119,9 @@ class MPDetailSerializer(serializers.ModelSerializer):
             'updated_at',
         ]
         read_only_fields = ['created_at', 'updated_at']
-    
-    def get_bio(self, obj):
-        """Process bio HTML to convert relative image URLs to absolute URLs"""
-        if obj.bio:
-            return process_content_images(obj.bio)
-        return obj.bio
-
-    def get_photo(self, obj):
-        if obj.photo:
-            return get_full_media_url(obj.photo.url)
-        return None
 
 
-class DebtDataSerializer(serializers.ModelSerializer):
+class DebtDataSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     """Serializer for Debt Data"""
 
     class Meta:
@@ -177,7 +143,7 @@ class DebtDataSerializer(serializers.ModelSerializer):
         read_only_fields = ['created_at', 'updated_at']
 
 
-class LoanSerializer(serializers.ModelSerializer):
+class LoanSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     """Serializer for Loans"""
     sector_display = serializers.CharField(source='get_sector_display', read_only=True)
     currency_display = serializers.CharField(source='get_currency_display', read_only=True)
@@ -203,9 +169,9 @@ class LoanSerializer(serializers.ModelSerializer):
         read_only_fields = ['created_at', 'updated_at']
 
 
-class HansardSerializer(serializers.ModelSerializer):
+class HansardSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     """Serializer for Hansards"""
-    file = serializers.SerializerMethodField()
+    file = MediaURLField()
 
     class Meta:
         model = Hansard
@@ -220,15 +186,10 @@ class HansardSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ['created_at', 'updated_at']
 
-    def get_file(self, obj):
-        if obj.file:
-            return get_full_media_url(obj.file.url)
-        return None
 
-
-class BudgetSerializer(serializers.ModelSerializer):
+class BudgetSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     """Serializer for Budgets"""
-    file = serializers.SerializerMethodField()
+    file = MediaURLField()
 
     class Meta:
         model = Budget
@@ -243,15 +204,10 @@ class BudgetSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ['created_at', 'updated_at']
 
-    def get_file(self, obj):
-        if obj.file:
-            return get_full_media_url(obj.file.url)
-        return None
-
 
-class OrderPaperSerializer(serializers.ModelSerializer):
+class OrderPaperSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     """Serializer for Order Papers"""
-    file = serializers.SerializerMethodField()
+    file = MediaURLField()
 
     class Meta:
         model = OrderPaper
@@ -266,15 +222,10 @@ class OrderPaperSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ['created_at', 'updated_at']
 
-    def get_file(self, obj):
-        if obj.file:
-            return get_full_media_url(obj.file.url)
-        return None
 
-
-class CommitteeDocumentSerializer(serializers.ModelSerializer):
+class CommitteeDocumentSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     """Serializer for Committee Documents"""
-    file = serializers.SerializerMethodField()
+    file = MediaURLField()
 
     class Meta:
         model = CommitteeDocument
@@ -289,13 +240,8 @@ class CommitteeDocumentSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ['created_at', 'updated_at']
 
-    def get_file(self, obj):
-        if obj.file:
-            return get_full_media_url(obj.file.url)
-        return None
-
 
-class CommitteeListSerializer(serializers.ModelSerializer):
+class CommitteeListSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     """Simplified serializer for Committee listing"""
     chairperson_name = serializers.CharField(source='chairperson.name', read_only=True)
     deputy_chairperson_name = serializers.CharField(source='deputy_chairperson.name', read_only=True)
@@ -320,7 +266,7 @@ class CommitteeListSerializer(serializers.ModelSerializer):
         return obj.members.count()
 
 
-class CommitteeDetailSerializer(serializers.ModelSerializer):
+class CommitteeDetailSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     """Full serializer for Committee detail view"""
     chairperson = MPListSerializer(read_only=True)
     deputy_chairperson = MPListSerializer(read_only=True)
@@ -346,21 +292,21 @@ class CommitteeDetailSerializer(serializers.ModelSerializer):
 
 
 # Lightweight serializers for home page summary
-class HomeSummaryMPSerializer(serializers.ModelSerializer):
+class HomeSummaryMPSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     """Minimal serializer for MP home summary"""
     class Meta:
         model = MP
         fields = ['id', 'name', 'party', 'constituency']
 
 
-class HomeSummaryBillSerializer(serializers.ModelSerializer):
+class HomeSummaryBillSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     """Minimal serializer for Bill home summary"""
     class Meta:
         model = Bill
         fields = ['id', 'title']
 
 
-class HomeSummaryLoanSerializer(serializers.ModelSerializer):
+class HomeSummaryLoanSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     """Minimal serializer for Loan home summary"""
     sector_display = serializers.CharField(source='get_sector_display', read_only=True)
     source_display = serializers.CharField(source='get_source_display', read_only=True)
@@ -370,43 +316,28 @@ class HomeSummaryLoanSerializer(serializers.ModelSerializer):
         fields = ['id', 'label', 'sector_display', 'source_display']
 
 
-class HomeSummaryBudgetSerializer(serializers.ModelSerializer):
+class HomeSummaryBudgetSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     """Minimal serializer for Budget home summary"""
-    file = serializers.SerializerMethodField()
+    file = MediaURLField()
     
     class Meta:
         model = Budget
         fields = ['id', 'name', 'financial_year', 'file']
 
-    def get_file(self, obj):
-        if obj.file:
-            return get_full_media_url(obj.file.url)
-        return None
 
-
-class HomeSummaryHansardSerializer(serializers.ModelSerializer):
+class HomeSummaryHansardSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     """Minimal serializer for Hansard home summary"""
-    file = serializers.SerializerMethodField()
+    file = MediaURLField()
     
     class Meta:
         model = Hansard
         fields = ['id', 'name', 'date', 'file']
 
-    def get_file(self, obj):
-        if obj.file:
-            return get_full_media_url(obj.file.url)
-        return None
-
 
-class HomeSummaryOrderPaperSerializer(serializers.ModelSerializer):
+class HomeSummaryOrderPaperSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     """Minimal serializer for OrderPaper home summary"""
-    file = serializers.SerializerMethodField()
+    file = MediaURLField()
     
     class Meta:
         model = OrderPaper
         fields = ['id', 'name', 'file']
-
-    def get_file(self, obj):
-        if obj.file:
-            return get_full_media_url(obj.file.url)
-        return None
\ No newline at end of file
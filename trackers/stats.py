@@ -0,0 +1,127 @@
+"""
+Cached rollups for the tracker summary actions (bill statuses, MP parties and districts,
+loan sources and sectors).
+
+Each rollup is computed in as few grouped queries as possible and cached in the
+'summaries' cache under a key built from the model's statistics version and the
+request's filter parameters, so filtered dashboards are cached too. Saving or deleting
+a bill, MP or loan replaces the version, which makes every cached rollup of that model
+(for any filters) stale at once; it is recomputed on the next request. The versions are
+kept in the database (see main.cache), so this holds for every worker process.
+"""
+import hashlib
+from django.core.cache import caches
+from django.db.models import Count
+from django.db.models.signals import post_delete, post_save
+
+from home.cache import get_summary_timeout
+from main.cache import get_or_build, get_versions, new_versions
+from .models import Bill, MP, Loan
+
+# Query parameters that change pages or ordering but not the aggregates
+IGNORED_PARAMS = {'page', 'page_size', 'ordering', 'format'}
+
+
+def version_name(model):
+    return f'stats:{model._meta.label_lower}'
+
+
+def get_version(model):
+    """Current statistics version of a model"""
+    name = version_name(model)
+    return get_versions([name])[name]
+
+
+def new_version(sender, **kwargs):
+    """post_save/post_delete receiver: invalidate every cached rollup of the model"""
+    # In the saving transaction, so the new version becomes visible with the change
+    new_versions([version_name(sender)])
+
+
+def cached_stats(name, model, request, build, use_filters=True):
+    """
+    Return a rollup from the cache, building it on a miss.
+
+    Args:
+        name: Name of the rollup
+        model: Model the rollup counts
+        request: Request whose query parameters filter the rollup
+        build: Callable returning the rollup
+        use_filters: Whether the rollup depends on the query parameters
+    """
+    params = ''
+    if use_filters:
+        params = '&'.join(
+            f'{key}={value}' for key, value in sorted(request.query_params.lists())
+            if key not in IGNORED_PARAMS
+        )
+    digest = hashlib.md5(params.encode()).hexdigest()
+    key = f'stats:{name}:{get_version(model)}:{digest}'
+    return get_or_build(caches['summaries'], key, build, get_summary_timeout())
+
+
+def bill_status_summary(queryset):
+    """Number of bills per status, plus the total, in one query"""
+    summary = {
+        '1st_reading': 0,
+        '2nd_reading': 0,
+        '3rd_reading': 0,
+        'passed': 0,
+        'assented': 0,
+        'withdrawn': 0,  # Not in model, but included for frontend
+    }
+    total = 0
+    for item in queryset.order_by().values('status').annotate(count=Count('id')):
+        total += item['count']
+        if item['status'] in summary:
+            summary[item['status']] = item['count']
+    summary['total'] = total
+    return summary
+
+
+def mp_summary(queryset):
+    """MP totals and party distribution in two queries"""
+    totals = queryset.order_by().aggregate(
+        total_mps=Count('id'),
+        total_parties=Count('party', distinct=True),
+        total_districts=Count('district', distinct=True),
+    )
+    total_mps = totals['total_mps']
+
+    parties = queryset.order_by().values('party').annotate(count=Count('id')).order_by('-count')
+    party_distribution = [
+        {
+            'party': item['party'],
+            'count': item['count'],
+            'percentage': round((item['count'] / total_mps * 100), 1) if total_mps > 0 else 0
+        }
+        for item in parties
+    ]
+
+    return {**totals, 'party_distribution': party_distribution}
+
+
+def loan_distribution(queryset, field, choices):
+    """
+    Number of loans per value of a choice field, with display names and percentages,
+    in one query
+    """
+    names = dict(choices)
+    groups = list(queryset.order_by().values(field).annotate(count=Count('id')).order_by('-count'))
+    total = sum(item['count'] for item in groups)
+    return [
+        {
+            field: item[field],
+            'name': names.get(item[field], item[field]),
+            'count': item['count'],
+            'percentage': round((item['count'] / total * 100), 1) if total > 0 else 0
+        }
+        for item in groups
+    ]
+
+
+def connect_signals():
+    """Replace the statistics version whenever a bill, MP or loan changes"""
+    for model in (Bill, MP, Loan):
+        post_save.connect(new_version, sender=model, dispatch_uid=f'stats_version_{model._meta.label}')
+        post_delete.connect(new_version, sender=model, dispatch_uid=f'stats_version_delete_{model._meta.label}')
@@ -1,3 +1,131 @@
-from django.test import TestCase
+from django.core.cache import caches
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 
-# Create your tests here.
+from home.tests import locmem_caches
+from .models import MP, Committee
+
+
+def create_mp(name, party='NRM', **kwargs):
+    first_name, last_name = name.split()
+    return MP.objects.create(
+        first_name=first_name, last_name=last_name, name=name, party=party,
+        constituency=f'{last_name} County', district='Mbarara', **kwargs
+    )
+
+
+class SparseFieldsetTests(TestCase):
+
+    def setUp(self):
+        self.chair = create_mp('Alice Chair', email='alice@example.com', bio='<p>Bio</p>')
+        self.member = create_mp('Bob Member')
+        self.committee = Committee.objects.create(title='Budget Committee', chairperson=self.chair)
+        self.committee.members.add(self.chair, self.member)
+
+    def get(self, url):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return response.json(), [query['sql'] for query in queries.captured_queries]
+
+    def test_list_fields(self):
+        data, queries = self.get('/api/trackers/mps/?fields=id,name,unknown')
+
+        self.assertEqual(data['results'][0], {'id': self.chair.pk, 'name': 'Alice Chair'})
+        self.assertNotIn('email', queries[-1])
+
+    def test_list_omit(self):
+        data, _queries = self.get('/api/trackers/mps/?omit=email,phone_no')
+
+        self.assertNotIn('email', data['results'][0])
+        self.assertNotIn('phone_no', data['results'][0])
+        self.assertIn('constituency', data['results'][0])
+
+    def test_detail_fields(self):
+        data, queries = self.get(f'/api/trackers/mps/{self.chair.pk}/?fields=name,bio')
+
+        self.assertEqual(data, {'name': 'Alice Chair', 'bio': '<p>Bio</p>'})
+        self.assertNotIn('"email"', queries[-1])
+
+    def test_nested_fields(self):
+        url = f'/api/trackers/committees/{self.committee.pk}/?fields=title,members.id,members.name'
+        data, queries = self.get(url)
+
+        self.assertEqual(data, {
+            'title': 'Budget Committee',
+            'members': [{'id': self.chair.pk, 'name': 'Alice Chair'}, {'id': self.member.pk, 'name': 'Bob Member'}],
+        })
+        committee_sql = next(sql for sql in queries if sql.startswith('SELECT "trackers_committee"."id"'))
+        self.assertNotIn('JOIN', committee_sql)
+        self.assertNotIn('description', committee_sql)
+        # ETag validators (committee, MP, document), then the committee and its members:
+        # no chairperson join and no documents prefetch
+        self.assertEqual(len(queries), 5)
+
+    def test_nested_omit(self):
+        data, _queries = self.get(f'/api/trackers/committees/{self.committee.pk}/?omit=members.email,documents')
+
+        self.assertNotIn('documents', data)
+        self.assertEqual(data['chairperson']['email'], 'alice@example.com')
+        self.assertNotIn('email', data['members'][0])
+
+    def test_writes_ignore_the_fieldset(self):
+        response = self.client.post('/api/trackers/mps/?fields=id', {
+            'first_name': 'Carol', 'last_name': 'New', 'name': 'Carol New',
+            'party': 'NUP', 'constituency': 'New County', 'district': 'Gulu',
+        }, content_type='application/json')
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.json()['name'], 'Carol New')
+
+
+class StatsTests(TestCase):
+
+    def setUp(self):
+        caches['summaries'].clear()
+        with self.captureOnCommitCallbacks(execute=True):
+            create_mp('Alice Chair')
+            create_mp('Bob Member')
+            create_mp('Carol Other', party='NUP')
+
+    def summary(self, query=''):
+        response = self.client.get(f'/api/trackers/mps/summary/{query}')
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def test_mp_summary(self):
+        self.assertEqual(self.summary(), {
+            'total_mps': 3,
+            'total_parties': 2,
+            'total_districts': 1,
+            'party_distribution': [
+                {'party': 'NRM', 'count': 2, 'percentage': 66.7},
+                {'party': 'NUP', 'count': 1, 'percentage': 33.3},
+            ],
+        })
+
+    def test_filtered_summaries_are_cached_separately(self):
+        self.assertEqual(self.summary()['total_mps'], 3)
+        self.assertEqual(self.summary('?party=NUP')['total_mps'], 1)
+        # Paging does not change the rollup; only the statistics version is read
+        with self.assertNumQueries(1):
+            self.assertEqual(self.summary('?party=NUP&page=2')['total_mps'], 1)
+
+    def test_changes_replace_the_version(self):
+        self.assertEqual(self.summary()['total_mps'], 3)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            mp = create_mp('Dan Late', party='NUP')
+        self.assertEqual(self.summary()['total_mps'], 4)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            mp.delete()
+        self.assertEqual(self.summary()['total_mps'], 3)
+
+    def test_change_saved_by_another_process(self):
+        self.assertEqual(self.summary()['total_mps'], 3)
+
+        with override_settings(CACHES=locmem_caches(max_entries=100, process='other')):
+            create_mp('Dan Late', party='NUP')
+        self.assertEqual(self.summary()['total_mps'], 4)
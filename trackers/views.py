@@ -5,10 +5,10 @@ from rest_framework.pagination import PageNumberPagination
 from rest_framework.views import APIView
 from rest_framework.permissions import AllowAny
 from django_filters.rest_framework import DjangoFilterBackend
-from django.db.models import Count, Q
-from django.views.decorators.cache import cache_page
-from django.utils.decorators import method_decorator
-from django.core.cache import cache
+from django.db.models import Q
+from main.mixins import ConditionalGetMixin, ValuesListMixin, SparseQuerysetMixin
+from home.cache import get_summary, summary_response
+from .stats import cached_stats, bill_status_summary, mp_summary, loan_distribution
 from .models import Bill, BillReading, MP, DebtData, Loan, Hansard, Budget, OrderPaper, Committee, CommitteeDocument
 from .serializers import (
     BillSerializer, BillListSerializer, BillReadingSerializer, MPListSerializer, MPDetailSerializer,
@@ -19,11 +19,12 @@ from .serializers import (
 )
 
 
-class BillViewSet(viewsets.ModelViewSet):
+class BillViewSet(ConditionalGetMixin, ValuesListMixin, SparseQuerysetMixin, viewsets.ModelViewSet):
     """
     ViewSet for viewing and editing bills.
     """
     queryset = Bill.objects.all()
+    conditional_dependencies = [BillReading]  # Nested in the detail response
     filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
     filterset_fields = ['bill_type', 'status', 'year_introduced']
     search_fields = ['title', 'mover', 'assigned_to']
@@ -38,34 +39,15 @@ class BillViewSet(viewsets.ModelViewSet):
     @action(detail=False, methods=['get'])
     def summary(self, request):
         """Get summary statistics for bills by status"""
-        queryset = self.get_queryset()
-        
-        # Count bills by status
-        status_counts = queryset.values('status').annotate(count=Count('id'))
-        
-        # Create a dictionary with all statuses, defaulting to 0
-        summary = {
-            '1st_reading': 0,
-            '2nd_reading': 0,
-            '3rd_reading': 0,
-            'passed': 0,
-            'assented': 0,
-            'withdrawn': 0,  # Not in model, but included for frontend
-        }
-        
-        # Update with actual counts
-        for item in status_counts:
-            status = item['status']
-            if status in summary:
-                summary[status] = item['count']
-        
-        # Also include total count
-        summary['total'] = queryset.count()
-        
+        summary = cached_stats(
+            'bill_status', Bill, request,
+            lambda: bill_status_summary(self.get_queryset()),
+            use_filters=False,
+        )
         return Response(summary)
 
 
-class BillReadingViewSet(viewsets.ModelViewSet):
+class BillReadingViewSet(SparseQuerysetMixin, viewsets.ModelViewSet):
     """
     ViewSet for viewing and editing bill readings.
     """
@@ -81,7 +63,7 @@ class MPPagination(PageNumberPagination):
     max_page_size = 100
 
 
-class MPViewSet(viewsets.ModelViewSet):
+class MPViewSet(ConditionalGetMixin, ValuesListMixin, SparseQuerysetMixin, viewsets.ModelViewSet):
     """
     ViewSet for Members of Parliament
 
@@ -132,35 +114,14 @@ class MPViewSet(viewsets.ModelViewSet):
     @action(detail=False, methods=['get'])
     def summary(self, request):
         """Get summary statistics for MPs"""
-        queryset = self.filter_queryset(self.get_queryset())
-
-        total_mps = queryset.count()
-        total_parties = queryset.values('party').distinct().count()
-        total_districts = queryset.values('district').distinct().count()
-
-        # Get party distribution
-        parties = queryset.values('party').annotate(
-            count=Count('id')
-        ).order_by('-count')
-
-        # Calculate percentages
-        party_distribution = []
-        for item in parties:
-            party_distribution.append({
-                'party': item['party'],
-                'count': item['count'],
-                'percentage': round((item['count'] / total_mps * 100), 1) if total_mps > 0 else 0
-            })
-
-        return Response({
-            'total_mps': total_mps,
-            'total_parties': total_parties,
-            'total_districts': total_districts,
-            'party_distribution': party_distribution
-        })
-
-
-class DebtDataViewSet(viewsets.ModelViewSet):
+        summary = cached_stats(
+            'mp', MP, request,
+            lambda: mp_summary(self.filter_queryset(self.get_queryset())),
+        )
+        return Response(summary)
+
+
+class DebtDataViewSet(SparseQuerysetMixin, viewsets.ModelViewSet):
     """
     ViewSet for National Debt and Economic Data
 
@@ -189,7 +150,7 @@ class LoanPagination(PageNumberPagination):
     max_page_size = 100
 
 
-class LoanViewSet(viewsets.ModelViewSet):
+class LoanViewSet(ConditionalGetMixin, ValuesListMixin, SparseQuerysetMixin, viewsets.ModelViewSet):
     """
     ViewSet for Government Loans
 
@@ -208,24 +169,19 @@ class LoanViewSet(viewsets.ModelViewSet):
     def sources_summary(self, request):
         """Get loan sources summary for pie chart"""
         # Use the same filtering as the main queryset to respect search/filters
-        queryset = self.filter_queryset(self.get_queryset())
-        
-        sources = queryset.values('source').annotate(
-            count=Count('id')
-        ).order_by('-count')
-
-        # Calculate percentages
-        total = sum(item['count'] for item in sources)
-        summary = []
-        for item in sources:
-            source_obj = queryset.filter(source=item['source']).first()
-            summary.append({
-                'source': item['source'],
-                'name': source_obj.get_source_display() if source_obj else item['source'],
-                'count': item['count'],
-                'percentage': round((item['count'] / total * 100), 1) if total > 0 else 0
-            })
+        summary = cached_stats(
+            'loan_sources', Loan, request,
+            lambda: loan_distribution(self.filter_queryset(self.get_queryset()), 'source', Loan.SOURCE_CHOICES),
+        )
+        return Response(summary)
 
+    @action(detail=False, methods=['get'])
+    def sectors_summary(self, request):
+        """Get loan sectors summary for charts"""
+        summary = cached_stats(
+            'loan_sectors', Loan, request,
+            lambda: loan_distribution(self.filter_queryset(self.get_queryset()), 'sector', Loan.SECTOR_CHOICES),
+        )
         return Response(summary)
 
 
@@ -235,7 +191,7 @@ class HansardPagination(PageNumberPagination):
     max_page_size = 100
 
 
-class HansardViewSet(viewsets.ModelViewSet):
+class HansardViewSet(ConditionalGetMixin, ValuesListMixin, SparseQuerysetMixin, viewsets.ModelViewSet):
     """
     ViewSet for Hansards
 
@@ -257,7 +213,7 @@ class BudgetPagination(PageNumberPagination):
     max_page_size = 100
 
 
-class BudgetViewSet(viewsets.ModelViewSet):
+class BudgetViewSet(ConditionalGetMixin, SparseQuerysetMixin, viewsets.ModelViewSet):
     """
     ViewSet for Budgets
 
@@ -277,7 +233,7 @@ class OrderPaperPagination(PageNumberPagination):
     max_page_size = 100
 
 
-class OrderPaperViewSet(viewsets.ModelViewSet):
+class OrderPaperViewSet(ConditionalGetMixin, SparseQuerysetMixin, viewsets.ModelViewSet):
     """
     ViewSet for Order Papers
 
@@ -298,13 +254,14 @@ class CommitteePagination(PageNumberPagination):
     max_page_size = 100
 
 
-class CommitteeViewSet(viewsets.ModelViewSet):
+class CommitteeViewSet(ConditionalGetMixin, SparseQuerysetMixin, viewsets.ModelViewSet):
     """
     ViewSet for Parliamentary Committees
 
     Provides committee information including chairperson, deputy, members, and documents
     """
     queryset = Committee.objects.select_related('chairperson', 'deputy_chairperson').prefetch_related('members', 'documents')
+    conditional_dependencies = [MP, CommitteeDocument]  # Nested in the detail response
     pagination_class = CommitteePagination
     filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
     search_fields = ['title', 'description', 'chairperson__name', 'deputy_chairperson__name']
@@ -323,18 +280,14 @@ class HomeSummaryView(APIView):
     """
     Optimized endpoint for home page trackers summary.
     Returns latest 5 items from each tracker in a single response.
-    Cached for 10 minutes to improve performance.
+    Cached until the data it shows changes (see home.cache).
     """
     permission_classes = [AllowAny]
 
-    @method_decorator(cache_page(600))  # Cache for 10 minutes
     def get(self, request):
-        cache_key = 'home_trackers_summary'
-        cached_data = cache.get(cache_key)
-        
-        if cached_data is not None:
-            return Response(cached_data)
-        
+        return summary_response(request, get_summary('home_trackers_summary', self.build_summary))
+
+    def build_summary(self):
         # Fetch latest 5 items from each tracker with optimized queries
         # Using only() to fetch only needed fields
         mps = MP.objects.only('id', 'name', 'party', 'constituency').order_by('-created_at')[:5]
@@ -344,8 +297,7 @@ class HomeSummaryView(APIView):
         hansards = Hansard.objects.only('id', 'name', 'date', 'file').order_by('-created_at')[:5]
         order_papers = OrderPaper.objects.only('id', 'name', 'file').order_by('-created_at')[:5]
         
-        # Serialize data
-        data = {
+        return {
             'mps': HomeSummaryMPSerializer(mps, many=True).data,
             'bills': HomeSummaryBillSerializer(bills, many=True).data,
             'loans': HomeSummaryLoanSerializer(loans, many=True).data,
@@ -353,8 +305,3 @@ class HomeSummaryView(APIView):
             'hansards': HomeSummaryHansardSerializer(hansards, many=True).data,
             'order_papers': HomeSummaryOrderPaperSerializer(order_papers, many=True).data,
         }
-        
-        # Cache the response
-        cache.set(cache_key, data, 600)  # Cache for 10 minutes
-        
-        return Response(data)
\ No newline at end of file